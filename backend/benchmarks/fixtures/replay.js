@@ -0,0 +1,110 @@
+// Client-side behaviour of the replay fixtures: job list paging, job selection and a
+// multi-page Easy Apply dialog. Every step makes a small request so network-idle waits
+// have something realistic to wait for.
+
+let shownJobs = 0;
+let selectedJobId = null;
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+function renderMoreJobs() {
+    const list = document.getElementById('job-list');
+    const { jobs, pageSize } = window.REPLAY;
+    for (const job of jobs.slice(shownJobs, shownJobs + pageSize)) {
+        const item = document.createElement('li');
+        item.innerHTML = `
+            <div class="job-card-container" data-job-id="${job.id}">
+                <strong class="job-card-list__title">${escapeHtml(job.title)}</strong>
+                <div class="job-card-container__company-name">${escapeHtml(job.company)}</div>
+                <ul><li class="job-card-container__metadata-item">${escapeHtml(job.location)}</li></ul>
+                <ul><li class="job-card-container__footer-item">${job.easyApply ? 'Easy Apply' : 'Apply on company website'}</li></ul>
+            </div>`;
+        item.firstElementChild.addEventListener('click', () => selectJob(job));
+        list.appendChild(item);
+    }
+    shownJobs = Math.min(jobs.length, shownJobs + pageSize);
+    document.querySelector('.infinite-scroller__show-more-button').style.display =
+        shownJobs < jobs.length ? '' : 'none';
+}
+
+function selectJob(job) {
+    selectedJobId = job.id;
+    fetch(`/api/job/${job.id}`);
+    document.getElementById('job-details-title').textContent = job.title;
+    document.querySelector('.jobs-apply-button').textContent = job.easyApply ? 'Easy Apply' : 'Apply';
+}
+
+function renderControl(control, index) {
+    const id = `field-${index}`;
+    if (control.kind === 'text') {
+        return `<div class="fb-text"><label for="${id}">${escapeHtml(control.label)}</label><input type="text" id="${id}" name="${id}"></div>`;
+    }
+    if (control.kind === 'file') {
+        return `<div class="fb-file"><label for="${id}">${escapeHtml(control.label)}</label><input type="file" id="${id}"></div>`;
+    }
+    if (control.kind === 'radio') {
+        const options = control.options.map((option, i) =>
+            `<input type="radio" id="${id}-${i}" name="${id}" value="${escapeHtml(option)}"><label for="${id}-${i}">${escapeHtml(option)}</label>`
+        ).join('');
+        return `<fieldset data-test-form-builder-radio-button-form-component="true"><legend><span>${escapeHtml(control.label)}</span></legend>${options}</fieldset>`;
+    }
+    if (control.kind === 'select') {
+        const options = ['Select an option'].concat(control.options)
+            .map(option => `<option>${escapeHtml(option)}</option>`).join('');
+        return `<div data-test-text-entity-list-form-component="true"><label for="${id}">${escapeHtml(control.label)}</label><select id="${id}">${options}</select></div>`;
+    }
+    return '';
+}
+
+function openEasyApply() {
+    const modal = document.createElement('div');
+    modal.className = 'jobs-easy-apply-modal';
+    modal.setAttribute('role', 'dialog');
+    modal.innerHTML = '<div class="jobs-easy-apply-content"></div><footer><button type="button" class="form-action"></button></footer>';
+    document.body.appendChild(modal);
+
+    let page = 0;
+    const pages = window.REPLAY.formPages;
+    const render = () => {
+        modal.querySelector('.jobs-easy-apply-content').innerHTML =
+            `<h3>Page ${page + 1} of ${pages.length}</h3>` +
+            pages[page].map((control, i) => renderControl(control, `${page}-${i}`)).join('');
+        modal.querySelector('.form-action').textContent =
+            page === pages.length - 1 ? 'Submit application' : page === pages.length - 2 ? 'Review' : 'Next';
+    };
+    modal.querySelector('.form-action').addEventListener('click', async () => {
+        if (page < pages.length - 1) {
+            await fetch(`/api/form-page?page=${page + 1}`);
+            page += 1;
+            render();
+            return;
+        }
+        await fetch('/api/apply', {method: 'POST', body: String(selectedJobId)});
+        modal.remove();
+        showConfirmation();
+    });
+    render();
+}
+
+function showConfirmation() {
+    const dialog = document.createElement('div');
+    dialog.className = 'artdeco-modal';
+    dialog.innerHTML = '<p>Your application was sent</p><button type="button" class="artdeco-modal__dismiss"><span>Dismiss</span></button>';
+    dialog.querySelector('button').addEventListener('click', () => dialog.remove());
+    document.body.appendChild(dialog);
+}
+
+function replaySearchPage() {
+    renderMoreJobs();
+    document.querySelector('.infinite-scroller__show-more-button').addEventListener('click', renderMoreJobs);
+    document.querySelector('.jobs-apply-button').addEventListener('click', openEasyApply);
+}
+
+function replayJobPage() {
+    selectedJobId = window.REPLAY.jobId;
+    document.querySelector('.jobs-apply-button').addEventListener('click', openEasyApply);
+}
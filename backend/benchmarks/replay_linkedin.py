@@ -0,0 +1,357 @@
+# replay_linkedin.py
+"""Offline benchmark for the LinkedIn automator
+
+Serves synthetic LinkedIn pages and a stub OpenAI endpoint from a local HTTP
+server, runs LinkedInAutomator.apply_to_jobs against them in headless Chrome,
+and prints JSON with seconds per application, WebDriver commands per form page,
+LLM calls and tokens per application, and peak RSS.
+
+Run from the backend directory:
+
+    python -m benchmarks.replay_linkedin --jobs 40 --applications 10 --output bench.json
+
+Needs Chrome and a matching chromedriver on PATH (or --chromedriver), nothing else.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import zipfile
+import argparse
+import tempfile
+import threading
+import statistics
+import subprocess
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.replay_server import ReplayServer
+
+BENCH_PROFILE = {
+    "full_name": "Alex Replay",
+    "phone": "+44 7700 900123",
+    "dob": "1990-01-01",
+    "job_title_preference": "Software Engineer",
+    "experience_years": 6,
+    "salary_range": "70000-90000",
+    "skills": "Python, Django, PostgreSQL, AWS, Docker",
+    "linkedin_url": "https://www.linkedin.com/in/alex-replay",
+    "github_url": "https://github.com/alex-replay",
+    "linkedin_email": "alex@example.com",
+    "linkedin_password": "replay-password",
+    "answer_overrides": "city = London\nnotice period = 30",
+}
+
+BENCH_CV = [
+    "Alex Replay",
+    "alex@example.com | London",
+    "SUMMARY",
+    "Backend engineer with six years of experience building Python web services.",
+    "EXPERIENCE",
+    "Acme Corp - Senior Software Engineer, 2020-2024",
+    "Built Django REST APIs and PostgreSQL data pipelines; led a team of four.",
+    "Globex - Software Engineer, 2018-2020",
+    "Ran Docker and Kubernetes deployments on AWS; owned CI/CD with GitHub Actions.",
+    "EDUCATION",
+    "BSc Computer Science, University of Leeds, 2018",
+    "SKILLS",
+    "Python, Django, FastAPI, PostgreSQL, Redis, AWS, Docker, Kubernetes",
+    "LANGUAGES",
+    "English (native), French (professional)",
+]
+
+
+def write_docx(path: str, paragraphs: List[str]):
+    """Minimal DOCX with one paragraph per line, enough for the resume text extractor"""
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ))
+        docx.writestr("word/document.xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>"
+        ))
+
+
+class RSSSampler:
+    """Samples the resident memory of this process plus all descendants (Chrome, chromedriver)"""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _tree_rss(self) -> int:
+        children: Dict[int, List[int]] = {}
+        rss: Dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The command name may contain spaces, so split after its closing parenthesis
+                    fields = f.read().rsplit(")", 1)[1].split()
+                with open(f"/proc/{entry}/statm") as f:
+                    rss[int(entry)] = int(f.read().split()[1]) * self._page_size
+                children.setdefault(int(fields[1]), []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+
+        total, stack = 0, [os.getpid()]
+        while stack:
+            pid = stack.pop()
+            total += rss.get(pid, 0)
+            stack.extend(children.get(pid, []))
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._tree_rss())
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        return self.peak
+
+
+class CommandCounter:
+    """Counts WebDriver round trips by wrapping driver.execute, which every element call goes through"""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def attach(self, driver):
+        execute = driver.execute
+
+        def counted(driver_command, params=None):
+            with self._lock:
+                self.counts[driver_command] += 1
+            return execute(driver_command, params)
+
+        driver.execute = counted
+        return driver
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def build_driver(args):
+    """Plain headless Chrome by default; --driver uc uses the app's undetected_chromedriver setup"""
+    if args.driver == "uc":
+        from services.driver_pool import create_driver
+        return create_driver(headless=True, mode=args.browser_mode)
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1366,900")
+    if args.chrome_binary:
+        options.binary_location = args.chrome_binary
+    service = Service(executable_path=args.chromedriver) if args.chromedriver else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+class BenchDriverSource:
+    """Hands extra counted browsers to parallel mode and quits them at the end"""
+
+    def __init__(self, args, counter: CommandCounter):
+        self.args = args
+        self.counter = counter
+        self.drivers = []
+
+    def acquire_spare(self):
+        driver = self.counter.attach(build_driver(self.args))
+        self.drivers.append(driver)
+        return driver
+
+    def release(self, driver):
+        pass
+
+    def close(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_once(args, server: ReplayServer, work_root: str, run_index: int) -> Dict[str, Any]:
+    from platforms.linkedin import LinkedInAutomator
+
+    # A fresh user per run keeps the answer cache, job index and cookies cold
+    username = f"replay-{run_index}"
+    user_dir = os.path.join(work_root, "users", username)
+    os.makedirs(user_dir, exist_ok=True)
+    resume_path = os.path.join(user_dir, "resume.docx")
+    write_docx(resume_path, BENCH_CV)
+
+    llm_before = (server.llm.calls, server.llm.prompt_tokens, server.llm.completion_tokens)
+    applications_before = len(server.applications)
+    counter = CommandCounter()
+    source = BenchDriverSource(args, counter)
+    sampler = RSSSampler().start()
+    form_pages = 0
+
+    async def status_callback(message):
+        nonlocal form_pages
+        if message.startswith("Filling out application form"):
+            form_pages += 1
+
+    driver = counter.attach(build_driver(args))
+    try:
+        automator = LinkedInAutomator(
+            username=username,
+            resume_path=resume_path,
+            profile_data=dict(BENCH_PROFILE),
+            linkedin_credentials={"email": BENCH_PROFILE["linkedin_email"], "password": BENCH_PROFILE["linkedin_password"]},
+            headless=True,
+            openai_api_key="replay",
+            driver=driver,
+            pacing_profile=args.pacing,
+            driver_source=source,
+        )
+        loop = asyncio.new_event_loop()
+        started = time.monotonic()
+        results = loop.run_until_complete(automator.apply_to_jobs(
+            job_title="Software Engineer",
+            location="London",
+            limit=args.applications,
+            status_callback=status_callback,
+            parallel_sessions=args.parallel
+        ))
+        elapsed = time.monotonic() - started
+        loop.close()
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        source.close()
+        peak_rss = sampler.stop()
+
+    applied = len(results["jobs"])
+    llm_calls = server.llm.calls - llm_before[0]
+    prompt_tokens = server.llm.prompt_tokens - llm_before[1]
+    completion_tokens = server.llm.completion_tokens - llm_before[2]
+    per_application = lambda value: round(value / applied, 3) if applied else None
+
+    return {
+        "seconds": round(elapsed, 3),
+        "applications": applied,
+        "applications_received": len(server.applications) - applications_before,
+        "seconds_per_application": per_application(elapsed),
+        "form_pages": form_pages,
+        "webdriver_commands": counter.total,
+        "webdriver_commands_per_form_page": round(counter.total / form_pages, 1) if form_pages else None,
+        "webdriver_commands_by_type": dict(counter.counts.most_common(15)),
+        "llm_calls": llm_calls,
+        "llm_calls_per_application": per_application(llm_calls),
+        "prompt_tokens": prompt_tokens,
+        "prompt_tokens_per_application": per_application(prompt_tokens),
+        "completion_tokens": completion_tokens,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1),
+        "quick_answers": results.get("quickAnswers"),
+        "timing": results.get("timing"),
+        "browser_requests": results.get("requests"),
+    }
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of every numeric metric across runs"""
+    summary = {}
+    for key, value in runs[0].items():
+        values = [run[key] for run in runs if isinstance(run.get(key), (int, float))]
+        if isinstance(value, (int, float)) and values:
+            summary[key] = round(statistics.median(values), 3)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline replay benchmark for the LinkedIn automator")
+    parser.add_argument("--jobs", type=int, default=30, help="Job cards in the search results")
+    parser.add_argument("--page-size", type=int, default=25, help="Cards shown before 'Show more jobs'")
+    parser.add_argument("--applications", type=int, default=5, help="applications_limit for each run")
+    parser.add_argument("--form-pages", type=int, default=3, help="Easy Apply pages per application (min 2)")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds the stub LLM takes per call")
+    parser.add_argument("--pacing", default="fast", help="Pacing profile passed to the automator")
+    parser.add_argument("--parallel", type=int, default=1, help="parallel_sessions passed to apply_to_jobs")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs to take the median over")
+    parser.add_argument("--driver", choices=["chrome", "uc"], default="chrome")
+    parser.add_argument("--browser-mode", choices=["window", "headless", "lite"], default="lite",
+                        help="BROWSER_MODE used with --driver uc")
+    parser.add_argument("--chromedriver", help="Path to chromedriver (default: PATH / Selenium Manager)")
+    parser.add_argument("--chrome-binary", help="Path to the Chrome/Chromium binary")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    # Paths given by the caller are relative to where they ran us, not the scratch tree we move into
+    for name in ("output", "chromedriver", "chrome_binary"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    server = ReplayServer(args.jobs, args.page_size, max(2, args.form_pages), args.llm_latency).start()
+
+    # The automator resolves users/ and data/ relative to its working directory, so run from a
+    # scratch tree; module-level settings are read at import, so the environment is set first
+    work_root = tempfile.mkdtemp(prefix="replay-bench-")
+    os.makedirs(os.path.join(work_root, "backend"))
+    os.environ["LINKEDIN_BASE_URL"] = server.base_url
+    os.environ["OPENAI_BASE_URL"] = f"{server.base_url}/v1"
+    os.environ["OPENAI_API_KEY"] = "replay"
+    os.environ["DATABASE_PATH"] = os.path.join(work_root, "data", "replay.db")
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    os.chdir(os.path.join(work_root, "backend"))
+
+    try:
+        runs = [run_once(args, server, work_root, index) for index in range(args.repeat)]
+    finally:
+        server.stop()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": vars(args),
+        "runs": runs,
+        "median": summarize(runs),
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
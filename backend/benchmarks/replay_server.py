@@ -0,0 +1,272 @@
+# replay_server.py
+import os
+import re
+import ast
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+SESSION_COOKIE = "li_at"
+
+JOB_TITLES = [
+    "Software Engineer", "Backend Engineer (Python)", "Senior Software Engineer", "Python Developer",
+    "Full Stack Engineer", "Data Engineer", "Junior Web Developer", "DevOps Engineer",
+    "Registered Nurse", "Sales Account Executive", "Machine Learning Engineer", "Site Reliability Engineer"
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Vandelay"]
+LOCATIONS = ["London", "Manchester", "Remote", "Leeds", "Bristol"]
+
+# Question pool for the screening pages; the first page is always contact details plus a resume upload
+CONTACT_PAGE = [
+    {"kind": "text", "label": "First name"},
+    {"kind": "text", "label": "Mobile phone number"},
+    {"kind": "text", "label": "Email address"},
+    {"kind": "file", "label": "Upload resume"},
+]
+SCREENING_QUESTIONS = [
+    {"kind": "text", "label": "How many years of experience do you have with Python?"},
+    {"kind": "radio", "label": "Are you legally authorized to work in the United Kingdom?", "options": ["Yes", "No"]},
+    {"kind": "select", "label": "What is your level of proficiency in English?",
+     "options": ["Native or bilingual", "Professional", "Conversational", "None"]},
+    {"kind": "text", "label": "What is your expected salary?"},
+    {"kind": "radio", "label": "Will you now or in the future require sponsorship?", "options": ["Yes", "No"]},
+    {"kind": "text", "label": "How many years of experience do you have with Django?"},
+    {"kind": "select", "label": "Highest level of education completed",
+     "options": ["High school", "Bachelor's Degree", "Master's Degree", "Doctorate"]},
+    {"kind": "radio", "label": "Are you comfortable working in a hybrid setting?", "options": ["Yes", "No"]},
+    {"kind": "text", "label": "Describe a project you are proud of"},
+]
+QUESTIONS_PER_PAGE = 4
+
+
+def build_jobs(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Deterministic synthetic job listings; about one in six is not Easy Apply"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(3900000000 + index),
+            "title": rng.choice(JOB_TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "easyApply": rng.random() > 1 / 6,
+        }
+        for index in range(count)
+    ]
+
+
+def build_form_pages(count: int) -> List[List[Dict[str, Any]]]:
+    """Contact page, then screening pages cycling through the question pool, then an empty review page"""
+    pages = [CONTACT_PAGE]
+    position = 0
+    for _ in range(max(0, count - 2)):
+        page = []
+        for _ in range(QUESTIONS_PER_PAGE):
+            page.append(SCREENING_QUESTIONS[position % len(SCREENING_QUESTIONS)])
+            position += 1
+        pages.append(page)
+    pages.append([])
+    return pages
+
+
+class LLMStub:
+    """Answers chat completions the way the automator's prompts expect, and counts usage"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+
+    def answer(self, prompt: str) -> str:
+        if "JSON ANSWERS" in prompt:
+            answers = {}
+            for line in prompt.splitlines():
+                match = re.search(r'id: "(q\d+)"', line)
+                if not match:
+                    continue
+                options = re.search(r"\| options: (\[.*\])", line)
+                answers[match.group(1)] = json.loads(options.group(1))[0] if options else "3"
+            return json.dumps(answers)
+
+        options_match = re.search(r"### \*\*OPTIONS:\*\*\s*\n\s*(.+)", prompt)
+        if options_match:
+            try:
+                options = ast.literal_eval(options_match.group(1).strip())
+                if options:
+                    return str(options[0])
+            except (ValueError, SyntaxError):
+                pass
+        return "3"
+
+    def complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = "\n".join(message.get("content", "") for message in body.get("messages", []))
+        content = self.answer(prompt)
+        prompt_tokens = (len(prompt) + 3) // 4
+        completion_tokens = (len(content) + 3) // 4
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+        return {
+            "id": f"chatcmpl-replay-{self.calls}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "replay"),
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+class ReplayServer:
+    """Local stand-in for LinkedIn (login, job search, job pages, Easy Apply) and the OpenAI API"""
+
+    def __init__(self, job_count: int = 30, page_size: int = 25, form_pages: int = 3, llm_latency: float = 0.2):
+        self.jobs = build_jobs(job_count)
+        self.jobs_by_id = {job["id"]: job for job in self.jobs}
+        self.page_size = page_size
+        self.form_pages = build_form_pages(form_pages)
+        self.llm = LLMStub(llm_latency)
+        self.applications: List[str] = []
+        self.requests = 0
+        self._templates = {}
+        for name in ("landing", "login", "feed", "search", "job"):
+            with open(os.path.join(FIXTURES_DIR, f"{name}.html"), "r") as f:
+                self._templates[name] = Template(f.read())
+        with open(os.path.join(FIXTURES_DIR, "replay.js"), "rb") as f:
+            self._script = f.read()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def render(self, name: str, **values) -> bytes:
+        return self._templates[name].substitute(**values).encode()
+
+    def _handler_class(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", content_type: str = "text/html", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _logged_in(self) -> bool:
+                return f"{SESSION_COOKIE}=" in (self.headers.get("Cookie") or "")
+
+            def _body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def do_GET(self):
+                replay.requests += 1
+                url = urlparse(self.path)
+                path = url.path
+
+                if path == "/":
+                    if self._logged_in():
+                        return self._send(302, headers={"Location": "/feed/"})
+                    return self._send(200, replay.render("landing"))
+                if path == "/login":
+                    return self._send(200, replay.render("login"))
+                if path.startswith("/feed"):
+                    return self._send(200, replay.render("feed"))
+                if path.startswith("/jobs/search"):
+                    query = parse_qs(url.query)
+                    start = int(query.get("start", ["0"])[0])
+                    jobs = replay.jobs[start:]
+                    if query.get("f_AL", [""])[0] == "true":
+                        jobs = [job for job in jobs if job["easyApply"]]
+                    return self._send(200, replay.render(
+                        "search",
+                        jobs_json=json.dumps(jobs),
+                        page_size=replay.page_size,
+                        form_pages_json=json.dumps(replay.form_pages)
+                    ))
+                match = re.match(r"^/jobs/view/(\d+)/?$", path)
+                if match and match.group(1) in replay.jobs_by_id:
+                    job = replay.jobs_by_id[match.group(1)]
+                    return self._send(200, replay.render(
+                        "job",
+                        job_id=job["id"],
+                        title=job["title"],
+                        company=job["company"],
+                        form_pages_json=json.dumps(replay.form_pages)
+                    ))
+                if path == "/robots.txt":
+                    return self._send(200, b"User-agent: *\n", "text/plain")
+                if path == "/voyager/api/me":
+                    if self._logged_in():
+                        return self._send(200, b'{"plainId": 1}', "application/json")
+                    return self._send(401, b"{}", "application/json")
+                if path == "/static/replay.js":
+                    return self._send(200, replay._script, "application/javascript")
+                if path.startswith("/api/"):
+                    return self._send(200, b"{}", "application/json")
+                self._send(404, b"not found", "text/plain")
+
+            def do_POST(self):
+                replay.requests += 1
+                path = urlparse(self.path).path
+                body = self._body()
+
+                if path == "/login":
+                    form = parse_qs(body.decode())
+                    if form.get("session_key") and form.get("session_password"):
+                        return self._send(302, headers={
+                            "Location": "/feed/",
+                            "Set-Cookie": f"{SESSION_COOKIE}=replay-session; Path=/"
+                        })
+                    return self._send(302, headers={"Location": "/login"})
+                if path == "/api/apply":
+                    replay.applications.append(body.decode())
+                    return self._send(200, b"{}", "application/json")
+                if path.endswith("/chat/completions"):
+                    completion = replay.llm.complete(json.loads(body or b"{}"))
+                    return self._send(200, json.dumps(completion).encode(), "application/json", {
+                        "x-ratelimit-limit-requests": "10000",
+                        "x-ratelimit-remaining-requests": "9999",
+                        "x-ratelimit-reset-requests": "6ms",
+                        "x-ratelimit-limit-tokens": "10000000",
+                        "x-ratelimit-remaining-tokens": "9999999",
+                        "x-ratelimit-reset-tokens": "0s",
+                    })
+                if path.startswith("/api/"):
+                    return self._send(200, b"{}", "application/json")
+                self._send(404, b"not found", "text/plain")
+
+        return Handler
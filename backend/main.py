@@ -1,22 +1,35 @@
 # main.py
-from fastapi import FastAPI, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect, UploadFile, File, Depends, Body
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi import FastAPI, HTTPException, BackgroundTasks, WebSocket, UploadFile, File, Depends, Body
+from fastapi.security import HTTPBasic, HTTPBasicCredentials, HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr, validator
-import json
 from fastapi import Form, Request
 import os
 import logging
 import asyncio
 import bcrypt
 import secrets
-from typing import Optional, Dict, List
+from typing import Optional, List
 # Import the LinkedIn automation function
 from platforms.linkedin import LinkedInAutomator
+from services.answer_cache import invalidate_answer_cache
+from services.resume_text import cache_resume_text, remove_resume_text
+from services.driver_pool import DriverPool
+from services.scheduler import AutomationScheduler, AUTOMATION_MAX_WORKERS
+from services.ws_hub import ConnectionHub
+from services.storage import get_storage
+from services.auth_tokens import issue_session_token, verify_session_token, CredentialCache
+from services.uploads import UploadTooLarge, save_upload, list_user_files, remove_files
+from services.pacing import PACING_PROFILES, DEFAULT_PACING_PROFILE
+from services.job_ranking import DEFAULT_MIN_RELEVANCE
+from services.llm_client import get_llm_client
+from services.metrics import RunTimer, RUNS, ERRORS, render_metrics
+from services.checkpoint import RunCheckpoint
+from services.application_log import ApplicationLogCompactor, get_application_log
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from threading import Thread
-from queue import Queue
 import time
 
 # Configure logging
@@ -48,12 +61,34 @@ async def read_index():
     return FileResponse("../frontend/index.html")
 
 BASE_DIR = "../users"
-ws_connections: Dict[str, WebSocket] = {}  # Dictionary to store active WebSocket connections
-active_automation_tasks: Dict[str, asyncio.Task] = {}  # Track automation tasks
-# Message queue for WebSocket communication
-ws_message_queues = {}
+# Per-connection WebSocket queues fed from the automation worker threads
+ws_hub = ConnectionHub()
 
-security = HTTPBasic()
+# Clients send either a session token from /login or HTTP Basic credentials
+security = HTTPBasic(auto_error=False)
+bearer_security = HTTPBearer(auto_error=False)
+credential_cache = CredentialCache()
+
+# Warm browsers shared by all automation runs; parallel sessions leave one for each other scheduler worker
+driver_pool = DriverPool(headless=True, reserve=AUTOMATION_MAX_WORKERS - 1)
+# Upper bound on parallel_sessions a single run may ask for
+PARALLEL_MAX_SESSIONS = int(os.getenv("PARALLEL_MAX_SESSIONS", "3"))
+
+def report_queue_position(username: str, position: int):
+    """Tell a waiting user where their run is in the automation queue"""
+    ws_hub.publish(username, {"type": "queue", "position": position})
+
+# Bounded pool of automation workers; runs beyond the limit wait in a fair FIFO queue
+automation_scheduler = AutomationScheduler(on_queue_change=report_queue_position)
+
+# Folds the per-user application logs into the database in the background
+application_log_compactor = ApplicationLogCompactor(BASE_DIR)
+
+def fold_application_log(username: str):
+    """Bring stored history up to date with applications still only in the user's log"""
+    application_log = get_application_log(username, os.path.join(BASE_DIR, username))
+    if application_log.has_pending():
+        application_log.compact()
 
 # Ensure the base user directory exists
 if not os.path.exists(BASE_DIR):
@@ -62,16 +97,9 @@ if not os.path.exists(BASE_DIR):
 async def async_noop(msg):
     pass
 
-# Helper functions to read/write JSON
-def read_json(filepath):
-    if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return json.load(f)
-    return {}
-
-def write_json(filepath, data):
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=4)
+# Users, profiles and applications live in SQLite; the user directory only holds uploaded files.
+# Its calls can wait on the write lock, so endpoints make them through the thread pool.
+storage = get_storage()
 
 # Password hashing helpers
 def hash_password(password: str) -> str:
@@ -80,20 +108,37 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed_password.encode())
 
-# Basic authentication
-def get_current_username(credentials: HTTPBasicCredentials = Depends(security)):
-    user_dir = os.path.join(BASE_DIR, credentials.username)
-    credentials_file = os.path.join(user_dir, "credentials.json")
+# Session token or Basic authentication
+async def get_current_username(
+    token: Optional[HTTPAuthorizationCredentials] = Depends(bearer_security),
+    credentials: Optional[HTTPBasicCredentials] = Depends(security)
+):
+    # Signed session tokens are checked with a single HMAC, no bcrypt involved
+    if token:
+        username = verify_session_token(token.credentials)
+        if not username:
+            raise HTTPException(status_code=401, detail="Session expired or invalid")
+        return username
+    
+    if not credentials:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Basic"})
     
-    if not os.path.exists(credentials_file):
+    # Recently verified credentials skip bcrypt entirely
+    if credential_cache.check(credentials.username, credentials.password):
+        return credentials.username
+    
+    saved_credentials = await run_in_threadpool(storage.get_user, credentials.username)
+    
+    if not saved_credentials:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    saved_credentials = read_json(credentials_file)
-    is_valid = verify_password(credentials.password, saved_credentials["password"])
+    # bcrypt is deliberately slow; keep it off the event loop
+    is_valid = await run_in_threadpool(verify_password, credentials.password, saved_credentials["password_hash"])
     
     if not is_valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    credential_cache.remember(credentials.username, credentials.password)
     return credentials.username
 
 # Pydantic models for requests
@@ -121,11 +166,33 @@ class ProfileData(BaseModel):
     portfolio_url: Optional[str] = None
     linkedin_email: Optional[str] = None
     linkedin_password: Optional[str] = None
+    answer_overrides: Optional[str] = None  # "keyword = answer" lines for screening questions
 
 class JobSearchParams(BaseModel):
     job_title: str
     location: str
     applications_limit: int = 5
+    pacing_profile: str = DEFAULT_PACING_PROFILE
+    min_relevance: float = DEFAULT_MIN_RELEVANCE  # Opt-in: 0 ranks without dropping any job
+    parallel_sessions: int = 1  # Opt-in: browsers applying at once within this run
+
+    @validator('pacing_profile')
+    def pacing_profile_known(cls, v):
+        if v not in PACING_PROFILES:
+            raise ValueError(f"pacing_profile must be one of: {', '.join(PACING_PROFILES)}")
+        return v
+
+    @validator('min_relevance')
+    def min_relevance_range(cls, v):
+        if not 0 <= v <= 1:
+            raise ValueError('min_relevance must be between 0 and 1')
+        return v
+
+    @validator('parallel_sessions')
+    def parallel_sessions_range(cls, v):
+        if not 1 <= v <= PARALLEL_MAX_SESSIONS:
+            raise ValueError(f'parallel_sessions must be between 1 and {PARALLEL_MAX_SESSIONS}')
+        return v
 
 class ApplicationStatus(BaseModel):
     job_id: str
@@ -138,42 +205,26 @@ class ApplicationStatus(BaseModel):
 @app.websocket("/ws/{username}")
 async def websocket_endpoint(websocket: WebSocket, username: str):
     await websocket.accept()
-    ws_connections[username] = websocket
-    
-    # Create message queue for this user if it doesn't exist
-    if username not in ws_message_queues:
-        ws_message_queues[username] = Queue()
-    
-    try:
-        while True:
-            # Check for messages in the queue
-            if not ws_message_queues[username].empty():
-                message = ws_message_queues[username].get()
-                await websocket.send_text(json.dumps(message))
-            
-            # Send heartbeat every 30 seconds
-            await websocket.send_text(json.dumps({"type": "heartbeat"}))
-            await asyncio.sleep(30)
-            
-    except WebSocketDisconnect:
-        ws_connections.pop(username, None)
+    # The hub's writer task pushes queued messages and heartbeats until the client leaves
+    await ws_hub.serve(username, websocket)
 
 # Registration endpoint
 @app.post("/register")
 async def register(user: UserRequest):
     user_dir = os.path.join(BASE_DIR, user.username)
-    if os.path.exists(user_dir):
+    if await run_in_threadpool(storage.get_user, user.username):
         raise HTTPException(status_code=400, detail="User already exists")
     
     try:
-        os.makedirs(user_dir)
-        credentials = {"email": user.email, "password": hash_password(user.password)}
-        write_json(os.path.join(user_dir, "credentials.json"), credentials)
-        # Initialize empty profile and applications file
-        write_json(os.path.join(user_dir, "profile.json"), {})
-        write_json(os.path.join(user_dir, "applications.json"), [])
+        password_hash = await run_in_threadpool(hash_password, user.password)
+        if not await run_in_threadpool(storage.create_user, user.username, user.email, password_hash):
+            raise HTTPException(status_code=400, detail="User already exists")
+        # The user directory holds uploaded files and per-user browser state
+        os.makedirs(user_dir, exist_ok=True)
         logger.info(f"User registered: {user.username}")
         return {"message": "User registered successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Registration error: {str(e)}")
         raise HTTPException(status_code=500, detail="Registration failed")
@@ -181,22 +232,24 @@ async def register(user: UserRequest):
 # Login endpoint
 @app.post("/login")
 async def login(user: UserRequest):
-    user_dir = os.path.join(BASE_DIR, user.username)
-    credentials_file = os.path.join(user_dir, "credentials.json")
+    credentials = await run_in_threadpool(storage.get_user, user.username)
     
-    if not os.path.exists(credentials_file):
+    if not credentials:
         raise HTTPException(status_code=400, detail="User does not exist")
     
-    credentials = read_json(credentials_file)
-    if not verify_password(user.password, credentials["password"]):
+    if not await run_in_threadpool(verify_password, user.password, credentials["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    credential_cache.remember(user.username, user.password)
+    token, expires_at = issue_session_token(user.username)
+    
     logger.info(f"User logged in: {user.username}")
-    return {"message": "Login successful"}
+    return {"message": "Login successful", "token": token, "expires_at": expires_at}
 
 # Create a function to handle the profile endpoint
 @app.post("/profile")
 async def save_profile(
+    background_tasks: BackgroundTasks,
     username: str = Depends(get_current_username),
     full_name: str = Form(...),
     phone: str = Form(...),
@@ -210,6 +263,7 @@ async def save_profile(
     portfolio_url: Optional[str] = Form(None),
     linkedin_email: Optional[str] = Form(None),
     linkedin_password: Optional[str] = Form(None),
+    answer_overrides: Optional[str] = Form(None),
     file_resume: Optional[UploadFile] = File(None),
     file_cover: Optional[UploadFile] = File(None)
 ):
@@ -229,33 +283,53 @@ async def save_profile(
             github_url=github_url,
             portfolio_url=portfolio_url,
             linkedin_email=linkedin_email,
-            linkedin_password=linkedin_password
+            linkedin_password=linkedin_password,
+            answer_overrides=answer_overrides
         )
         
-        # Save profile data to profile.json
-        write_json(os.path.join(user_dir, "profile.json"), profile_data.dict())
+        # Reject a bad upload before anything is saved, so a failed request changes nothing
+        resume_extension = None
+        if file_resume:
+            resume_extension = file_resume.filename.split('.')[-1].lower()
+            if resume_extension not in ['pdf', 'docx']:
+                raise HTTPException(status_code=400, detail="Resume must be PDF or DOCX format")
+        
+        if file_resume or file_cover:
+            await run_in_threadpool(os.makedirs, user_dir, exist_ok=True)
         
         # Save resume file if provided
         if file_resume:
-            file_extension = file_resume.filename.split('.')[-1].lower()
-            if file_extension not in ['pdf', 'docx']:
-                raise HTTPException(status_code=400, detail="Resume must be PDF or DOCX format")
+            resume_path = os.path.join(user_dir, f"resume.{resume_extension}")
+            
+            # Stream to disk in chunks; the hash computed on the way saves re-reading the file
+            resume_hash = await save_upload(file_resume, resume_path)
+            
+            # Drop a resume of the other format so the automation never picks up a stale one
+            await remove_files(
+                os.path.join(user_dir, f"resume.{ext}") for ext in ['pdf', 'docx'] if ext != resume_extension
+            )
             
-            resume_path = os.path.join(user_dir, f"resume.{file_extension}")
-            with open(resume_path, "wb") as f:
-                content = await file_resume.read()
-                f.write(content)
+            # Extract the resume text once now instead of on every automation run
+            background_tasks.add_task(cache_resume_text, resume_path, resume_hash)
         
         # Save cover letter file if provided
         if file_cover:
             file_extension = file_cover.filename.split('.')[-1].lower()
             cover_path = os.path.join(user_dir, f"cover_letter.{file_extension}")
-            with open(cover_path, "wb") as f:
-                content = await file_cover.read()
-                f.write(content)
+            await save_upload(file_cover, cover_path)
+        
+        # Save profile data only once the uploads are in place
+        await run_in_threadpool(storage.save_profile, username, profile_data.dict())
+        
+        # Cached form answers were derived from the old profile/resume
+        await run_in_threadpool(invalidate_answer_cache, username)
         
         logger.info(f"Profile updated for user: {username}")
         return {"message": "Profile saved successfully"}
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Profile update error for {username}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to save profile: {str(e)}")
@@ -263,23 +337,18 @@ async def save_profile(
 @app.get("/profile")
 async def get_profile(username: str = Depends(get_current_username)):
     user_dir = os.path.join(BASE_DIR, username)
-    profile_file = os.path.join(user_dir, "profile.json")
-    
-    profile_data = {}
-    if os.path.exists(profile_file):
-        profile_data = read_json(profile_file)
+    profile_data = await run_in_threadpool(storage.get_profile, username)
+    user_files = set(await list_user_files(user_dir))
     
     # Check for resume file (pdf or docx)
     for ext in ['pdf', 'docx']:
-        resume_path = os.path.join(user_dir, f"resume.{ext}")
-        if os.path.exists(resume_path):
+        if f"resume.{ext}" in user_files:
             profile_data['resume_url'] = f"/Projects/AI-Job-Automation/CogniApply-Dynamo-Automated-Job-Application-System/users/{username}/resume.{ext}"
             break
     
     # Check for cover letter file (any extension, or restrict as needed)
     for ext in ['pdf', 'docx']:
-        cover_path = os.path.join(user_dir, f"cover_letter.{ext}")
-        if os.path.exists(cover_path):
+        if f"cover_letter.{ext}" in user_files:
             profile_data['cover_letter_url'] = f"/Projects/AI-Job-Automation/CogniApply-Dynamo-Automated-Job-Application-System/users/{username}/cover_letter.{ext}"
             break
     
@@ -295,40 +364,33 @@ async def delete_file(
     try:
         if file_type == 'resume':
             # Remove both PDF and DOCX versions if they exist
-            for ext in ['pdf', 'docx']:
-                file_path = os.path.join(user_dir, f"resume.{ext}")
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            await remove_files(os.path.join(user_dir, f"resume.{ext}") for ext in ['pdf', 'docx'])
+            await run_in_threadpool(remove_resume_text, user_dir)
+            await run_in_threadpool(invalidate_answer_cache, username)
         elif file_type == 'cover_letter':
-            for ext in ['pdf', 'docx']:
-                file_path = os.path.join(user_dir, f"cover_letter.{ext}")
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            await remove_files(os.path.join(user_dir, f"cover_letter.{ext}") for ext in ['pdf', 'docx'])
         else:
             raise HTTPException(status_code=400, detail="Invalid file type")
         
-        # Update profile.json to remove the file URL
-        profile_file = os.path.join(user_dir, "profile.json")
-        if os.path.exists(profile_file):
-            profile_data = read_json(profile_file)
-            if file_type == 'resume':
-                profile_data.pop('resume_url', None)
-            else:
-                profile_data.pop('cover_letter_url', None)
-            write_json(profile_file, profile_data)
+        # Update the stored profile to remove the file URL
+        profile_data = await run_in_threadpool(storage.get_profile, username)
+        url_key = 'resume_url' if file_type == 'resume' else 'cover_letter_url'
+        if url_key in profile_data:
+            profile_data.pop(url_key)
+            await run_in_threadpool(storage.save_profile, username, profile_data)
         
         return {"message": f"{file_type} deleted successfully"}
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error deleting {file_type} for {username}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to delete {file_type}")
     
 # Function to handle the automation process asynchronously
 # Replace the run_automation function in main.py with this version:
-def run_automation(username: str, search_params: JobSearchParams):
+def run_automation(username: str, search_params: JobSearchParams, resume: bool = False, cancel_event=None):
     user_dir = os.path.join(BASE_DIR, username)
-    profile_file = os.path.join(user_dir, "profile.json")
-    applications_file = os.path.join(user_dir, "applications.json")
     
     # Find resume file
     resume_path = None
@@ -340,17 +402,36 @@ def run_automation(username: str, search_params: JobSearchParams):
     
     if not resume_path:
         logger.error(f"Resume not found for {username}")
-        ws_message_queues[username].put({"type": "error", "message": "Resume not found"})
+        ws_hub.publish(username, {"type": "error", "message": "Resume not found"})
         return
     
-    profile = read_json(profile_file)
-    applications = read_json(applications_file)
+    profile = storage.get_profile(username)
+    driver = None
+    application_log = get_application_log(username, user_dir)
+    # Stage timings for the whole run, from the moment a worker picks it up
+    run_timer = RunTimer()
+    
+    # Progress is saved after every job; a resumed run picks up from the saved state
+    checkpoint = RunCheckpoint(user_dir)
+    if not (resume and checkpoint.load()):
+        checkpoint.begin(search_params.dict())
     
     try:
         # Create a status callback function to queue updates for WebSockets
         def status_callback(message):
-            if username in ws_message_queues:
-                ws_message_queues[username].put({"type": "status", "message": message})
+            ws_hub.publish(username, {"type": "status", "message": message})
+        
+        def record_application(record):
+            # Persisted and announced as soon as it is submitted, not when the run ends
+            application_log.append(record)
+            ws_hub.publish(username, {"type": "application", "application": record})
+        
+        # Send initial status
+        status_callback("Starting LinkedIn automation...")
+        
+        # Borrow a warm browser instead of launching one for this run
+        with run_timer.stage("driver_acquire"):
+            driver = driver_pool.acquire(owner=username)
         
         automator = LinkedInAutomator(
             username=username,
@@ -360,12 +441,18 @@ def run_automation(username: str, search_params: JobSearchParams):
                 "email": profile.get("linkedin_email"),
                 "password": profile.get("linkedin_password")
             },
-            headless=True
+            headless=True,
+            driver=driver,
+            cancel_event=cancel_event,
+            pacing_profile=search_params.pacing_profile,
+            min_relevance=search_params.min_relevance,
+            driver_source=driver_pool,
+            run_timer=run_timer,
+            persistent_profile=driver_pool.owner_of(driver) == username,
+            checkpoint=checkpoint,
+            application_callback=record_application
         )
         
-        # Send initial status
-        status_callback("Starting LinkedIn automation...")
-        
         # Create a synchronous wrapper for the async status callback
         async def async_status_callback(message):
             status_callback(message)
@@ -379,12 +466,10 @@ def run_automation(username: str, search_params: JobSearchParams):
             job_title=search_params.job_title,
             location=search_params.location,
             limit=search_params.applications_limit,
-            status_callback=async_status_callback
+            status_callback=async_status_callback,
+            parallel_sessions=search_params.parallel_sessions
         ))
         
-        for job in job_results["jobs"]:
-            applications.append(job)
-        
         # Make sure we always have a valid job_results structure, even if empty
         if not job_results or "jobs" not in job_results:
             job_results = {"jobs": []}
@@ -393,106 +478,148 @@ def run_automation(username: str, search_params: JobSearchParams):
             "totalJobs": len(job_results["jobs"]),
             "appliedJobs": len(job_results["jobs"]),
             "applications": job_results["jobs"],
-            "successRate": 0 if len(job_results["jobs"]) == 0 else 100  # Add success rate
+            "successRate": 0 if len(job_results["jobs"]) == 0 else 100,  # Add success rate
+            "cancelled": job_results.get("cancelled", False),
+            "resumable": job_results.get("cancelled", False),
+            "quickAnswers": job_results.get("quickAnswers"),
+            "timing": job_results.get("timing") or run_timer.summary(),
+            "requests": job_results.get("requests")
         }
 
-        # Always write to applications file, even if empty
-        write_json(applications_file, applications)
+        # Applications were logged as they were submitted; a stopped run keeps its checkpoint
+        # so it can be resumed with /resume-automation
+        if not job_results.get("cancelled"):
+            checkpoint.delete()
         logger.info(f"Automation completed for {username}: {len(job_results['jobs'])} jobs")
+        logger.info(f"Timings for {username} ({search_params.pacing_profile}): {result_dict['timing']}")
+        logger.info(f"Browser requests for {username}: {result_dict['requests']}")
+        RUNS.labels("cancelled" if result_dict["cancelled"] else "completed").inc()
         
         # Send completion message
-        if username in ws_message_queues:
-            ws_message_queues[username].put({
-                "type": "complete", 
-                "results": result_dict
-            })
+        ws_hub.publish(username, {
+            "type": "complete", 
+            "results": result_dict
+        })
     
     except Exception as e:
         logger.error(f"Automation error for {username}: {str(e)}")
-        if username in ws_message_queues:
-            ws_message_queues[username].put({
-                "type": "error", 
-                "message": f"Automation error: {str(e)}"
-            })
+        logger.info(f"Timings for {username} before the error: {run_timer.summary()}")
+        RUNS.labels("failed").inc()
+        ERRORS.labels("run").inc()
+        ws_hub.publish(username, {
+            "type": "error", 
+            "message": f"Automation error: {str(e)}",
+            "resumable": checkpoint.exists()
+        })
     
     finally:
-        active_automation_tasks.pop(username, None)
+        if driver:
+            driver_pool.release(driver)
+        # Make this run's applications visible in the stored history straight away
+        try:
+            application_log.sync()
+            application_log.compact()
+        except Exception as e:
+            logger.error(f"Error storing applications for {username}: {str(e)}")
 
 
 # Helper function to send status updates via WebSocket
 async def send_status_update(username: str, message: str):
-    if username in ws_connections:
-        try:
-            await ws_connections[username].send_text(
-                json.dumps({"type": "status", "message": message})
-            )
-        except Exception as e:
-            logger.error(f"Error sending status update to {username}: {str(e)}")
+    ws_hub.publish(username, {"type": "status", "message": message})
 
 @app.post("/apply")
 async def apply_jobs(
     search_params: JobSearchParams,
     username: str = Depends(get_current_username)
 ):
-    user_dir = os.path.join(BASE_DIR, username)
-    profile_file = os.path.join(user_dir, "profile.json")
-    
-    if not os.path.exists(profile_file):
+    if not await run_in_threadpool(storage.get_profile, username):
         raise HTTPException(status_code=400, detail="Profile not found. Please complete your profile first")
     
     # Check if there's already an active automation task
-    if username in active_automation_tasks:
+    if automation_scheduler.is_active(username):
         raise HTTPException(status_code=400, detail="An automation task is already running")
     
-    # Create message queue if it doesn't exist
-    if username not in ws_message_queues:
-        ws_message_queues[username] = Queue()
-    
-    # Start the automation in a separate thread
-    automation_thread = Thread(target=run_automation, args=(username, search_params))
-    automation_thread.daemon = True
-    automation_thread.start()
-    
-    # Store thread reference
-    active_automation_tasks[username] = automation_thread
-    
-    return {"message": "Job application process started"}
-
-async def websocket_message_dispatcher():
-    """Background task to dispatch messages from queues to WebSockets"""
-    while True:
-        for username, queue in ws_message_queues.items():
-            if username in ws_connections and not queue.empty():
-                message = queue.get()
-                try:
-                    await ws_connections[username].send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error sending message to {username}: {str(e)}")
-        
-        await asyncio.sleep(0.1)  # Small delay to prevent CPU overuse
+    # Queue the automation; a worker picks it up when a slot frees
+    position = automation_scheduler.submit(username, run_automation, username, search_params)
+    
+    return {"message": "Job application process started", "queue_position": position}
 
-# Start the dispatcher when the app starts
+@app.post("/resume-automation")
+async def resume_automation(username: str = Depends(get_current_username)):
+    """Restart a crashed, interrupted or stopped run from its last checkpoint"""
+    if automation_scheduler.is_active(username):
+        raise HTTPException(status_code=400, detail="An automation task is already running")
+    
+    checkpoint = RunCheckpoint(os.path.join(BASE_DIR, username))
+    if not checkpoint.load():
+        raise HTTPException(status_code=404, detail="No interrupted automation run to resume")
+    
+    try:
+        search_params = JobSearchParams(**checkpoint.params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Saved run parameters are no longer valid: {str(e)}")
+    
+    position = automation_scheduler.submit(username, run_automation, username, search_params, True)
+    logger.info(f"Resuming automation for {username}: {len(checkpoint.applied)} applications already submitted")
+    return {
+        "message": "Job application process resumed",
+        "queue_position": position,
+        "applied": len(checkpoint.applied),
+        "remaining": max(0, search_params.applications_limit - len(checkpoint.applied))
+    }
+
+# Bind the WebSocket hub and start the workers when the app starts
 @app.on_event("startup")
 async def startup_event():
-    asyncio.create_task(websocket_message_dispatcher())
+    # Import any users still stored in the legacy per-user JSON files
+    storage.migrate_from_json(BASE_DIR)
+    ws_hub.bind(asyncio.get_running_loop())
+    automation_scheduler.start()
+    application_log_compactor.start()
+    # Launch the warm browsers in the background so startup isn't blocked
+    Thread(target=driver_pool.warm, daemon=True).start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    automation_scheduler.shutdown()
+    driver_pool.shutdown()
+    application_log_compactor.shutdown()
+    get_llm_client().shutdown()
+
+# Prometheus scrape endpoint: stage latencies, waits, applications, skips, errors and LLM tokens
+@app.get("/metrics")
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
 # Get application history
 @app.get("/applications", response_model=List[ApplicationStatus])
-async def get_applications(username: str = Depends(get_current_username)):
-    applications_file = os.path.join(BASE_DIR, username, "applications.json")
-    applications = read_json(applications_file)
-    return applications
+async def get_applications(
+    username: str = Depends(get_current_username),
+    since: Optional[str] = None,
+    until: Optional[str] = None
+):
+    await run_in_threadpool(fold_application_log, username)
+    # Indexed lookup by user and date instead of parsing the whole history
+    return await run_in_threadpool(storage.get_applications, username, since=since, until=until)
+
+@app.get("/applications/{job_id}", response_model=ApplicationStatus)
+async def get_application(job_id: str, username: str = Depends(get_current_username)):
+    await run_in_threadpool(fold_application_log, username)
+    application = await run_in_threadpool(storage.get_application, username, job_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return application
 
 # Stop ongoing automation
 @app.post("/stop-automation")
 async def stop_automation(username: str = Depends(get_current_username)):
-    if username not in active_automation_tasks:
+    if not automation_scheduler.is_active(username):
         raise HTTPException(status_code=400, detail="No active automation session found")
     
     try:
-        # Cancel the task
-        active_automation_tasks[username].cancel()
-        active_automation_tasks.pop(username)
+        # Drop a queued run or signal the running one; it stops at its next checkpoint
+        automation_scheduler.cancel(username)
         logger.info(f"Automation stopped for user: {username}")
         return {"message": "Automation stopped successfully"}
     except Exception as e:
@@ -1,13 +1,13 @@
 # linkedin_automation.py
 import os
-import time
-import random
+import copy
 import asyncio
+import concurrent.futures
 import logging
+import threading
 import pickle
 import json
-import pdfplumber
-import openai
+import time
 from datetime import datetime
 from typing import Dict, List, Callable, Any, Optional
 
@@ -16,7 +16,7 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
@@ -25,12 +25,169 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     StaleElementReferenceException
 )
-import undetected_chromedriver as uc
 from webdriver_manager.chrome import ChromeDriverManager
 
+from services.answer_cache import get_answer_cache
+from services.resume_text import load_resume_text
+from services.driver_pool import create_driver
+from services.scheduler import AutomationCancelled
+from services.pacing import Pacer, DEFAULT_PACING_PROFILE
+from services.job_ranking import JobRanker, DEFAULT_MIN_RELEVANCE
+from services.job_index import load_job_index
+from services.cv_retrieval import CVRetriever, estimate_tokens
+from services.quick_answers import QuickAnswers
+from services.llm_client import get_llm_client
+from services.metrics import RunTimer, APPLICATIONS, SKIPS, ERRORS
+from services.session_index import SessionIndex
+from services.request_filter import RequestStats
+from services.checkpoint import RunCheckpoint
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Overridable so the automator can be pointed at a local replay server (see benchmarks/)
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+
+# Login: a small same-origin document to run the session probe from (instead of the landing page
+# or feed), and the URLs LinkedIn redirects to when the session is not accepted
+SESSION_PROBE_PAGE = "/robots.txt"
+LOGIN_WALL_MARKERS = ("/login", "/authwall", "/uas/login")
+
+# Asks the API behind the site whether the browser is logged in: one small request, no page load.
+# Voyager wants the JSESSIONID value echoed back as a CSRF token.
+SESSION_PROBE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const csrf = (document.cookie.match(/JSESSIONID="?([^";]+)/) || [])[1] || '';
+fetch('/voyager/api/me', {credentials: 'include', headers: {'csrf-token': csrf, 'accept': 'application/json'}})
+    .then(response => done(response.status))
+    .catch(() => done(0));
+"""
+
+# The Easy Apply dialog; its content changes as the form advances
+EASY_APPLY_MODAL = ".jobs-easy-apply-modal, [role='dialog']"
+
+# Parallel mode: the cookie fields copied into each extra browser
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+# Collects every visible, unfilled form control with its identifiers, label and options in one
+# round trip. Each control is tagged with a data-cogni-handle attribute so it can be found again
+# if LinkedIn re-renders it before it is filled.
+FORM_SNAPSHOT_SCRIPT = """
+window.__cogniHandleSeq = window.__cogniHandleSeq || 0;
+const handleOf = (el) => {
+    if (!el.dataset.cogniHandle) el.dataset.cogniHandle = 'h' + (++window.__cogniHandleSeq);
+    return el.dataset.cogniHandle;
+};
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const text = (el) => el ? (el.innerText || el.textContent || '').trim() : '';
+const skipTypes = ['hidden', 'file', 'submit', 'button', 'radio', 'checkbox'];
+const placeholders = ['select an option', 'please select'];
+
+const inputs = [];
+for (const el of document.querySelectorAll("input:not([type='hidden']), textarea")) {
+    const type = el.type || el.getAttribute('type') || '';
+    if (el.value || skipTypes.includes(type) || !visible(el)) continue;
+    let label = el.previousElementSibling;
+    while (label && label.tagName !== 'LABEL') label = label.previousElementSibling;
+    inputs.push({
+        handle: handleOf(el), element: el,
+        placeholder: el.getAttribute('placeholder') || '',
+        ariaLabel: el.getAttribute('aria-label') || '',
+        name: el.getAttribute('name') || '',
+        id: el.id || '',
+        label: text(label)
+    });
+}
+
+let fieldsets = document.querySelectorAll("fieldset[data-test-form-builder-radio-button-form-component='true']");
+if (!fieldsets.length) {
+    fieldsets = Array.from(document.querySelectorAll('fieldset')).filter(f => f.querySelector("input[type='radio']"));
+}
+const radios = [];
+for (const fieldset of fieldsets) {
+    const legend = fieldset.querySelector('legend span') || fieldset.querySelector('legend');
+    radios.push({
+        handle: handleOf(fieldset), element: fieldset,
+        question: text(legend),
+        labels: Array.from(fieldset.querySelectorAll('label'))
+            .filter(l => text(l))
+            .map(l => ({handle: handleOf(l), element: l, text: text(l)})),
+        selectableOptions: !!fieldset.querySelector('div[data-test-text-selectable-option]')
+    });
+}
+
+const dropdowns = [];
+const seenSelects = new Set();
+for (const container of document.querySelectorAll('div[data-test-text-entity-list-form-component], select')) {
+    let select, label;
+    if (container.tagName === 'SELECT') {
+        select = container;
+        label = select.id ? document.querySelector(`label[for="${CSS.escape(select.id)}"]`) : null;
+    } else {
+        select = container.querySelector('select');
+        label = container.querySelector('label');
+        if (!select || !label) continue;
+    }
+    // A select inside a container matches both selectors, only ask once
+    if (seenSelects.has(select)) continue;
+    seenSelects.add(select);
+    dropdowns.push({
+        handle: handleOf(select), element: select,
+        question: text(label),
+        options: Array.from(select.options).map(o => (o.text || '').trim()).filter(t => t && !placeholders.includes(t.toLowerCase()))
+    });
+}
+
+return {inputs, radios, dropdowns};
+"""
+
+RESOLVE_HANDLES_SCRIPT = """
+return arguments[0].map(h => document.querySelector(`[data-cogni-handle="${h}"]`));
+"""
+
+# Reads id, title, company, location and the Easy Apply badge of every job card in one round trip
+JOB_CARD_HARVEST_SCRIPT = """
+const text = (root, selectors) => {
+    for (const selector of selectors) {
+        const el = root.querySelector(selector);
+        if (el && (el.innerText || el.textContent || '').trim()) return (el.innerText || el.textContent).trim();
+    }
+    return '';
+};
+return Array.from(document.querySelectorAll('.job-card-container')).map(card => {
+    let jobId = card.getAttribute('data-job-id') || (card.closest('[data-job-id]') || {}).dataset?.jobId || '';
+    if (!jobId) {
+        const link = card.querySelector("a[href*='/jobs/view/']");
+        const match = link && link.href.match(/\\/jobs\\/view\\/(\\d+)/);
+        jobId = match ? match[1] : card.id;
+    }
+    return {
+        job_id: jobId,
+        title: text(card, ['.job-card-list__title', '.job-card-container__link', 'strong']).split('\\n')[0],
+        company: text(card, ['.job-card-container__company-name', '.artdeco-entity-lockup__subtitle']),
+        location: text(card, ['.job-card-container__metadata-item', '.artdeco-entity-lockup__caption']),
+        easy_apply: (card.innerText || '').toLowerCase().includes('easy apply'),
+        element: card
+    };
+});
+"""
+
+
+def harvest_job_cards(driver, known_jobs=None) -> List[Dict[str, Any]]:
+    """Collect a compact record for every job card on the search results page
+
+    Cards whose id is in known_jobs (jobs applied to or rejected in earlier runs)
+    are left out so they are never clicked.
+    """
+    records = []
+    for record in driver.execute_script(JOB_CARD_HARVEST_SCRIPT) or []:
+        if known_jobs is not None and record["job_id"] in known_jobs:
+            continue
+        record["title"] = record["title"] or "Unknown Position"
+        record["company"] = record["company"] or "Unknown Company"
+        records.append(record)
+    return records
+
 class LinkedInAutomator:
     """Class to handle LinkedIn job application automation"""
     
@@ -41,127 +198,176 @@ class LinkedInAutomator:
         profile_data: Dict[str, Any],
         linkedin_credentials: Dict[str, str],
         headless: bool = True,
-        openai_api_key: Optional[str] = None
+        openai_api_key: Optional[str] = None,
+        driver=None,
+        cancel_event: Optional[threading.Event] = None,
+        pacing_profile: str = DEFAULT_PACING_PROFILE,
+        min_relevance: float = DEFAULT_MIN_RELEVANCE,
+        driver_source=None,
+        run_timer: Optional[RunTimer] = None,
+        persistent_profile: bool = False,
+        checkpoint: Optional[RunCheckpoint] = None,
+        application_callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ):
         self.username = username
         self.resume_path = resume_path
         self.profile_data = profile_data
         self.linkedin_credentials = linkedin_credentials
         self.headless = headless
-        self.driver = None
+        # A driver borrowed from the pool is returned by the caller, not quit here
+        self.driver = driver
+        self.owns_driver = driver is None
+        # Where parallel mode borrows extra browsers from (anything with acquire_spare/release, e.g. the DriverPool)
+        self.driver_source = driver_source
+        # The driver runs on this user's own Chrome profile, so its LinkedIn session outlives the run
+        self.persistent_profile = persistent_profile
+        # Set by the scheduler when the user stops the run
+        self.cancel_event = cancel_event or threading.Event()
+        # Condition-based waits with profile-dependent jitter, timed per stage
+        self.pacer = Pacer(pacing_profile, self.cancel_event)
+        # Stage timings for this run (login, search, job, form_page, llm_call, ...), shared with parallel sessions
+        self.timer = run_timer or RunTimer()
+        # Requests made and blocked by the browsers of this run
+        self.request_stats = RequestStats()
+        # Saved after every job so an interrupted run can resume; None disables checkpointing
+        self.checkpoint = checkpoint
+        # Called with each application record the moment it is submitted
+        self.application_callback = application_callback
+        # Search results offset the current results page started from
+        self.search_start = checkpoint.offset if checkpoint else 0
+        self.min_relevance = min_relevance
+        self.job_ranker = None
         self.cv_text = None
+        self.user_dir = os.path.join("../users", self.username)
+        # When the LinkedIn session cookies expire and when they last worked
+        self.session_index = SessionIndex(self.user_dir)
         
-        # Set up OpenAI API key
-        if openai_api_key:
-            openai.api_key = openai_api_key
-        else:
-            openai.api_key = os.getenv("OPENAI_API_KEY")
+        # Requests go through the shared client; the key is per automator, never set globally
+        self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.llm = get_llm_client()
         
         # Extract CV text
         self._extract_cv_text()
+        
+        # Answers are cached per user and keyed on the CV, so repeated screening questions skip GPT
+        self.answer_cache = get_answer_cache(self.username, self.cv_text, self.profile_data)
+        
+        # Routine questions (contact details, experience, salary) never reach GPT
+        self.quick_answers = QuickAnswers(self.profile_data)
+        
+        # Prompts carry only the CV sections relevant to each question
+        self.cv_retriever = CVRetriever(self.cv_text, self.profile_data)
+        
+        # Jobs applied to or rejected in earlier runs, skipped without opening them
+        self.job_index = load_job_index(self.username, self.user_dir)
     
     def _extract_cv_text(self):
-        """Extract text from resume PDF file"""
-        try:
-            if self.resume_path.endswith('.pdf'):
-                with pdfplumber.open(self.resume_path) as pdf:
-                    self.cv_text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-            else:
-                # For non-PDF files, we'd need additional libraries
-                # This is a placeholder for docx or other formats
-                logger.warning(f"Non-PDF resume format detected: {self.resume_path}")
-                self.cv_text = "RESUME TEXT EXTRACTION FAILED - PLEASE UPLOAD PDF"
-        except Exception as e:
-            logger.error(f"Error extracting CV text: {str(e)}")
+        """Load resume text, reusing the text extracted at upload time when the file is unchanged"""
+        self.cv_text = load_resume_text(self.resume_path)
+        if not self.cv_text:
+            logger.warning(f"No text could be extracted from resume: {self.resume_path}")
             self.cv_text = "RESUME TEXT EXTRACTION FAILED"
     
     def _initialize_driver(self):
-        """Initialize and configure the WebDriver"""
+        """Initialize and configure the WebDriver unless one was provided"""
+        if self.driver:
+            self.pacer.bind(self.driver)
+            return True
+        
         try:
-            options = uc.ChromeOptions()
-            
-            #if self.headless:
-            #    options.add_argument("--headless")
-            
-            # Add anti-detection options
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-gpu")
-            
-            # Add random user agent
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-            ]
-            options.add_argument(f"--user-agent={random.choice(user_agents)}")
-            
-            # Initialize the driver with undetected_chromedriver
-            self.driver = uc.Chrome(options=options)
-            self.driver.maximize_window()
-            logger.info("WebDriver initialized successfully")
-            
+            self.driver = create_driver(self.headless)
+            self.pacer.bind(self.driver)
             return True
         except Exception as e:
             logger.error(f"Error initializing WebDriver: {str(e)}")
             return False
     
-    def _random_delay(self, min_sec=2, max_sec=5):
-        """Add a random delay to simulate human behavior"""
-        delay = random.uniform(min_sec, max_sec)
-        time.sleep(delay)
+    def _check_cancelled(self):
+        """Abort the run if a stop was requested"""
+        if self.cancel_event.is_set():
+            raise AutomationCancelled()
+    
+    def _probe_session(self):
+        """Check whether the browser is logged in with one API request instead of loading the feed"""
+        try:
+            return self.driver.execute_async_script(SESSION_PROBE_SCRIPT) == 200
+        except Exception as e:
+            logger.warning(f"Session probe failed: {str(e)}")
+            return False
+    
+    def _on_login_wall(self):
+        return any(marker in self.driver.current_url for marker in LOGIN_WALL_MARKERS)
     
     def _login_to_linkedin(self):
-        """Log in to LinkedIn using saved cookies or credentials"""
+        """Log in to LinkedIn, reusing the browser profile's session or saved cookies when they still work"""
         try:
-            user_dir = os.path.join("../users", self.username)
-            cookies_file = os.path.join(user_dir, "linkedin_cookies.pkl")
+            cookies_file = os.path.join(self.user_dir, "linkedin_cookies.pkl")
             
-            # Navigate to LinkedIn
-            self.driver.get("https://www.linkedin.com/")
-            self._random_delay(3, 6)
+            # A persistent profile whose session was verified recently and hasn't expired needs no
+            # login at all; apply_to_jobs logs in properly if the search lands on the login wall
+            if self.persistent_profile and self.session_index.is_trusted():
+                logger.info("LinkedIn session still valid, skipping login")
+                return True
+            
+            # Get onto the LinkedIn origin cheaply, then ask whether the profile is already logged in
+            self.driver.get(f"{LINKEDIN_BASE_URL}{SESSION_PROBE_PAGE}")
+            if self._probe_session():
+                self.session_index.record(self.driver.get_cookies())
+                logger.info("Login successful using the browser profile's session")
+                return True
             
             # Try to load cookies if available
             if os.path.exists(cookies_file):
                 try:
-                    cookies = pickle.load(open(cookies_file, "rb"))
+                    with open(cookies_file, "rb") as f:
+                        cookies = pickle.load(f)
+                    now = time.time()
                     for cookie in cookies:
+                        # The browser would drop expired cookies anyway
+                        if cookie.get("expiry") and cookie["expiry"] < now:
+                            continue
                         self.driver.add_cookie(cookie)
-                    self.driver.refresh()
-                    self._random_delay(3, 6)
                     
                     # Check if login was successful
-                    if "feed" in self.driver.current_url:
+                    if self._probe_session():
+                        self.session_index.record(self.driver.get_cookies())
                         logger.info("Login successful using cookies")
                         return True
                 except Exception as e:
                     logger.warning(f"Error loading cookies: {str(e)}")
             
+            self.session_index.invalidate()
+            
             # If cookies didn't work or aren't available, log in with credentials
-            self.driver.get("https://www.linkedin.com/login")
-            self._random_delay(2, 4)
+            self.driver.get(f"{LINKEDIN_BASE_URL}/login")
+            self.pacer.visible((By.ID, "username"), "login_form")
             
             # Enter username/email
             username_field = self.driver.find_element(By.ID, "username")
             username_field.clear()
             username_field.send_keys(self.linkedin_credentials["email"])
-            self._random_delay(1, 2)
+            self.pacer.jitter("login_typing")
             
             # Enter password
             password_field = self.driver.find_element(By.ID, "password")
             password_field.clear()
             password_field.send_keys(self.linkedin_credentials["password"])
-            self._random_delay(1, 2)
+            self.pacer.jitter("login_typing")
             
             # Submit login form
             password_field.send_keys(Keys.RETURN)
-            self._random_delay(5, 8)
+            self.pacer.wait_for(
+                lambda d: any(marker in d.current_url for marker in ("feed", "checkpoint", "challenge")),
+                "login_submit"
+            )
             
             # Check if login was successful
             if "feed" in self.driver.current_url:
                 # Save cookies for future use
-                pickle.dump(self.driver.get_cookies(), open(cookies_file, "wb"))
+                cookies = self.driver.get_cookies()
+                with open(cookies_file, "wb") as f:
+                    pickle.dump(cookies, f)
+                self.session_index.record(cookies)
                 logger.info("Login successful using credentials")
                 return True
             else:
@@ -175,270 +381,363 @@ class LinkedInAutomator:
             logger.error(f"Error during LinkedIn login: {str(e)}")
             return False
     
-    def query_gpt(self, question, options=None):
-        """Query GPT to generate answers based on CV content"""
+    async def query_gpt(self, question, options=None, check_cache=True):
+        """Answer a form question, consulting the answer cache before GPT
+        
+        Callers that already missed the cache pass check_cache=False so the miss is counted once.
+        """
+        if check_cache:
+            cached_answer = self.answer_cache.get(question, options)
+            if cached_answer is not None:
+                logger.info(f"Answer cache hit: {question}")
+                return cached_answer
+        
         try:
-            prompt = f"""
-            You are a CV analysis expert. Your task is to extract or infer answers to given questions based on the CV text provided. 
+            answer = await self._ask_gpt(question, options)
+        except Exception as e:
+            logger.error(f"GPT unavailable after retries, using a fallback answer for '{question}': {str(e)}")
+            # Return a default answer if GPT fails (never cached)
+            if options and isinstance(options, list) and len(options) > 0:
+                return options[0]
+            return "N/A"
+        
+        self.answer_cache.put(question, answer, options)
+        return answer
+    
+    def _log_prompt_size(self, prompt, context, label):
+        """Log the estimated prompt size against what the full CV would have cost"""
+        after = estimate_tokens(prompt)
+        before = after - estimate_tokens(context) + self.cv_retriever.full_tokens
+        logger.info(f"Prompt tokens for {label}: ~{before} with full CV -> ~{after} with retrieval")
+    
+    async def _ask_gpt(self, question, options=None):
+        """Query GPT to generate answers based on CV content"""
+        context = self.cv_retriever.context(f"{question} {' '.join(options or [])}")
+        prompt = f"""
+        You are a CV analysis expert. Your task is to extract or infer answers to given questions based on the CV text provided. 
 
-            ### **Instructions:**
-            1. **Detect answer type:**
-            - If the question is about **experience, salary, years, age,notice period,education or any numerical data**, return an **integer** (default to `0` if not found).
-            - Otherwise, return a **short text answer**.
-            
-            2. **Answering the question:**
-            - If the answer exists in the CV, return it.
-            - If not found:
-                - Return `"N/A"` for text-based questions.
-                - Return `0` for numerical questions (like `experience in years`, `salary`,`Notice period`,`Education` etc.).
-            
-            3. **Handling Multiple-choice Questions:**
-            - If **options are provided**, return the closest matching answer from the option.
-            - If no exact match is found in the CV, return random answer from the option.
+        ### **Instructions:**
+        1. **Detect answer type:**
+        - If the question is about **experience, salary, years, age,notice period,education or any numerical data**, return an **integer** (default to `0` if not found).
+        - Otherwise, return a **short text answer**.
+        
+        2. **Answering the question:**
+        - If the answer exists in the CV, return it.
+        - If not found:
+            - Return `"N/A"` for text-based questions.
+            - Return `0` for numerical questions (like `experience in years`, `salary`,`Notice period`,`Education` etc.).
+        
+        3. **Handling Multiple-choice Questions:**
+        - If **options are provided**, return the closest matching answer from the option.
+        - If no exact match is found in the CV, return random answer from the option.
 
-            ---
+        ---
 
-            ### **CV TEXT:**
-            {self.cv_text}
+        ### **CV TEXT (profile summary and relevant sections):**
+        {context}
 
-            ### **QUESTION:**
-            {question}
+        ### **QUESTION:**
+        {question}
 
-            ### **OPTIONS:**
-            {options}
+        ### **OPTIONS:**
+        {options}
 
-            ### **ANSWER:**
-            """
-            
-            response = openai.chat.completions.create(
-                model="gpt-4",  # Can be modified based on needs and availability
-                messages=[
+        ### **ANSWER:**
+        """
+        self._log_prompt_size(prompt, context, question)
+        
+        with self.timer.stage("llm_call"):
+            return await self.llm.complete(
+                [
                     {"role": "system", "content": "You are a CV analysis expert. Answer accurately and concisely."},
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                api_key=self.openai_api_key
             )
-            
-            answer = response.choices[0].message.content.strip()
-            return answer
-            
+
+    async def query_gpt_batch(self, questions):
+        """Answer every question on a form page with a single GPT request
+        
+        Returns a dict mapping question ids to answers, or None if the response
+        could not be parsed so the caller can fall back to per-field calls.
+        """
+        query = " ".join(f"{q['question']} {' '.join(q['options'] or [])}" for q in questions)
+        context = self.cv_retriever.context(query, self.cv_retriever.top_k + len(questions))
+        
+        question_lines = []
+        for q in questions:
+            line = f'- id: "{q["id"]}" | type: {q["type"]} | question: {q["question"]}'
+            if q["options"]:
+                line += f" | options: {json.dumps(q['options'])}"
+            question_lines.append(line)
+        
+        prompt = f"""
+        You are a CV analysis expert. Your task is to extract or infer answers to all of the given job application questions based on the CV text provided.
+
+        ### **Instructions:**
+        1. For questions about **experience, salary, years, age, notice period, education or any numerical data**, answer with an **integer** (default to `0` if not found).
+        2. For other text questions, give a **short text answer**, or `"N/A"` if the CV does not contain it.
+        3. For questions with **options**, answer with the exact text of the closest matching option.
+        4. Respond with **only** a JSON object mapping every question id to its answer, e.g. {{"q1": "5", "q2": "Yes"}}.
+
+        ---
+
+        ### **CV TEXT (profile summary and relevant sections):**
+        {context}
+
+        ### **QUESTIONS:**
+        {chr(10).join(question_lines)}
+
+        ### **JSON ANSWERS:**
+        """
+        self._log_prompt_size(prompt, context, f"batch of {len(questions)} questions")
+        
+        try:
+            with self.timer.stage("llm_call"):
+                content = await self.llm.complete(
+                    [
+                        {"role": "system", "content": "You are a CV analysis expert. Answer accurately and concisely in JSON."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    api_key=self.openai_api_key
+                )
         except Exception as e:
-            logger.error(f"Error querying GPT: {str(e)}")
-            # Return a default answer if GPT fails
-            if options and isinstance(options, list) and len(options) > 0:
-                return options[0]
-            return "N/A"
-    
-    def _fill_input_fields(self):
-        """Detect and fill input fields on LinkedIn application forms"""
+            logger.error(f"Error querying GPT for batched answers: {str(e)}")
+            return None
+        
+        # Tolerate the model wrapping its JSON in a markdown code fence
+        if content.startswith("```"):
+            content = content.strip("`")
+            if content.lower().startswith("json"):
+                content = content[4:]
+        
         try:
-            # Wait for input fields to be present
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "input"))
-            )
-            
-            # Find all input and textarea fields
-            input_fields = self.driver.find_elements(By.CSS_SELECTOR, "input:not([type='hidden']), textarea")
-            
-            for field in input_fields:
-                try:
-                    # Get field attributes to identify its purpose
-                    placeholder = field.get_attribute("placeholder") or ""
-                    aria_label = field.get_attribute("aria-label") or ""
-                    name = field.get_attribute("name") or ""
-                    field_id = field.get_attribute("id") or ""
-                    field_type = field.get_attribute("type") or ""
-                    
-                    # Skip already filled fields, hidden fields, and file upload fields
-                    if (field.get_attribute("value") or 
-                        field_type in ["hidden", "file", "submit", "button"] or
-                        not field.is_displayed()):
-                        continue
-                    
-                    # Try to get the label text if available
-                    try:
-                        label = field.find_element(By.XPATH, "./preceding-sibling::label").text
-                    except:
-                        label = ""
-                    
-                    # Combine all identifiers to create a comprehensive description
-                    field_identifier = (placeholder + " " + aria_label + " " + name + " " + label + " " + field_id).strip().lower()
-                    
-                    # Skip empty or irrelevant fields
-                    if not field_identifier or field_identifier in ["null", "undefined"]:
-                        continue
-                    
-                    # Scroll to the element
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", field)
-                    self._random_delay(0.5, 1)
-                    
-                    # Click and clear the field
-                    field.click()
-                    field.clear()
-                    self._random_delay(0.3, 0.8)
-                    
-                    # Get the appropriate value from GPT
-                    answer = self.query_gpt(field_identifier)
-                    logger.info(f"Field: {field_identifier} -> Answer: {answer}")
-                    
-                    # Type the answer with human-like behavior
-                    for char in answer:
-                        field.send_keys(char)
-                        self._random_delay(0.05, 0.15)
-                    
-                    self._random_delay(0.5, 1)
-                
-                except StaleElementReferenceException:
-                    # Element became stale, continue with next element
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error filling field: {str(e)}")
+            answers = json.loads(content)
+        except ValueError:
+            logger.warning(f"Malformed batched GPT response, falling back to per-field queries: {content[:200]}")
+            return None
+        
+        if not isinstance(answers, dict):
+            logger.warning("Batched GPT response is not a JSON object, falling back to per-field queries")
+            return None
+        
+        return {
+            str(key): str(value).strip()
+            for key, value in answers.items()
+            if isinstance(value, (str, int, float)) and str(value).strip()
+        }
+    
+    def _snapshot_form(self):
+        """Read every visible form control on the page in a single script call"""
+        snapshot = self.driver.execute_script(FORM_SNAPSHOT_SCRIPT)
+        questions = []
+        
+        for field in snapshot.get("inputs", []):
+            # Combine all identifiers to create a comprehensive description
+            field_identifier = " ".join([
+                field["placeholder"], field["ariaLabel"], field["name"], field["label"], field["id"]
+            ]).strip().lower()
             
-            logger.info("Input fields filled successfully")
-            return True
+            # Skip empty or irrelevant fields
+            if not field_identifier or field_identifier in ["null", "undefined"]:
+                continue
             
-        except Exception as e:
-            logger.error(f"Error filling input fields: {str(e)}")
-            return False
-    
-    def _fill_radio_buttons(self):
-        """Fill radio button questions on LinkedIn application forms"""
-        try:
-            # Look for radio button fieldsets
-            radio_fieldsets = self.driver.find_elements(
-                By.XPATH, "//fieldset[@data-test-form-builder-radio-button-form-component='true']"
-            )
+            questions.append({
+                "type": "text", "question": field_identifier, "options": None,
+                "element": field["element"], "handle": field["handle"]
+            })
+        
+        for group in snapshot.get("radios", []):
+            radio_options = [label["text"] for label in group["labels"]]
             
-            if not radio_fieldsets:
-                radio_fieldsets = self.driver.find_elements(
-                    By.XPATH, "//fieldset[.//input[@type='radio']]"
-                )
+            # Handle special cases like Yes/No buttons
+            if group["selectableOptions"] and not radio_options:
+                radio_options = ["Yes", "No"]
             
-            for fieldset in radio_fieldsets:
-                try:
-                    # Extract the question
-                    try:
-                        question_element = fieldset.find_element(By.XPATH, ".//legend/span")
-                        question_text = question_element.text.strip()
-                    except:
-                        try:
-                            question_element = fieldset.find_element(By.XPATH, ".//legend")
-                            question_text = question_element.text.strip()
-                        except:
-                            # If no question found, generate a generic one
-                            question_text = "Choose the most appropriate option for this application"
-                    
-                    # Extract radio options
-                    radio_labels = fieldset.find_elements(By.TAG_NAME, "label")
-                    radio_options = [label.text.strip() for label in radio_labels if label.text.strip()]
-                    
-                    # Handle special cases like Yes/No buttons
-                    yes_no_options = fieldset.find_elements(By.XPATH, ".//div[@data-test-text-selectable-option]")
-                    if yes_no_options and not radio_options:
-                        radio_options = ["Yes", "No"]
-                    
-                    if not radio_options:
-                        continue
-                    
-                    # Query GPT for the best answer
-                    best_answer = self.query_gpt(question_text, radio_options).lower().strip()
-                    logger.info(f"Radio Question: {question_text} -> Answer: {best_answer}")
-                    
-                    # Find the closest matching option
-                    to_select = None
-                    for i, label in enumerate(radio_labels):
-                        if best_answer in label.text.lower():
-                            to_select = radio_labels[i]
-                            break
-                    
-                    # Default to first option if no match found
-                    if not to_select and radio_labels:
-                        to_select = radio_labels[0]
-                    
-                    # Click the selected option
-                    if to_select:
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", to_select)
-                        self._random_delay(0.5, 1)
-                        to_select.click()
-                        self._random_delay(1, 2)
-                
-                except Exception as e:
-                    logger.warning(f"Error processing radio button fieldset: {str(e)}")
+            if not radio_options:
+                continue
             
-            logger.info("Radio buttons filled successfully")
-            return True
+            questions.append({
+                "type": "radio",
+                "question": group["question"] or "Choose the most appropriate option for this application",
+                "options": radio_options,
+                "element": group["element"],
+                "handle": group["handle"],
+                "labels": group["labels"]
+            })
+        
+        for dropdown in snapshot.get("dropdowns", []):
+            if not dropdown["options"]:
+                continue
             
-        except Exception as e:
-            logger.error(f"Error filling radio buttons: {str(e)}")
+            questions.append({
+                "type": "dropdown",
+                "question": dropdown["question"] or "Select the most appropriate option",
+                "options": dropdown["options"],
+                "element": dropdown["element"],
+                "handle": dropdown["handle"]
+            })
+        
+        return questions
+    
+    def _refresh_elements(self, q):
+        """Re-resolve a question's elements from their handles after the page re-rendered them"""
+        handles = [q["handle"]] + [label["handle"] for label in q.get("labels", [])]
+        elements = self.driver.execute_script(RESOLVE_HANDLES_SCRIPT, handles)
+        if not elements or elements[0] is None:
             return False
+        
+        q["element"] = elements[0]
+        for label, element in zip(q.get("labels", []), elements[1:]):
+            label["element"] = element
+        return True
+    
+    async def _answer_questions(self, questions):
+        """Resolve answers for a page of questions: local rules, then the cache, then one batched GPT call"""
+        unanswered = []
+        for index, q in enumerate(questions):
+            q["id"] = f"q{index + 1}"
+            q["answer"] = self.quick_answers.answer(q["question"], q["options"])
+            if q["answer"] is None:
+                q["answer"] = self.answer_cache.get(q["question"], q["options"])
+            if q["answer"] is None:
+                unanswered.append(q)
+        
+        if not unanswered:
+            return questions
+        
+        batch_answers = None
+        if len(unanswered) > 1:
+            batch_answers = await self.query_gpt_batch(unanswered)
+        
+        leftovers = []
+        for q in unanswered:
+            if batch_answers and q["id"] in batch_answers:
+                q["answer"] = batch_answers[q["id"]]
+                self.answer_cache.put(q["question"], q["answer"], q["options"])
+            else:
+                leftovers.append(q)
+        
+        # Batch failed or skipped these questions, ask for them individually and concurrently;
+        # the cache was already checked above
+        answers = await asyncio.gather(*(
+            self.query_gpt(q["question"], q["options"], check_cache=False) for q in leftovers
+        ))
+        for q, answer in zip(leftovers, answers):
+            q["answer"] = answer
+        
+        return questions
     
-    def _fill_dropdowns(self):
-        """Fill dropdown select fields on LinkedIn application forms"""
+    def _apply_input_answer(self, q):
+        """Type an answer into a text input"""
+        field = q["element"]
+        answer = q["answer"]
+        
+        # Scroll to the element
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", field)
+        self.pacer.jitter("field", 0.5)
+        
+        # Click and clear the field
+        field.click()
+        field.clear()
+        
+        logger.info(f"Field: {q['question']} -> Answer: {answer}")
+        
+        # Type the answer with human-like behavior
+        for char in answer:
+            field.send_keys(char)
+            self.pacer.keystroke()
+    
+    def _apply_radio_answer(self, q):
+        """Click the radio option closest to the answer"""
+        best_answer = q["answer"].lower().strip()
+        radio_labels = q["labels"]
+        logger.info(f"Radio Question: {q['question']} -> Answer: {best_answer}")
+        
+        # Find the closest matching option, using the label text from the snapshot
+        to_select = None
+        for label in radio_labels:
+            if best_answer in label["text"].lower():
+                to_select = label["element"]
+                break
+        
+        # Default to first option if no match found
+        if not to_select and radio_labels:
+            to_select = radio_labels[0]["element"]
+        
+        # Click the selected option
+        if to_select:
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", to_select)
+            self.pacer.jitter("field", 0.5)
+            to_select.click()
+    
+    def _apply_dropdown_answer(self, q):
+        """Select the dropdown option matching the answer"""
+        select_element = q["element"]
+        best_answer = q["answer"]
+        option_texts = q["options"]
+        logger.info(f"Dropdown Question: {q['question']} -> Answer: {best_answer}")
+        
+        # Select the answer
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_element)
+        self.pacer.jitter("field", 0.5)
+        
+        # Create a Select object
+        select = Select(select_element)
+        
+        # Try to select by visible text
         try:
-            # Find all dropdown containers
-            dropdown_containers = self.driver.find_elements(
-                By.CSS_SELECTOR, "div[data-test-text-entity-list-form-component], select"
-            )
+            if best_answer in option_texts:
+                select.select_by_visible_text(best_answer)
+            else:
+                # Fall back to first option if best answer not found
+                select.select_by_visible_text(option_texts[0])
+        except:
+            select.select_by_index(1)  # Skip the "Select an option" placeholder
+    
+    async def _fill_form_page(self):
+        """Collect every question on the current form page, answer them together and fill them in"""
+        try:
+            # The modal is already open, so a page without controls is known quickly
+            if not self.pacer.wait_for(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input, select, textarea")), "form_controls", timeout=3
+            ):
+                return True
             
-            for container in dropdown_containers:
+            questions = self._snapshot_form()
+            if not questions:
+                return True
+            
+            with self.timer.stage("answer_questions"):
+                await self._answer_questions(questions)
+            
+            appliers = {
+                "text": self._apply_input_answer,
+                "radio": self._apply_radio_answer,
+                "dropdown": self._apply_dropdown_answer
+            }
+            fill_started = time.monotonic()
+            for q in questions:
                 try:
-                    # Try to get the label/question
                     try:
-                        # If it's a container with a label
-                        label_element = container.find_element(By.TAG_NAME, "label")
-                        question_text = label_element.text.strip()
-                        select_element = container.find_element(By.TAG_NAME, "select")
-                    except:
-                        # If it's a direct select element
-                        if container.tag_name == "select":
-                            select_element = container
-                            try:
-                                label_element = self.driver.find_element(
-                                    By.XPATH, f"//label[@for='{select_element.get_attribute('id')}']"
-                                )
-                                question_text = label_element.text.strip()
-                            except:
-                                question_text = "Select the most appropriate option"
-                        else:
+                        appliers[q["type"]](q)
+                    except StaleElementReferenceException:
+                        # The control was re-rendered; find it again by its handle and retry once
+                        if not self._refresh_elements(q):
                             continue
-                    
-                    # Extract options
-                    options = select_element.find_elements(By.TAG_NAME, "option")
-                    option_texts = [
-                        option.text.strip() for option in options 
-                        if option.text.strip() and option.text.strip().lower() not in ["select an option", "please select"]
-                    ]
-                    
-                    if not option_texts:
-                        continue
-                    
-                    # Query GPT for the best answer
-                    best_answer = self.query_gpt(question_text, option_texts)
-                    logger.info(f"Dropdown Question: {question_text} -> Answer: {best_answer}")
-                    
-                    # Select the answer
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_element)
-                    self._random_delay(0.5, 1)
-                    
-                    # Create a Select object
-                    select = Select(select_element)
-                    
-                    # Try to select by visible text
-                    try:
-                        if best_answer in option_texts:
-                            select.select_by_visible_text(best_answer)
-                        else:
-                            # Fall back to first option if best answer not found
-                            select.select_by_visible_text(option_texts[0])
-                    except:
-                        select.select_by_index(1)  # Skip the "Select an option" placeholder
+                        appliers[q["type"]](q)
+                except StaleElementReferenceException:
+                    continue
                 except Exception as e:
-                    logger.warning(f"Error selecting dropdown option: {str(e)}")
+                    logger.warning(f"Error filling {q['type']} field: {str(e)}")
+            self.timer.record("fill_fields", time.monotonic() - fill_started)
             
-            logger.info("Dropdown fields filled successfully")
+            logger.info(f"Form page filled: {len(questions)} fields")
             return True
         
         except Exception as e:
-            logger.error(f"Error filling dropdown fields: {str(e)}")
+            logger.error(f"Error filling form page: {str(e)}")
+            ERRORS.labels("form_page").inc()
             return False
     
     def _upload_resume(self):
@@ -458,11 +757,11 @@ class LinkedInAutomator:
                     
                     # Scroll to the element
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", file_input)
-                    self._random_delay(1, 2)
+                    self.pacer.jitter("field", 0.5)
                     
-                    # Send the resume file path
+                    # Send the resume file path and let the upload finish
                     file_input.send_keys(self.resume_path)
-                    self._random_delay(2, 4)
+                    self.pacer.network_idle("resume_upload")
                     
                     logger.info(f"Resume uploaded: {self.resume_path}")
                 
@@ -490,11 +789,13 @@ class LinkedInAutomator:
                     if button.is_displayed() and button.is_enabled():
                         # Scroll into view
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        self._random_delay(1, 2)
+                        self.pacer.jitter("click", 0.5)
                         
-                        # Click the button
+                        # Click the button and wait for the resulting requests to settle; the click
+                        # has happened, so a stop request waits for the caller to deal with it
                         button.click()
-                        self._random_delay(2, 3)
+                        with self.pacer.uncancellable():
+                            self.pacer.network_idle("after_click")
                         
                         logger.info(f"Clicked button: {button_text}")
                         return True
@@ -525,10 +826,10 @@ class LinkedInAutomator:
                         for element in elements:
                             if element.is_displayed() and element.is_enabled():
                                 element.click()
-                                self._random_delay(1, 2)
+                                self.pacer.jitter("popup")
                                 logger.info(f"Closed popup using selector: {selector}")
                                 return True
-                except:
+                except Exception:
                     continue
             
             # If no specific close buttons found, try pressing escape key
@@ -536,10 +837,10 @@ class LinkedInAutomator:
                 actions = ActionChains(self.driver)
                 actions.send_keys(Keys.ESCAPE)
                 actions.perform()
-                self._random_delay(1, 2)
+                self.pacer.jitter("popup")
                 logger.info("Pressed ESC key to close popup")
                 return True
-            except:
+            except Exception:
                 pass
             
             return False
@@ -548,7 +849,7 @@ class LinkedInAutomator:
             logger.error(f"Error closing popup: {str(e)}")
             return False
     
-    async def apply_to_jobs(self, job_title, location, limit=5, status_callback=None):
+    async def apply_to_jobs(self, job_title, location, limit=5, status_callback=None, parallel_sessions=1):
         """
         Apply to jobs with the specified title and location
         
@@ -557,171 +858,477 @@ class LinkedInAutomator:
             location: The location to search in
             limit: Maximum number of applications to submit
             status_callback: Async function to call with status updates
+            parallel_sessions: Browsers applying at once; above 1 this browser only searches
+                and the applications run on sessions borrowed from driver_source
         
         Returns:
-            List of jobs applied to
+            Dict with the list of jobs applied to; "cancelled" is set if the run was stopped
+        
+        With a checkpoint loaded from an earlier run, its applications count towards
+        the limit, its processed jobs are skipped, its queued jobs are handled first
+        and the search continues from its results offset.
         """
         if not self._initialize_driver():
             raise Exception("Failed to initialize WebDriver")
+        # A pooled browser's request log still holds its previous run
+        self.request_stats.discard(self.driver)
+        
+        # Track jobs we've applied to
+        applied_jobs = list(self.checkpoint.applied) if self.checkpoint else []
+        
+        # Keep track of jobs we've already seen
+        seen_job_ids = set(self.checkpoint.processed) if self.checkpoint else set()
         
         try:
             # Login to LinkedIn
-            if not self._login_to_linkedin():
+            with self.timer.stage("login"):
+                logged_in = self._login_to_linkedin()
+            if not logged_in:
+                ERRORS.labels("login").inc()
                 raise Exception("LinkedIn login failed")
             
-            # Search for jobs
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title}&location={location}"
-            self.driver.get(search_url)
-            self._random_delay(3, 5)
+            # Search for Easy Apply jobs only; ranking filters the rest before anything is opened
+            self.job_ranker = JobRanker(self.profile_data, job_title, self.min_relevance)
+            search_url = f"{LINKEDIN_BASE_URL}/jobs/search/?keywords={job_title}&location={location}&f_AL=true"
+            
+            # Jobs an interrupted run had harvested but not processed; opened directly by id
+            if self.checkpoint and self.checkpoint.queue and len(applied_jobs) < limit:
+                if status_callback:
+                    await status_callback(f"Resuming: {len(applied_jobs)} applications already submitted")
+                queued = [job for job in self.checkpoint.queue if job["job_id"] not in seen_job_ids]
+                seen_job_ids.update(job["job_id"] for job in queued)
+                await self._apply_in_order(queued, limit, applied_jobs, status_callback)
+            
+            if self.search_start:
+                search_url += f"&start={self.search_start}"
+            with self.timer.stage("search"):
+                self.driver.get(search_url)
+                if self._on_login_wall():
+                    # The session trusted at login has been revoked since it was last checked
+                    logger.info("Stored LinkedIn session was rejected, logging in again")
+                    self.session_index.invalidate()
+                    if not self._login_to_linkedin():
+                        ERRORS.labels("login").inc()
+                        raise Exception("LinkedIn login failed")
+                    self.driver.get(search_url)
+                self.pacer.visible((By.CSS_SELECTOR, ".job-card-container"), "search_results")
             
             if status_callback:
                 await status_callback(f"Searching for {job_title} jobs in {location}")
             
-            # Track jobs we've applied to
-            applied_jobs = []
+            if parallel_sessions > 1 and self.driver_source:
+                await self._apply_in_parallel(limit, applied_jobs, seen_job_ids, status_callback, parallel_sessions)
+            else:
+                await self._apply_from_search_results(limit, applied_jobs, seen_job_ids, status_callback)
+            
+            return self._run_results(applied_jobs)
+        
+        except AutomationCancelled:
+            # Stop requested: keep whatever was submitted before the stop
+            logger.info(f"Automation cancelled for {self.username} after {len(applied_jobs)} applications")
+            if status_callback:
+                await status_callback("Automation stopped by user")
+            return self._run_results(applied_jobs, cancelled=True)
+        
+        except Exception as e:
+            logger.error(f"Error in job application process: {str(e)}")
+            raise
+        
+        finally:
+            # Persist any answers learned during this run
+            self.answer_cache.flush()
+            logger.info(f"Quick answers for {self.username}: {self.quick_answers.stats()}")
+            try:
+                self.job_index.compact()
+            except OSError as e:
+                logger.warning(f"Could not compact job index: {str(e)}")
             
-            # Keep track of jobs we've already seen
-            seen_job_ids = set()
+            # Clean up the WebDriver if we created it
+            if self.driver and self.owns_driver:
+                self.driver.quit()
+    
+    def _run_results(self, applied_jobs, **extra):
+        """apply_to_jobs result: the applications plus the run's wait, answer, timing and request statistics"""
+        self.request_stats.collect(self.driver)
+        return {
+            "jobs": applied_jobs,
+            **extra,
+            "pacing": self.pacer.summary(),
+            "quickAnswers": self.quick_answers.stats(),
+            "timing": self.timer.summary(self.pacer.summary()),
+            "requests": self.request_stats.summary()
+        }
+    
+    async def _apply_from_search_results(self, limit, applied_jobs, seen_job_ids, status_callback):
+        """Walk the search results, applying to Easy Apply jobs until the limit is reached"""
+        while len(applied_jobs) < limit:
+            # Process each new job card, most relevant first
+            await self._apply_in_order(self._next_ranked_jobs(seen_job_ids), limit, applied_jobs, status_callback)
             
-            while len(applied_jobs) < limit:
-                # Get all job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-card-container")
+            # If we haven't reached the limit yet, try to load more jobs
+            if len(applied_jobs) < limit and not self._load_more_results():
+                break
+    
+    async def _apply_in_order(self, jobs, limit, applied_jobs, status_callback):
+        """Apply to jobs one after another on this browser until the limit is reached"""
+        for job in jobs:
+            # Check if we've reached the limit
+            if len(applied_jobs) >= limit:
+                break
+            
+            self._check_cancelled()
+            
+            application_record = await self._apply_to_job(job, status_callback)
+            if application_record:
+                applied_jobs.append(application_record)
+            self._record_job_result(job, application_record)
+    
+    def _record_job_result(self, job, application_record):
+        """Hand a submitted application on right away and checkpoint the job as processed"""
+        if application_record and self.application_callback:
+            try:
+                self.application_callback(application_record)
+            except Exception as e:
+                logger.error(f"Error recording application for job {job['job_id']}: {str(e)}")
+        if self.checkpoint:
+            self.checkpoint.job_done(job["job_id"], application_record)
+    
+    def _next_ranked_jobs(self, seen_job_ids):
+        """Harvest the current results page and rank the cards not seen yet"""
+        # Harvest every card on the page in one call, leaving out jobs handled in earlier runs
+        job_records = harvest_job_cards(self.driver, self.job_index)
+        
+        # Rank the cards we have not seen yet; irrelevant and non-Easy-Apply ones are never opened
+        new_records = [job for job in job_records if job["job_id"] not in seen_job_ids]
+        seen_job_ids.update(job["job_id"] for job in new_records)
+        ranked = self.job_ranker.rank(new_records)
+        if len(ranked) < len(new_records):
+            SKIPS.labels("low_relevance").inc(len(new_records) - len(ranked))
+        if self.checkpoint:
+            self.checkpoint.set_queue(ranked)
+        return ranked
+    
+    def _load_more_results(self):
+        """Scroll or page the results list; returns False when no more cards appear"""
+        # Known jobs are filtered out of the harvest, so count the cards on the page itself
+        card_count = len(self.driver.find_elements(By.CSS_SELECTOR, ".job-card-container"))
+        if not card_count:
+            logger.warning("No job listings found")
+            return False
+        
+        # Scroll down to load more jobs
+        started = time.monotonic()
+        more_cards_loaded = lambda d: len(d.find_elements(By.CSS_SELECTOR, ".job-card-container")) > card_count
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        loaded_more = self.pacer.wait_for(more_cards_loaded, "more_results", timeout=5)
+        
+        # Click "Show more jobs" button if available
+        try:
+            show_more = self.driver.find_element(By.CSS_SELECTOR, ".infinite-scroller__show-more-button")
+            if show_more.is_displayed():
+                show_more.click()
+                loaded_more = self.pacer.wait_for(more_cards_loaded, "more_results")
+        except NoSuchElementException:
+            pass
+        
+        self.timer.record("load_more", time.monotonic() - started)
+        
+        # If we can't find more jobs, stop
+        if not loaded_more:
+            logger.info("No more jobs to process")
+            return False
+        
+        # Every card that was on the page before this has been handled; a resumed run starts after them
+        if self.checkpoint:
+            self.checkpoint.set_offset(self.search_start + card_count)
+        return True
+    
+    def _open_job(self, job):
+        """Show a job's details: click its card in the results list, or open its page directly"""
+        with self.timer.stage("open_job"):
+            if job.get("element") is not None:
+                job["element"].click()
+                self.pacer.jitter("job_card")
+            else:
+                self.driver.get(f"{LINKEDIN_BASE_URL}/jobs/view/{job['job_id']}/")
+                self.pacer.page_loaded("job_page")
+    
+    async def _apply_to_job(self, job, status_callback):
+        """Apply to a single job, returning its application record or None if it was skipped"""
+        job_id = job["job_id"]
+        job_title_text = job["title"]
+        company_name = job["company"]
+        started = time.monotonic()
+        
+        try:
+            if status_callback:
+                await status_callback(f"Attempting to apply to: {job_title_text} at {company_name}")
+            
+            # Open the job to view details
+            self._open_job(job)
+            
+            # Look for the "Easy Apply" button
+            try:
+                easy_apply_button = self.pacer.clickable(
+                    (By.CSS_SELECTOR, ".jobs-apply-button"), "job_details", timeout=5, required=True
+                )
                 
-                if not job_cards:
-                    logger.warning("No job listings found")
-                    break
+                # Check if it's actually an Easy Apply button
+                if "easy apply" not in easy_apply_button.text.lower():
+                    logger.info(f"Not an Easy Apply job: {job_title_text}")
+                    SKIPS.labels("not_easy_apply").inc()
+                    self.job_index.add(job_id, "rejected")
+                    return None
                 
-                # Process each job card
-                for job_card in job_cards:
-                    # Check if we've reached the limit
-                    if len(applied_jobs) >= limit:
-                        break
+                # Click the Easy Apply button
+                easy_apply_button.click()
+                self.pacer.visible((By.CSS_SELECTOR, EASY_APPLY_MODAL), "easy_apply_modal")
+                
+                # Application process
+                application_complete = False
+                form_page = 1
+                
+                while not application_complete:
+                    self._check_cancelled()
+                    page_started = time.monotonic()
                     
-                    try:
-                        # Get job ID to track seen jobs
-                        job_id = job_card.get_attribute("data-job-id")
-                        if not job_id:
-                            job_id = job_card.get_attribute("id")
-                        
-                        # Skip if we've already seen this job
-                        if job_id in seen_job_ids:
-                            continue
-                        
-                        seen_job_ids.add(job_id)
-                        
-                        # Extract job title and company
-                        try:
-                            job_title_elem = job_card.find_element(By.CSS_SELECTOR, ".job-card-list__title")
-                            job_title_text = job_title_elem.text.strip()
-                            
-                            company_elem = job_card.find_element(By.CSS_SELECTOR, ".job-card-container__company-name")
-                            company_name = company_elem.text.strip()
-                        except:
-                            job_title_text = "Unknown Position"
-                            company_name = "Unknown Company"
-                        
-                        if status_callback:
-                            await status_callback(f"Attempting to apply to: {job_title_text} at {company_name}")
-                        
-                        # Click on the job card to view details
-                        job_card.click()
-                        self._random_delay(2, 4)
-                        
-                        # Look for the "Easy Apply" button
-                        try:
-                            easy_apply_button = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, ".jobs-apply-button"))
-                            )
-                            
-                            # Check if it's actually an Easy Apply button
-                            if "easy apply" not in easy_apply_button.text.lower():
-                                logger.info(f"Not an Easy Apply job: {job_title_text}")
-                                continue
-                            
-                            # Click the Easy Apply button
-                            easy_apply_button.click()
-                            self._random_delay(2, 3)
-                            
-                            # Application process
-                            application_complete = False
-                            form_page = 1
-                            
-                            while not application_complete:
-                                if status_callback:
-                                    await status_callback(f"Filling out application form (page {form_page}) for {job_title_text}")
-                                
-                                # Fill all form components
-                                self._fill_input_fields()
-                                self._fill_radio_buttons()
-                                self._fill_dropdowns()
-                                self._upload_resume()
-                                
-                                # Check for Next/Review/Submit buttons
-                                if self._click_button(["Submit application", "Submit"]):
-                                    self._random_delay(3, 5)
-                                    application_complete = True
-                                elif self._click_button(["Review", "Next", "Continue"]):
-                                    self._random_delay(2, 4)
-                                    form_page += 1
-                                else:
-                                    # No recognizable button found, try to complete anyway
-                                    logger.warning("No next/submit button found, attempting to close dialog")
-                                    application_complete = True
-                                
-                                # Handle any popups
-                                self._close_popup()
-                            
-                            # Record the successful application
-                            application_record = {
-                                "job_id": job_id,               # the job's unique ID
-                                "jobTitle": job_title_text,     # the job title (for example, "Software Engineer")
-                                "company": company_name,        # the company name
-                                "status": "Applied",            # the status, e.g., "Applied"
-                                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            }
-                            
-                            applied_jobs.append(application_record)
-                            
-                            if status_callback:
-                                await status_callback(f"Successfully applied to {job_title_text} at {company_name}")
-                        
-                        except TimeoutException:
-                            logger.info(f"No Easy Apply button found for job: {job_title_text}")
-                            continue
-                        
-                        except Exception as e:
-                            logger.warning(f"Error applying to job {job_title_text}: {str(e)}")
-                            continue
+                    if status_callback:
+                        await status_callback(f"Filling out application form (page {form_page}) for {job_title_text}")
                     
-                    except Exception as e:
-                        logger.warning(f"Error processing job card: {str(e)}")
-                        continue
-                
-                # If we haven't reached the limit yet, try to load more jobs
-                if len(applied_jobs) < limit:
-                    # Scroll down to load more jobs
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    self._random_delay(3, 5)
+                    # Fill all form components
+                    await self._fill_form_page()
+                    self._upload_resume()
                     
-                    # Click "Show more jobs" button if available
-                    try:
-                        show_more = self.driver.find_element(By.CSS_SELECTOR, ".infinite-scroller__show-more-button")
-                        if show_more.is_displayed():
-                            show_more.click()
-                            self._random_delay(3, 5)
-                    except:
-                        # If we can't find more jobs, break the loop
-                        if len(job_cards) == len(seen_job_ids):
-                            logger.info("No more jobs to process")
-                            break
-            
-            return {"jobs": applied_jobs}
+                    # Check for Next/Review/Submit buttons
+                    page_fingerprint = self.pacer.fingerprint(EASY_APPLY_MODAL)
+                    if self._click_button(["Submit application", "Submit"]):
+                        application_complete = True
+                        # The application is sent; a stop now must not lose its record, so it
+                        # takes effect at the next job instead
+                        with self.pacer.uncancellable():
+                            self.pacer.jitter("after_submit")
+                            self._close_popup()
+                    elif self._click_button(["Review", "Next", "Continue"]):
+                        # Wait for the next page to replace the current one
+                        self.pacer.content_changed(EASY_APPLY_MODAL, page_fingerprint, "next_page")
+                        self.pacer.jitter("next_page")
+                        form_page += 1
+                        self._close_popup()
+                    else:
+                        # No recognizable button found, try to complete anyway
+                        logger.warning("No next/submit button found, attempting to close dialog")
+                        application_complete = True
+                        self._close_popup()
+                    
+                    self.timer.record("form_page", time.monotonic() - page_started)
+                
+                # Record the successful application
+                application_record = {
+                    "job_id": job_id,               # the job's unique ID
+                    "jobTitle": job_title_text,     # the job title (for example, "Software Engineer")
+                    "company": company_name,        # the company name
+                    "status": "Applied",            # the status, e.g., "Applied"
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                
+                self.job_index.add(job_id, "applied")
+                APPLICATIONS.inc()
+                
+                if status_callback:
+                    await status_callback(f"Successfully applied to {job_title_text} at {company_name}")
+                
+                return application_record
+            
+            except TimeoutException:
+                # A slow render or an interstitial proves nothing about the job, so it is only
+                # skipped for this run; "rejected" is kept for jobs confirmed not to be Easy Apply
+                logger.info(f"No Easy Apply button found for job, skipping it this run: {job_title_text}")
+                SKIPS.labels("no_apply_button").inc()
+                return None
+            
+            except Exception as e:
+                logger.warning(f"Error applying to job {job_title_text}: {str(e)}")
+                SKIPS.labels("error").inc()
+                ERRORS.labels("job").inc()
+                return None
         
         except Exception as e:
-            logger.error(f"Error in job application process: {str(e)}")
-            raise
+            logger.warning(f"Error processing job card: {str(e)}")
+            SKIPS.labels("error").inc()
+            ERRORS.labels("job").inc()
+            return None
+        
+        finally:
+            self.timer.record("job", time.monotonic() - started)
+            self.request_stats.collect(self.driver)
+    
+    # Parallel mode
+    
+    def _open_worker_sessions(self, count):
+        """Borrow up to count spare browsers and log them in with this session's cookies"""
+        cookies = self.driver.get_cookies()
+        workers = []
+        for _ in range(count):
+            # Only browsers other runs can spare; the rest of the run makes do with fewer sessions
+            driver = self.driver_source.acquire_spare()
+            if driver is None:
+                logger.info(f"Running with {len(workers)} parallel sessions, no more spare browsers")
+                break
+            
+            try:
+                self.request_stats.discard(driver)
+                # Cookies can only be set for the domain the browser is on
+                driver.get(f"{LINKEDIN_BASE_URL}/")
+                for cookie in cookies:
+                    driver.add_cookie({key: cookie[key] for key in COOKIE_FIELDS if key in cookie})
+                workers.append(self._worker_clone(driver))
+            except Exception as e:
+                logger.warning(f"Could not prepare parallel session: {str(e)}")
+                self.driver_source.release(driver)
+        return workers
+    
+    def _worker_clone(self, driver):
+        """An automator for one parallel session: own browser, pacer and stats, shared caches and index"""
+        worker = copy.copy(self)
+        worker.driver = driver
+        worker.owns_driver = False
+        worker.pacer = Pacer(self.pacer.profile.name, self.cancel_event)
+        worker.pacer.bind(driver)
+        worker.quick_answers = QuickAnswers(self.profile_data)
+        return worker
+    
+    def _apply_in_worker_thread(self, job, slot, reporter):
+        """Runs on a worker thread: apply to one job on this worker's browser"""
+        async def report(message):
+            reporter.post(slot, message)
         
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self._apply_to_job(job, report))
+        except AutomationCancelled:
+            return None
         finally:
-            # Clean up the WebDriver
-            if self.driver:
-                self.driver.quit()
\ No newline at end of file
+            reporter.finish(slot)
+            loop.close()
+    
+    async def _apply_in_parallel(self, limit, applied_jobs, seen_job_ids, status_callback, sessions):
+        """Fan ranked jobs out to several logged-in browsers, keeping status messages in job order"""
+        workers = self._open_worker_sessions(sessions)
+        if not workers:
+            logger.info("No parallel sessions available, applying sequentially")
+            await self._apply_from_search_results(limit, applied_jobs, seen_job_ids, status_callback)
+            return
+        
+        loop = asyncio.get_running_loop()
+        reporter = OrderedStatusReporter(status_callback, loop)
+        idle_workers = asyncio.Queue()
+        for worker in workers:
+            idle_workers.put_nowait(worker)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(workers), thread_name_prefix=f"apply-{self.username}")
+        in_flight = set()
+        
+        async def run_job(worker, job, slot):
+            try:
+                record = await loop.run_in_executor(executor, worker._apply_in_worker_thread, job, slot, reporter)
+                if record and len(applied_jobs) < limit:
+                    applied_jobs.append(record)
+                else:
+                    record = None
+                # A job interrupted by a stop is left in the queue for a resumed run
+                if record or not self.cancel_event.is_set():
+                    self._record_job_result(job, record)
+            finally:
+                idle_workers.put_nowait(worker)
+        
+        slot = 0
+        try:
+            while len(applied_jobs) < limit:
+                for job in self._next_ranked_jobs(seen_job_ids):
+                    # Only start as many jobs as could still be needed to reach the limit
+                    while in_flight and len(applied_jobs) + len(in_flight) >= limit:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    if len(applied_jobs) >= limit:
+                        break
+                    
+                    self._check_cancelled()
+                    
+                    worker = await idle_workers.get()
+                    # The card element belongs to this browser; workers open the job page by id
+                    worker_job = {key: value for key, value in job.items() if key != "element"}
+                    in_flight.add(asyncio.create_task(run_job(worker, worker_job, slot)))
+                    in_flight = {task for task in in_flight if not task.done()}
+                    slot += 1
+                
+                # Let running applications finish before deciding whether more results are needed
+                if in_flight:
+                    await asyncio.wait(in_flight)
+                    in_flight = set()
+                
+                self._check_cancelled()
+                if len(applied_jobs) < limit and not self._load_more_results():
+                    break
+        finally:
+            if in_flight:
+                await asyncio.wait(in_flight)
+            await reporter.close()
+            executor.shutdown(wait=True)
+            for worker in workers:
+                self.pacer.merge(worker.pacer)
+                self.quick_answers.hits += worker.quick_answers.hits
+                self.quick_answers.misses += worker.quick_answers.misses
+                self.driver_source.release(worker.driver)
+
+
+class OrderedStatusReporter:
+    """Relays status messages from parallel workers in job order
+
+    Messages for the oldest unfinished job stream straight through; messages
+    for later jobs are held until every earlier job has finished.
+    """
+    
+    def __init__(self, status_callback, loop):
+        self.status_callback = status_callback
+        self.loop = loop
+        self.cursor = 0
+        self.pending: Dict[int, List[str]] = {}
+        self.finished = set()
+        self.queue = asyncio.Queue()
+        self.task = loop.create_task(self._relay())
+    
+    def post(self, slot, message):
+        """Called from worker threads"""
+        self.loop.call_soon_threadsafe(self._add, slot, message)
+    
+    def finish(self, slot):
+        """Called from worker threads once a job is done"""
+        self.loop.call_soon_threadsafe(self._finish, slot)
+    
+    def _add(self, slot, message):
+        if slot == self.cursor:
+            self.queue.put_nowait(message)
+        else:
+            self.pending.setdefault(slot, []).append(message)
+    
+    def _finish(self, slot):
+        self.finished.add(slot)
+        while self.cursor in self.finished:
+            self.cursor += 1
+            for message in self.pending.pop(self.cursor, []):
+                self.queue.put_nowait(message)
+    
+    async def _relay(self):
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                return
+            if self.status_callback:
+                await self.status_callback(message)
+    
+    async def close(self):
+        # Let finish() calls scheduled by the workers run before flushing what is left
+        await asyncio.sleep(0)
+        for slot in sorted(self.pending):
+            for message in self.pending.pop(slot):
+                self.queue.put_nowait(message)
+        self.queue.put_nowait(None)
+        await self.task
@@ -0,0 +1,149 @@
+# answer_cache.py
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Set
+
+from services.storage import Storage, get_storage
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MEMORY_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_MEMORY_SIZE", "512"))
+DISK_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_DISK_SIZE", "5000"))
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a form question so trivially different phrasings share a key"""
+    question = (question or "").lower()
+    question = re.sub(r"[^\w\s]", " ", question)
+    return re.sub(r"\s+", " ", question).strip()
+
+
+def hash_text(text: Optional[str]) -> str:
+    """Return a short content hash used to tie cache entries to a resume/profile"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+def profile_fingerprint(cv_text: Optional[str], profile_data: Optional[Dict[str, Any]]) -> str:
+    """Fingerprint of everything an answer can depend on"""
+    # LinkedIn credentials never influence answers, so changing them keeps the cache
+    relevant = {k: v for k, v in (profile_data or {}).items() if k not in ("linkedin_email", "linkedin_password")}
+    profile_json = json.dumps(relevant, sort_keys=True, default=str)
+    return hash_text(hash_text(cv_text) + profile_json)
+
+
+class AnswerCache:
+    """Per-user answer cache with an in-memory LRU layer and an on-disk store"""
+
+    def __init__(self, username: str, fingerprint: str, cv_hash: str, storage: Optional[Storage] = None,
+                 memory_size: int = MEMORY_CACHE_SIZE, disk_size: int = DISK_CACHE_SIZE):
+        self.username = username
+        self.storage = storage or get_storage()
+        self.fingerprint = fingerprint
+        self.cv_hash = cv_hash
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._disk: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load the on-disk store, dropping it if the resume or profile changed"""
+        try:
+            self._disk = self.storage.load_answer_cache(self.username, self.fingerprint)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable answer cache for {self.username}: {str(e)}")
+
+    def make_key(self, question: str, options: Optional[List[str]] = None) -> str:
+        """Build the cache key from the normalized question, options and CV hash"""
+        option_part = "|".join(normalize_question(o) for o in options) if options else ""
+        raw = f"{normalize_question(question)}\x1f{option_part}\x1f{self.cv_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, question: str, options: Optional[List[str]] = None) -> Optional[str]:
+        """Return a cached answer or None"""
+        key = self.make_key(question, options)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            entry = self._disk.get(key)
+            if entry is not None:
+                entry["last_used"] = time.time()
+                self._dirty.add(key)
+                self._remember(key, entry["answer"])
+                self.hits += 1
+                return entry["answer"]
+
+            self.misses += 1
+            return None
+
+    def put(self, question: str, answer: str, options: Optional[List[str]] = None):
+        """Store an answer in both layers"""
+        key = self.make_key(question, options)
+        with self._lock:
+            self._remember(key, answer)
+            self._disk[key] = {"question": question, "answer": answer, "last_used": time.time()}
+            self._dirty.add(key)
+
+    def _remember(self, key: str, answer: str):
+        """Insert into the in-memory LRU layer, evicting the oldest entry"""
+        self._memory[key] = answer
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def flush(self):
+        """Persist changed entries; the store evicts least recently used entries past the cap"""
+        with self._lock:
+            if not self._dirty:
+                return
+            changed = {key: self._disk[key] for key in self._dirty if key in self._disk}
+            try:
+                self.storage.save_answers(self.username, self.fingerprint, changed, self.disk_size)
+                self._dirty.clear()
+            except Exception as e:
+                logger.warning(f"Failed to write answer cache for {self.username}: {str(e)}")
+                return
+
+            # Mirror the store's eviction so the loaded copy stays bounded too
+            if len(self._disk) > self.disk_size:
+                oldest = sorted(self._disk, key=lambda k: self._disk[k]["last_used"])
+                for stale_key in oldest[:len(self._disk) - self.disk_size]:
+                    del self._disk[stale_key]
+
+
+# Process-wide registry so the in-memory layer survives across automation runs
+_caches: Dict[str, AnswerCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_answer_cache(username: str, cv_text: Optional[str],
+                     profile_data: Optional[Dict[str, Any]]) -> AnswerCache:
+    """Return the shared cache for a user, rebuilding it if the resume or profile changed"""
+    fingerprint = profile_fingerprint(cv_text, profile_data)
+    with _caches_lock:
+        cache = _caches.get(username)
+        if cache is None or cache.fingerprint != fingerprint:
+            cache = AnswerCache(username, fingerprint, hash_text(cv_text))
+            _caches[username] = cache
+        return cache
+
+
+def invalidate_answer_cache(username: str):
+    """Drop both cache layers for a user, e.g. after a profile or resume update"""
+    with _caches_lock:
+        _caches.pop(username, None)
+    get_storage().clear_answer_cache(username)
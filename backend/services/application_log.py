@@ -0,0 +1,176 @@
+# application_log.py
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from services.storage import get_storage
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+APPLICATION_LOG_FILENAME = "applications.jsonl"
+COMPACTING_SUFFIX = ".compacting"
+# fsync after this many records or this many seconds, whichever comes first
+FSYNC_EVERY = int(os.getenv("APPLICATION_LOG_FSYNC_EVERY", "5"))
+FSYNC_INTERVAL = float(os.getenv("APPLICATION_LOG_FSYNC_INTERVAL", "2"))
+# How often the background compactor folds logs into the database
+COMPACT_INTERVAL = float(os.getenv("APPLICATION_LOG_COMPACT_INTERVAL", "60"))
+
+
+class ApplicationLog:
+    """Per-user append-only JSONL log of submitted applications
+
+    Each record is appended the moment the application is submitted, so a crash
+    loses at most the records written since the last fsync (and only on power
+    loss; the OS still holds them if just the process dies). compact() folds the
+    log into SQLite: the file is renamed aside under the lock, so appends carry
+    on into a fresh file while the renamed one is imported and deleted.
+    """
+
+    def __init__(self, username: str, user_dir: str):
+        self.username = username
+        self.path = os.path.join(user_dir, APPLICATION_LOG_FILENAME)
+        self.compacting_path = self.path + COMPACTING_SUFFIX
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a")
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= FSYNC_EVERY or time.monotonic() - self._last_sync >= FSYNC_INTERVAL:
+                self._sync()
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Force everything appended so far to disk"""
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _rotate(self) -> bool:
+        """Move the live log aside for import; False if there is nothing in it"""
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+                return False
+            os.replace(self.path, self.compacting_path)
+            return True
+
+    def _read(self, path: str) -> List[Dict[str, Any]]:
+        records = []
+        with open(path, "r") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A torn final line from a crash mid-write
+                    logger.warning(f"Skipping unreadable line {number} in {path}")
+        return records
+
+    def compact(self) -> int:
+        """Fold logged records into the database; returns how many were imported"""
+        imported = 0
+        with self._compact_lock:
+            while True:
+                # A file left aside by an interrupted compaction goes first
+                if not os.path.exists(self.compacting_path) and not self._rotate():
+                    break
+                records = self._read(self.compacting_path)
+                # Skips rows already imported, so a crash between commit and delete is harmless
+                imported += get_storage().import_applications(self.username, records)
+                os.remove(self.compacting_path)
+        if imported:
+            logger.info(f"Compacted {imported} applications for {self.username} into the database")
+        return imported
+
+    def has_pending(self) -> bool:
+        return any(
+            os.path.exists(path) and os.path.getsize(path) > 0
+            for path in (self.path, self.compacting_path)
+        )
+
+
+# Process-wide registry so the automation thread and the compactor share one writer per user
+_logs: Dict[str, ApplicationLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_application_log(username: str, user_dir: str) -> ApplicationLog:
+    with _logs_lock:
+        log = _logs.get(username)
+        if log is None:
+            log = ApplicationLog(username, user_dir)
+            _logs[username] = log
+        return log
+
+
+class ApplicationLogCompactor:
+    """Background thread folding every user's application log into the database"""
+
+    def __init__(self, base_dir: str, interval: float = COMPACT_INTERVAL):
+        self.base_dir = base_dir
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def compact_all(self):
+        try:
+            usernames = os.listdir(self.base_dir)
+        except OSError as e:
+            logger.warning(f"Could not list user directories for compaction: {str(e)}")
+            return
+        for username in usernames:
+            user_dir = os.path.join(self.base_dir, username)
+            if not os.path.isdir(user_dir):
+                continue
+            log = get_application_log(username, user_dir)
+            if not log.has_pending():
+                continue
+            try:
+                log.compact()
+            except Exception as e:
+                logger.error(f"Error compacting application log for {username}: {str(e)}")
+
+    def _run(self):
+        # Logs left by a previous process are folded in right away
+        self.compact_all()
+        while not self._stop.wait(self.interval):
+            self.compact_all()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="application-log-compactor", daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self.compact_all()
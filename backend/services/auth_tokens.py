@@ -0,0 +1,86 @@
+# auth_tokens.py
+import os
+import hmac
+import time
+import base64
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Tokens are signed with this secret; without SESSION_SECRET they only survive until restart
+SESSION_SECRET = (os.getenv("SESSION_SECRET") or secrets.token_hex(32)).encode()
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))
+CREDENTIAL_CACHE_TTL = int(os.getenv("CREDENTIAL_CACHE_TTL", "60"))
+CREDENTIAL_CACHE_SIZE = int(os.getenv("CREDENTIAL_CACHE_SIZE", "1024"))
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(SESSION_SECRET, payload, hashlib.sha256).digest()
+
+
+def issue_session_token(username: str, ttl: int = SESSION_TTL) -> Tuple[str, int]:
+    """Create a signed token for a user, returning it with its expiry timestamp"""
+    expires_at = int(time.time()) + ttl
+    payload = f"{expires_at}:{username}".encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}", expires_at
+
+
+def verify_session_token(token: str) -> Optional[str]:
+    """Return the username for a valid, unexpired token, or None"""
+    try:
+        encoded_payload, encoded_signature = token.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_sign(payload), _b64decode(encoded_signature)):
+            return None
+        expires_at, username = payload.decode().split(":", 1)
+        if int(expires_at) < time.time():
+            return None
+        return username
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class CredentialCache:
+    """Short-lived memory of recently verified username/password pairs
+
+    Passwords are never stored; entries are keyed on an HMAC of the pair so a
+    cache hit skips bcrypt without keeping anything reversible in memory.
+    """
+
+    def __init__(self, ttl: int = CREDENTIAL_CACHE_TTL, max_entries: int = CREDENTIAL_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, username: str, password: str) -> bytes:
+        return _sign(f"{username}\x00{password}".encode())
+
+    def check(self, username: str, password: str) -> bool:
+        key = self._key(username, password)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at < time.time():
+                del self._entries[key]
+                return False
+            return True
+
+    def remember(self, username: str, password: str):
+        key = self._key(username, password)
+        with self._lock:
+            self._entries[key] = time.time() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
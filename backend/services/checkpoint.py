@@ -0,0 +1,107 @@
+# checkpoint.py
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "run_checkpoint.json"
+# Job record fields kept for queued jobs; the card element only exists in the live browser
+QUEUED_JOB_FIELDS = ("job_id", "title", "company", "location", "easy_apply")
+
+
+class RunCheckpoint:
+    """On-disk state of a user's automation run, rewritten atomically after every job
+
+    Holds the search parameters, the ranked jobs harvested but not yet processed,
+    the ids already processed, the applications submitted so far and the search
+    results offset below which every card has been handled. A resumed run starts
+    from here instead of from scratch.
+    """
+
+    def __init__(self, user_dir: str):
+        self.path = os.path.join(user_dir, CHECKPOINT_FILENAME)
+        self.params: Dict[str, Any] = {}
+        self.offset = 0
+        self.queue: List[Dict[str, Any]] = []
+        self.processed: List[str] = []
+        self.applied: List[Dict[str, Any]] = []
+        self.started_at: Optional[str] = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> bool:
+        """Read the saved state; False if there is none or it can't be read"""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable run checkpoint {self.path}: {str(e)}")
+            return False
+        self.params = data.get("params", {})
+        self.offset = data.get("offset", 0)
+        self.queue = data.get("queue", [])
+        self.processed = data.get("processed", [])
+        self.applied = data.get("applied", [])
+        self.started_at = data.get("startedAt")
+        return True
+
+    def begin(self, params: Dict[str, Any]):
+        """Start a fresh checkpoint for a new run, replacing any earlier one"""
+        self.params = params
+        self.offset = 0
+        self.queue, self.processed, self.applied = [], [], []
+        self.started_at = datetime.now().isoformat()
+        self.save()
+
+    def set_queue(self, jobs: List[Dict[str, Any]]):
+        """Record the ranked batch about to be processed"""
+        self.queue = [{key: job.get(key) for key in QUEUED_JOB_FIELDS} for job in jobs]
+        self.save()
+
+    def job_done(self, job_id: str, record: Optional[Dict[str, Any]] = None):
+        """Mark a job processed, with its application record if one was submitted"""
+        self.queue = [job for job in self.queue if job["job_id"] != job_id]
+        self.processed.append(job_id)
+        if record:
+            self.applied.append(record)
+        self.save()
+
+    def set_offset(self, offset: int):
+        self.offset = offset
+        self.save()
+
+    def save(self):
+        data = {
+            "params": self.params,
+            "offset": self.offset,
+            "queue": self.queue,
+            "processed": self.processed,
+            "applied": self.applied,
+            "startedAt": self.started_at,
+            "updatedAt": datetime.now().isoformat()
+        }
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+                # The rename must not land before the data does, or a crash leaves an empty checkpoint
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save run checkpoint {self.path}: {str(e)}")
+
+    def delete(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove run checkpoint {self.path}: {str(e)}")
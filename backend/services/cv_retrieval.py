@@ -0,0 +1,144 @@
+# cv_retrieval.py
+import os
+import math
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from services.job_ranking import tokenize
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CV_TOP_K = int(os.getenv("CV_TOP_K", "3"))               # Chunks sent per question
+CV_CHUNK_WORDS = int(os.getenv("CV_CHUNK_WORDS", "120"))  # Upper bound on chunk length
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+SECTION_HEADINGS = {
+    "summary", "profile", "objective", "about", "experience", "work experience", "professional experience",
+    "employment", "employment history", "education", "skills", "technical skills", "projects",
+    "certifications", "certificates", "languages", "awards", "publications", "interests", "references",
+    "volunteering", "achievements", "contact", "personal details"
+}
+
+# Profile fields worth sending with every question; credentials are never included
+SUMMARY_FIELDS = [
+    ("full_name", "Name"),
+    ("phone", "Phone"),
+    ("dob", "Date of birth"),
+    ("job_title_preference", "Preferred job title"),
+    ("experience_years", "Years of experience"),
+    ("salary_range", "Expected salary"),
+    ("skills", "Skills"),
+    ("linkedin_url", "LinkedIn"),
+    ("github_url", "GitHub"),
+    ("portfolio_url", "Portfolio"),
+]
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough GPT token count (about four characters per token for English text)"""
+    return (len(text or "") + 3) // 4
+
+
+def _is_heading(line: str) -> bool:
+    stripped = line.strip().rstrip(":").strip()
+    if not stripped or len(stripped.split()) > 4:
+        return False
+    return stripped.lower() in SECTION_HEADINGS or (stripped.isupper() and len(stripped) > 2)
+
+
+def split_cv(cv_text: str, max_words: int = CV_CHUNK_WORDS) -> List[str]:
+    """Split a CV into section-aware chunks of at most max_words words
+
+    Each chunk is prefixed with its section heading so a retrieved chunk still
+    says what it is about.
+    """
+    sections: List[List[str]] = []
+    heading = ""
+    for line in (cv_text or "").splitlines():
+        if _is_heading(line):
+            heading = line.strip().rstrip(":")
+            sections.append([heading])
+        elif line.strip():
+            if not sections:
+                sections.append([heading])
+            sections[-1].append(line.strip())
+
+    chunks = []
+    for section in sections:
+        title, lines = section[0], section[1:]
+        current: List[str] = []
+        count = 0
+        for line in lines:
+            words = len(line.split())
+            if current and count + words > max_words:
+                chunks.append("\n".join(([title] if title else []) + current))
+                current, count = [], 0
+            current.append(line)
+            count += words
+        if current:
+            chunks.append("\n".join(([title] if title else []) + current))
+    return chunks
+
+
+def profile_summary(profile_data: Optional[Dict[str, Any]]) -> str:
+    """Compact key/value summary of the profile form"""
+    profile_data = profile_data or {}
+    return "\n".join(
+        f"{label}: {profile_data[field]}" for field, label in SUMMARY_FIELDS
+        if profile_data.get(field) not in (None, "")
+    )
+
+
+class CVRetriever:
+    """BM25 index over CV chunks, built once per automation run"""
+
+    def __init__(self, cv_text: str, profile_data: Optional[Dict[str, Any]] = None, top_k: int = CV_TOP_K):
+        self.cv_text = cv_text or ""
+        self.top_k = top_k
+        self.summary = profile_summary(profile_data)
+        self.chunks = split_cv(self.cv_text)
+        self._term_counts = [Counter(tokenize(chunk)) for chunk in self.chunks]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0
+        document_frequency = Counter(term for counts in self._term_counts for term in counts)
+        total = len(self.chunks)
+        self._idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+        self.full_tokens = estimate_tokens(self.cv_text)
+        logger.info(f"Indexed CV into {len(self.chunks)} chunks (~{self.full_tokens} tokens)")
+
+    def _score(self, query_terms: List[str], index: int) -> float:
+        counts = self._term_counts[index]
+        length_norm = 1 - BM25_B + BM25_B * (self._lengths[index] / (self._average_length or 1))
+        score = 0.0
+        for term in query_terms:
+            tf = counts.get(term)
+            if tf:
+                score += self._idf[term] * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+        return score
+
+    def retrieve(self, query: str, k: Optional[int] = None) -> List[str]:
+        """Top-k chunks for a query, returned in CV order"""
+        k = k or self.top_k
+        if len(self.chunks) <= k:
+            return list(self.chunks)
+
+        query_terms = list(set(tokenize(query)))
+        scored = [(self._score(query_terms, index), index) for index in range(len(self.chunks))]
+        best = [index for score, index in sorted(scored, key=lambda item: -item[0])[:k] if score > 0]
+        if not best:
+            # Nothing matched lexically; the top of the CV usually carries the summary
+            best = [0]
+        return [self.chunks[index] for index in sorted(best)]
+
+    def context(self, query: str, k: Optional[int] = None) -> str:
+        """Profile summary plus the CV chunks most relevant to the query"""
+        excerpts = "\n\n".join(self.retrieve(query, k))
+        return f"{self.summary}\n\n{excerpts}".strip()
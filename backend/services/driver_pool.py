@@ -0,0 +1,423 @@
+# driver_pool.py
+import os
+import time
+import random
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import undetected_chromedriver as uc
+
+from services.request_filter import REQUEST_BLOCKING, enable_request_log, install_request_filter
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))          # Warm browsers kept idle
+DRIVER_POOL_MAX = int(os.getenv("DRIVER_POOL_MAX", "4"))            # Hard cap on live browsers
+DRIVER_MAX_USES = int(os.getenv("DRIVER_MAX_USES", "20"))           # Recycle after this many checkouts
+DRIVER_MAX_AGE = int(os.getenv("DRIVER_MAX_AGE", "3600"))           # Recycle after this many seconds
+DRIVER_ACQUIRE_TIMEOUT = int(os.getenv("DRIVER_ACQUIRE_TIMEOUT", "300"))
+# Give each user a Chrome profile on disk so their LinkedIn session survives between runs
+PERSISTENT_PROFILES = os.getenv("PERSISTENT_BROWSER_PROFILES", "true").lower() in ("1", "true", "yes")
+PROFILE_ROOT = os.getenv("BROWSER_PROFILE_ROOT", "../users")
+PROFILE_DIRNAME = "chrome_profile"
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+]
+
+# How browsers render, chosen per deployment:
+#   window   - full visible browser, maximized
+#   headless - full rendering without a window
+#   lite     - headless with images, media and web fonts off, a small window, a capped disk
+#              cache and fewer renderer processes; the cheapest per concurrent run
+# When BROWSER_MODE is unset, the caller's headless flag picks headless or window.
+BROWSER_MODES = ("window", "headless", "lite")
+BROWSER_MODE = os.getenv("BROWSER_MODE", "").lower() or None
+BROWSER_WINDOW_SIZE = os.getenv("BROWSER_WINDOW_SIZE", "1280,900")   # Wide enough for the two-pane jobs layout
+BROWSER_DISK_CACHE_MB = int(os.getenv("BROWSER_DISK_CACHE_MB", "32"))
+BROWSER_RENDERER_LIMIT = int(os.getenv("BROWSER_RENDERER_LIMIT", "2"))
+
+# Content settings for lite mode; 2 means blocked
+LITE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+LITE_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--autoplay-policy=user-gesture-required",     # Videos never start, so never download
+    "--mute-audio",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+]
+
+# Origins whose storage is wiped when a browser changes hands
+CLEARED_ORIGINS = ["https://www.linkedin.com", "https://linkedin.com"]
+
+
+def profile_dir(owner: str) -> str:
+    """Chrome user-data-dir for a user, kept next to their uploads"""
+    return os.path.abspath(os.path.join(PROFILE_ROOT, owner, PROFILE_DIRNAME))
+
+
+def resolve_browser_mode(headless: bool = True, mode: Optional[str] = BROWSER_MODE) -> str:
+    """Rendering mode for a new browser: the configured mode if set, else what headless asks for"""
+    if mode is None:
+        return "headless" if headless else "window"
+    if mode not in BROWSER_MODES:
+        raise ValueError(f"Unknown BROWSER_MODE {mode!r}, expected one of: {', '.join(BROWSER_MODES)}")
+    return mode
+
+
+def create_driver(headless: bool = True, user_data_dir: Optional[str] = None, mode: Optional[str] = BROWSER_MODE):
+    """Launch and configure a new Chrome WebDriver, optionally on a persistent profile directory"""
+    effective_mode = resolve_browser_mode(headless, mode)
+    options = uc.ChromeOptions()
+
+    windowed = effective_mode == "window"
+    if not windowed:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={BROWSER_WINDOW_SIZE}")
+
+    if effective_mode == "lite":
+        for argument in LITE_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_argument(f"--disk-cache-size={BROWSER_DISK_CACHE_MB * 1024 * 1024}")
+        options.add_argument(f"--renderer-process-limit={BROWSER_RENDERER_LIMIT}")
+        options.add_experimental_option("prefs", LITE_PREFS)
+
+    # Add anti-detection options
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-gpu")
+
+    # Add random user agent
+    options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
+
+    if REQUEST_BLOCKING:
+        enable_request_log(options)
+
+    # Initialize the driver with undetected_chromedriver
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        driver = uc.Chrome(options=options, user_data_dir=user_data_dir)
+    else:
+        driver = uc.Chrome(options=options)
+    if windowed:
+        driver.maximize_window()
+    if REQUEST_BLOCKING:
+        try:
+            install_request_filter(driver)
+        except Exception as e:
+            logger.warning(f"Could not install request filter: {str(e)}")
+    profile_note = f" with profile {user_data_dir}" if user_data_dir else ""
+    logger.info(f"WebDriver initialized successfully ({effective_mode} mode){profile_note}")
+    return driver
+
+
+class PooledDriver:
+    """Bookkeeping for a browser owned by the pool
+
+    owner is the user whose persistent profile the browser runs on, or None for
+    an anonymous browser that is wiped between users.
+    """
+
+    def __init__(self, driver, owner: Optional[str] = None):
+        self.driver = driver
+        self.owner = owner
+        self.created_at = time.time()
+        self.uses = 0
+
+
+class DriverPool:
+    """Pool of pre-warmed Chrome browsers shared across automation runs"""
+
+    def __init__(self, size: int = DRIVER_POOL_SIZE, max_size: int = DRIVER_POOL_MAX,
+                 max_uses: int = DRIVER_MAX_USES, max_age: int = DRIVER_MAX_AGE, headless: bool = True,
+                 persistent_profiles: bool = PERSISTENT_PROFILES, reserve: int = 0):
+        self.size = min(size, max_size)
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.headless = headless
+        self.persistent_profiles = persistent_profiles
+        # Browsers spare checkouts must leave obtainable, so other runs can always start
+        self.reserve = reserve
+        self._idle: List[PooledDriver] = []
+        self._in_use: Dict[int, PooledDriver] = {}
+        self._pending = 0  # Browsers currently being launched
+        self._warming = 0  # Of those, anonymous ones launched by warm()
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _live_count(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._pending
+
+    def _launch(self, owner: Optional[str] = None) -> Optional[PooledDriver]:
+        """Start a browser outside the lock; the caller must have reserved a slot"""
+        try:
+            user_data_dir = profile_dir(owner) if owner else None
+            return PooledDriver(create_driver(self.headless, user_data_dir), owner)
+        except Exception as e:
+            logger.error(f"Error initializing pooled WebDriver: {str(e)}")
+            return None
+        finally:
+            with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _anonymous_idle(self) -> int:
+        return sum(1 for pooled in self._idle if pooled.owner is None)
+
+    def warm(self):
+        """Launch anonymous browsers until the configured number of them is idle
+
+        Idle browsers on a user's profile don't count: they only serve that user,
+        while a warm anonymous one can serve anyone.
+        """
+        while True:
+            evicted = None
+            with self._condition:
+                if self._closed or self._anonymous_idle() + self._warming >= self.size:
+                    return
+                if self._live_count() >= self.max_size:
+                    # At the cap, an idle profile browser gives way to a warm one anyone can use
+                    evicted = next((pooled for pooled in self._idle if pooled.owner is not None), None)
+                    if evicted is None:
+                        return
+                    self._idle.remove(evicted)
+                self._pending += 1
+                self._warming += 1
+
+            if evicted:
+                self._quit(evicted)
+
+            try:
+                pooled = self._launch()
+            finally:
+                with self._condition:
+                    self._warming -= 1
+            if pooled is None:
+                return
+            with self._condition:
+                if self._closed:
+                    self._quit(pooled)
+                    return
+                self._idle.append(pooled)
+                self._condition.notify_all()
+
+    def _warm_in_background(self):
+        threading.Thread(target=self.warm, daemon=True).start()
+
+    def _is_expired(self, pooled: PooledDriver) -> bool:
+        return pooled.uses >= self.max_uses or time.time() - pooled.created_at > self.max_age
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """Cheap liveness probe for a browser that has been sitting idle"""
+        try:
+            pooled.driver.current_window_handle
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _reset_context(self, pooled: PooledDriver):
+        """Give a browser a clean cookie and storage context before a new user gets it
+
+        Browsers on a persistent profile only go back to the same user, so their
+        cookies and storage are kept.
+        """
+        driver = pooled.driver
+        # Close any tabs a previous run left open
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if pooled.owner:
+            return
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in CLEARED_ORIGINS:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin,
+                "storageTypes": "local_storage,session_storage,indexeddb,websql,service_workers,cache_storage"
+            })
+        driver.get("about:blank")
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting pooled WebDriver: {str(e)}")
+
+    def _evict_idle(self) -> PooledDriver:
+        """Pick the idle browser to quit at the cap: the longest-idle profile browser, else the oldest"""
+        for index, pooled in enumerate(self._idle):
+            if pooled.owner is not None:
+                return self._idle.pop(index)
+        return self._idle.pop(0)
+
+    def _take_idle(self, owner: Optional[str]) -> Optional[PooledDriver]:
+        """Pop the idle browser running on owner's profile (or an anonymous one for None)"""
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].owner == owner:
+                return self._idle.pop(index)
+        return None
+
+    def _owner_in_use(self, owner: str) -> bool:
+        return any(pooled.owner == owner for pooled in self._in_use.values())
+
+    def acquire(self, timeout: float = DRIVER_ACQUIRE_TIMEOUT, owner: Optional[str] = None):
+        """Check out a healthy browser, launching one if under the cap
+
+        With an owner, a browser already open on that user's persistent profile is
+        reused as is, keeping their session. Otherwise a warm anonymous browser is
+        preferred over a cold launch; it starts from a clean context and the run
+        logs in with the user's saved cookies. Only when neither is idle is a new
+        browser launched on the owner's profile. A profile directory can only be
+        open in one Chrome at a time, so further sessions for the same user
+        (parallel mode) always get anonymous browsers. At the cap, an idle browser
+        that doesn't fit is quit to make room rather than waiting for a busy one.
+        """
+        deadline = time.time() + timeout
+        while True:
+            pooled = None
+            launch = False
+            evicted = None
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+                wanted = owner if owner and self.persistent_profiles and not self._owner_in_use(owner) else None
+                pooled = self._take_idle(wanted)
+                if pooled is None and wanted:
+                    # The owner's browser isn't idle; a warm one is still faster than launching Chrome
+                    pooled = self._take_idle(None)
+                if pooled is None:
+                    if self._live_count() < self.max_size:
+                        launch = True
+                    elif self._idle:
+                        # Full, but an idle browser can make way
+                        evicted = self._evict_idle()
+                        launch = True
+                    else:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            raise TimeoutError("No browser available in the driver pool")
+                        self._condition.wait(remaining)
+                        continue
+                    self._pending += 1
+
+            if evicted:
+                self._quit(evicted)
+            if launch:
+                pooled = self._launch(wanted)
+                if pooled is None:
+                    raise RuntimeError("Failed to initialize WebDriver")
+            elif self._is_expired(pooled) or not self._is_healthy(pooled):
+                logger.info("Recycling stale pooled WebDriver")
+                self._quit(pooled)
+                continue
+            else:
+                try:
+                    self._reset_context(pooled)
+                except Exception as e:
+                    logger.warning(f"Error resetting pooled WebDriver, recycling it: {str(e)}")
+                    self._quit(pooled)
+                    continue
+
+            with self._condition:
+                pooled.uses += 1
+                self._in_use[id(pooled.driver)] = pooled
+            if not launch and pooled.owner is None:
+                # Replace the warm browser just handed out
+                self._warm_in_background()
+            return pooled.driver
+
+    def acquire_spare(self) -> Optional[Any]:
+        """Check out an extra anonymous browser for parallel mode, or None
+
+        Never waits and never quits another browser. A browser is only handed out
+        if, once it is gone, at least `reserve` others could still be checked out
+        (idle, or launchable under the cap), so one run's extra sessions can't
+        starve the runs waiting for their first browser.
+        """
+        while True:
+            with self._condition:
+                if self._closed:
+                    return None
+                available = len(self._idle) + self.max_size - self._live_count()
+                if available - 1 < self.reserve:
+                    return None
+                pooled = self._take_idle(None)
+                if pooled is None:
+                    if self._live_count() >= self.max_size:
+                        return None
+                    self._pending += 1
+
+            if pooled is None:
+                pooled = self._launch()
+                if pooled is None:
+                    return None
+            elif self._is_expired(pooled) or not self._is_healthy(pooled):
+                logger.info("Recycling stale pooled WebDriver")
+                self._quit(pooled)
+                continue
+            else:
+                try:
+                    self._reset_context(pooled)
+                except Exception as e:
+                    logger.warning(f"Error resetting pooled WebDriver, recycling it: {str(e)}")
+                    self._quit(pooled)
+                    continue
+
+            with self._condition:
+                pooled.uses += 1
+                self._in_use[id(pooled.driver)] = pooled
+            return pooled.driver
+
+    def owner_of(self, driver) -> Optional[str]:
+        """User whose persistent profile a checked-out browser runs on, if any"""
+        with self._condition:
+            pooled = self._in_use.get(id(driver))
+            return pooled.owner if pooled else None
+
+    def release(self, driver):
+        """Return a browser to the pool, recycling it if it is worn out or broken"""
+        with self._condition:
+            pooled = self._in_use.pop(id(driver), None)
+
+        if pooled is None:
+            return
+
+        if self._closed or self._is_expired(pooled) or not self._is_healthy(pooled):
+            self._quit(pooled)
+            with self._condition:
+                self._condition.notify_all()
+            # Top the pool back up so the next run still gets a warm browser
+            if not self._closed:
+                self._warm_in_background()
+            return
+
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify_all()
+
+    def shutdown(self):
+        """Quit every idle browser and stop handing out new ones"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
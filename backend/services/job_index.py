@@ -0,0 +1,111 @@
+# job_index.py
+import os
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional, Set
+
+from services.storage import get_storage
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "job_index.bin"
+JOURNAL_FILENAME = "job_index.journal"
+# Fold the journal into the sorted index once it holds this many ids
+JOURNAL_COMPACT_SIZE = int(os.getenv("JOB_INDEX_JOURNAL_SIZE", "500"))
+
+
+def _job_number(job_id) -> Optional[int]:
+    """LinkedIn job ids are numeric; anything else (e.g. DOM ids) is not stable enough to index"""
+    try:
+        return int(str(job_id).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class JobIndex:
+    """Per-user set of job ids already applied to or rejected, kept across runs
+
+    Known ids live in a sorted array('q') file that loads with a single read and is
+    searched with bisect. Ids learned during a run go into an in-memory set and an
+    append-only journal, which compact() folds back into the sorted file.
+    """
+
+    def __init__(self, user_dir: str, seed_ids: Optional[Iterable] = None):
+        self.index_path = os.path.join(user_dir, INDEX_FILENAME)
+        self.journal_path = os.path.join(user_dir, JOURNAL_FILENAME)
+        self._ids = array("q")
+        self._recent: Set[int] = set()
+        self._lock = threading.Lock()
+        self._load(seed_ids)
+
+    def _load(self, seed_ids: Optional[Iterable]):
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f:
+                self._ids.frombytes(f.read())
+        elif seed_ids is not None:
+            # First run with the index: start from the applications already on record
+            self._recent.update(n for n in map(_job_number, seed_ids) if n is not None)
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    # A line cut short by a crash has no newline and may hold a truncated id
+                    if not line.endswith("\n"):
+                        continue
+                    parts = line.split()
+                    number = _job_number(parts[-1]) if parts else None
+                    if number is not None:
+                        self._recent.add(number)
+
+        if len(self._recent) >= JOURNAL_COMPACT_SIZE or (self._recent and not os.path.exists(self.index_path)):
+            self.compact()
+
+    def __contains__(self, job_id) -> bool:
+        number = _job_number(job_id)
+        if number is None:
+            return False
+        if number in self._recent:
+            return True
+        position = bisect_left(self._ids, number)
+        return position < len(self._ids) and self._ids[position] == number
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._recent)
+
+    def add(self, job_id, status: str = "applied"):
+        """Record a job as applied to or rejected, persisting it immediately"""
+        number = _job_number(job_id)
+        if number is None or job_id in self:
+            return
+        with self._lock:
+            self._recent.add(number)
+            with open(self.journal_path, "a") as f:
+                f.write(f"{status} {number}\n")
+
+    def compact(self):
+        """Merge journalled ids into the sorted index file and clear the journal"""
+        with self._lock:
+            if not self._recent:
+                return
+            merged = array("q", sorted(set(self._ids).union(self._recent)))
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                merged.tofile(f)
+            os.replace(tmp_path, self.index_path)
+            # A crash before this point only replays ids the index already holds
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._ids = merged
+            self._recent.clear()
+        logger.info(f"Job index compacted: {len(self._ids)} known jobs in {self.index_path}")
+
+
+def load_job_index(username: str, user_dir: str) -> JobIndex:
+    """Open a user's job index, seeding it from stored applications the first time"""
+    seed_ids = None
+    if not os.path.exists(os.path.join(user_dir, INDEX_FILENAME)):
+        seed_ids = get_storage().get_applied_job_ids(username)
+    return JobIndex(user_dir, seed_ids)
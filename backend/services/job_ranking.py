@@ -0,0 +1,120 @@
+# job_ranking.py
+import os
+import re
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Jobs scoring below this cosine similarity are skipped without being opened. The
+# default of 0 only sorts: title matching misses synonyms ("Backend Developer" for
+# "Software Engineer") that LinkedIn's own search already matched, so a cutoff is opt-in
+DEFAULT_MIN_RELEVANCE = float(os.getenv("JOB_MIN_RELEVANCE", "0"))
+
+# Titles that usually ask for more (or less) experience than the profile has get their score scaled down
+SENIOR_TERMS = {"senior", "sr", "lead", "principal", "staff", "head", "director"}
+JUNIOR_TERMS = {"junior", "jr", "intern", "internship", "graduate", "entry", "trainee"}
+SENIOR_MIN_YEARS = 5
+JUNIOR_MAX_YEARS = 2
+SENIORITY_PENALTY = 0.5
+
+STOP_WORDS = {"a", "an", "and", "or", "the", "of", "in", "for", "to", "with", "at", "on", "m", "f", "w", "d"}
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping terms like c++, c# and node.js intact"""
+    tokens = (token.rstrip(".") for token in TOKEN_PATTERN.findall((text or "").lower()))
+    return [token for token in tokens if token and token not in STOP_WORDS]
+
+
+class JobRanker:
+    """Scores harvested job cards against a profile with TF-IDF cosine similarity"""
+
+    def __init__(self, profile_data: Dict[str, Any], search_title: str = "",
+                 min_score: float = DEFAULT_MIN_RELEVANCE):
+        self.min_score = min_score
+        # The preferred title counts twice so it outweighs a long skills list
+        preference = profile_data.get("job_title_preference") or ""
+        self.query_tokens = tokenize(" ".join([preference, preference, search_title or "", profile_data.get("skills") or ""]))
+        try:
+            self.experience_years: Optional[int] = int(profile_data.get("experience_years"))
+        except (TypeError, ValueError):
+            self.experience_years = None
+
+    def score(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """Cosine similarity between each job title and the profile query"""
+        documents = [tokenize(job.get("title", "")) for job in jobs] + [self.query_tokens]
+        vocabulary: Dict[str, int] = {}
+        rows, columns = [], []
+        for row, tokens in enumerate(documents):
+            for token in tokens:
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        if not vocabulary:
+            return np.zeros(len(jobs))
+
+        counts = np.zeros((len(documents), len(vocabulary)))
+        np.add.at(counts, (np.array(rows), np.array(columns)), 1)
+
+        # Sublinear term frequency with smoothed inverse document frequency
+        tf = np.zeros_like(counts)
+        np.log(counts, out=tf, where=counts > 0)
+        tf[counts > 0] += 1
+        df = np.count_nonzero(counts, axis=0)
+        idf = np.log((1 + len(documents)) / (1 + df)) + 1
+        weights = tf * idf
+
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        weights /= norms
+        scores = weights[:-1] @ weights[-1]
+
+        return scores * self._seniority_factors(documents[:-1])
+
+    def _seniority_factors(self, documents: List[List[str]]) -> np.ndarray:
+        factors = np.ones(len(documents))
+        if self.experience_years is None:
+            return factors
+        for index, tokens in enumerate(documents):
+            terms = set(tokens)
+            if self.experience_years < SENIOR_MIN_YEARS and terms & SENIOR_TERMS:
+                factors[index] = SENIORITY_PENALTY
+            elif self.experience_years > JUNIOR_MAX_YEARS and terms & JUNIOR_TERMS:
+                factors[index] = SENIORITY_PENALTY
+        return factors
+
+    def rank(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop non-Easy-Apply jobs and return the rest best first
+
+        Each kept job gets a "score" key. Jobs below min_score are dropped only
+        when a positive cutoff was asked for. Without a usable profile query
+        every Easy Apply job is kept in page order.
+        """
+        candidates = [job for job in jobs if job.get("easy_apply", True)]
+        if not candidates:
+            return []
+
+        if not self.query_tokens:
+            for job in candidates:
+                job["score"] = 0.0
+            return candidates
+
+        scores = self.score(candidates)
+        order = np.argsort(-scores, kind="stable")
+        ranked = []
+        for index in order:
+            if self.min_score > 0 and scores[index] < self.min_score:
+                break
+            candidates[index]["score"] = round(float(scores[index]), 3)
+            ranked.append(candidates[index])
+
+        logger.info(
+            f"Ranked {len(jobs)} jobs: {len(jobs) - len(candidates)} not Easy Apply, "
+            f"{len(candidates) - len(ranked)} below relevance {self.min_score}, {len(ranked)} kept"
+        )
+        return ranked
@@ -0,0 +1,244 @@
+# llm_client.py
+import os
+import re
+import time
+import random
+import asyncio
+import logging
+import threading
+import concurrent.futures
+from typing import Any, Dict, List, Optional
+
+import openai
+
+from services.cv_retrieval import estimate_tokens
+from services.metrics import LLM_REQUESTS, LLM_TOKENS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))          # In-flight requests per process
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))                        # Seconds per attempt
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1"))
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "30"))
+# Starting budgets; replaced by the limits the API reports in its response headers
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "40000"))
+# Output allowance added to the prompt estimate when reserving tokens
+LLM_OUTPUT_TOKENS = 300
+
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
+
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI reset durations such as "20ms", "1s" or "6m0s" into seconds"""
+    if not value:
+        return None
+    parts = DURATION_PATTERN.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously and follows the provider's rate-limit headers"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    async def acquire(self, cost: float):
+        # Requests larger than the whole budget wait for a full bucket instead of forever
+        cost = min(cost, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill()
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                await asyncio.sleep((cost - self.tokens) * 60 / self.capacity)
+
+    def update(self, limit: Optional[int], remaining: Optional[int], reset: Optional[float]):
+        """Align the local budget with what the API says is left"""
+        self._refill()
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0 and reset:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + reset)
+
+    def pause(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class LLMClient:
+    """Process-wide async OpenAI client running on its own event loop thread
+
+    Automation runs live on separate worker threads with their own loops, so
+    requests are handed to this client's loop with run_coroutine_threadsafe and
+    awaited through asyncio.wrap_future. All runs share one semaphore and one
+    pair of request/token buckets, so concurrent users queue here instead of
+    tripping 429s.
+    """
+
+    def __init__(self, max_concurrency: int = LLM_MAX_CONCURRENCY, timeout: float = LLM_TIMEOUT,
+                 max_retries: int = LLM_MAX_RETRIES):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._clients: Dict[str, Any] = {}
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self.loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                # Created on the loop that will use them
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._requests = TokenBucket(LLM_REQUESTS_PER_MINUTE)
+                self._tokens = TokenBucket(LLM_TOKENS_PER_MINUTE)
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name="llm-client", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self.loop = loop
+
+    def _client(self, api_key: Optional[str]):
+        """One AsyncOpenAI client per API key; retries are handled here, not by the SDK"""
+        key = api_key or ""
+        if key not in self._clients:
+            self._clients[key] = openai.AsyncOpenAI(api_key=api_key, timeout=self.timeout, max_retries=0)
+        return self._clients[key]
+
+    def _apply_headers(self, headers):
+        self._requests.update(
+            _header_int(headers, "x-ratelimit-limit-requests"),
+            _header_int(headers, "x-ratelimit-remaining-requests"),
+            parse_duration(headers.get("x-ratelimit-reset-requests"))
+        )
+        self._tokens.update(
+            _header_int(headers, "x-ratelimit-limit-tokens"),
+            _header_int(headers, "x-ratelimit-remaining-tokens"),
+            parse_duration(headers.get("x-ratelimit-reset-tokens"))
+        )
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with full jitter, honouring Retry-After when the API sends it"""
+        delay = random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * 2 ** attempt))
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = parse_duration(response.headers.get("retry-after"))
+            if retry_after:
+                delay = max(delay, retry_after)
+            self._apply_headers(response.headers)
+        return delay
+
+    async def _complete(self, messages: List[Dict[str, str]], model: str, api_key: Optional[str]) -> str:
+        """Runs on the client loop"""
+        cost = sum(estimate_tokens(message["content"]) for message in messages) + LLM_OUTPUT_TOKENS
+        client = self._client(api_key)
+
+        for attempt in range(self.max_retries + 1):
+            await self._requests.acquire(1)
+            await self._tokens.acquire(cost)
+            try:
+                async with self._semaphore:
+                    self.stats["requests"] += 1
+                    raw = await asyncio.wait_for(
+                        client.chat.completions.with_raw_response.create(model=model, messages=messages),
+                        timeout=self.timeout
+                    )
+                self._apply_headers(raw.headers)
+                completion = raw.parse()
+                LLM_REQUESTS.labels("ok").inc()
+                if completion.usage:
+                    LLM_TOKENS.labels("prompt").inc(completion.usage.prompt_tokens)
+                    LLM_TOKENS.labels("completion").inc(completion.usage.completion_tokens)
+                return completion.choices[0].message.content.strip()
+            except (asyncio.TimeoutError,) + RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    self.stats["failures"] += 1
+                    LLM_REQUESTS.labels("failed").inc()
+                    raise
+                delay = self._backoff(attempt, e)
+                if isinstance(e, openai.RateLimitError):
+                    # Everyone sharing the key backs off, not just this request
+                    self._requests.pause(delay)
+                self.stats["retries"] += 1
+                LLM_REQUESTS.labels("retried").inc()
+                logger.warning(
+                    f"LLM request failed ({type(e).__name__}), retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+            except Exception:
+                self.stats["failures"] += 1
+                LLM_REQUESTS.labels("failed").inc()
+                raise
+
+    def submit(self, messages: List[Dict[str, str]], model: str = OPENAI_MODEL,
+               api_key: Optional[str] = None) -> concurrent.futures.Future:
+        """Schedule a chat completion from any thread"""
+        self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._complete(messages, model, api_key), self.loop)
+
+    async def complete(self, messages: List[Dict[str, str]], model: str = OPENAI_MODEL,
+                       api_key: Optional[str] = None) -> str:
+        """Await a chat completion from any event loop without blocking it"""
+        return await asyncio.wrap_future(self.submit(messages, model, api_key))
+
+    def shutdown(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+            self.loop = None
+
+
+_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Process-wide LLM client shared by all automation runs"""
+    global _llm_client
+    with _llm_client_lock:
+        if _llm_client is None:
+            _llm_client = LLMClient()
+        return _llm_client
@@ -0,0 +1,76 @@
+# metrics.py
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from prometheus_client import Counter, Histogram, CONTENT_TYPE_LATEST, generate_latest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Stages are coarse and fixed (login, search, job, form_page, llm_call, fill, ...), so they are safe as labels
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20)
+
+STAGE_SECONDS = Histogram(
+    "cogniapply_stage_seconds", "Time spent in each automation stage", ["stage"], buckets=STAGE_BUCKETS
+)
+WAIT_SECONDS = Histogram(
+    "cogniapply_wait_seconds", "Condition waits and pacing sleeps by label", ["label"], buckets=WAIT_BUCKETS
+)
+APPLICATIONS = Counter("cogniapply_applications_total", "Applications submitted")
+SKIPS = Counter("cogniapply_jobs_skipped_total", "Jobs not applied to", ["reason"])
+ERRORS = Counter("cogniapply_errors_total", "Errors during automation", ["stage"])
+RUNS = Counter("cogniapply_runs_total", "Automation runs by outcome", ["outcome"])
+LLM_TOKENS = Counter("cogniapply_llm_tokens_total", "Tokens reported by the LLM API", ["kind"])
+LLM_REQUESTS = Counter("cogniapply_llm_requests_total", "LLM API attempts by result", ["result"])
+BROWSER_REQUESTS = Counter("cogniapply_browser_requests_total", "Requests made by automation browsers", ["result"])
+BROWSER_BYTES = Counter("cogniapply_browser_bytes_total", "Bytes received by automation browsers (encoded)")
+
+
+def render_metrics():
+    """Body and content type for the /metrics endpoint"""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+class RunTimer:
+    """Per-run stage timings that also feed the process-wide histograms
+
+    Shared by the parallel sessions of a run, so updates are locked.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, elapsed: float):
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        with self._lock:
+            stats = self.stages.setdefault(stage, {"count": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
+    @contextmanager
+    def stage(self, stage: str):
+        """Time a block; it is recorded even when the block raises"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(stage, time.monotonic() - start)
+
+    def summary(self, waits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Wall time, per-stage totals and (optionally) the pacer's wait breakdown, rounded for reporting"""
+        with self._lock:
+            stages = {
+                stage: {key: round(value, 3) for key, value in stats.items()}
+                for stage, stats in self.stages.items()
+            }
+        summary = {"totalSeconds": round(time.monotonic() - self.started, 3), "stages": stages}
+        if waits is not None:
+            summary["waits"] = waits
+        return summary
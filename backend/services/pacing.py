@@ -0,0 +1,197 @@
+# pacing.py
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from services.scheduler import AutomationCancelled
+from services.metrics import WAIT_SECONDS
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PacingProfile:
+    """How long to wait for page conditions and how much human-like jitter to add on top"""
+
+    def __init__(self, name: str, jitter: Tuple[float, float], typing: Tuple[float, float],
+                 timeout: float, poll_interval: float = 0.2, idle_time: float = 0.5):
+        self.name = name
+        self.jitter = jitter              # Random pause range added after each action
+        self.typing = typing              # Per-keystroke delay range
+        self.timeout = timeout            # Default upper bound for condition waits
+        self.poll_interval = poll_interval
+        self.idle_time = idle_time        # Quiet period that counts as "network idle"
+
+
+PACING_PROFILES: Dict[str, PacingProfile] = {
+    "fast": PacingProfile("fast", jitter=(0.0, 0.3), typing=(0.0, 0.02), timeout=10, poll_interval=0.1, idle_time=0.3),
+    "human": PacingProfile("human", jitter=(0.3, 1.2), typing=(0.03, 0.1), timeout=15),
+    "cautious": PacingProfile("cautious", jitter=(1.0, 3.0), typing=(0.05, 0.15), timeout=25, idle_time=1.0),
+}
+DEFAULT_PACING_PROFILE = "human"
+
+# Resolves once no new resource has started loading for the given quiet period
+NETWORK_IDLE_SCRIPT = """
+const idleMs = arguments[0];
+if (document.readyState !== 'complete') return false;
+const entries = performance.getEntriesByType('resource');
+const now = performance.now();
+for (const entry of entries) {
+    if (entry.responseEnd === 0 || now - entry.responseEnd < idleMs) return false;
+}
+return true;
+"""
+
+
+# Cheap content hash of a container, used to notice when a form page has been replaced
+DOM_FINGERPRINT_SCRIPT = """
+const node = document.querySelector(arguments[0]);
+if (!node) return '';
+const text = node.innerText || '';
+let hash = 0;
+for (let i = 0; i < text.length; i++) hash = (hash * 31 + text.charCodeAt(i)) | 0;
+return text.length + ':' + hash;
+"""
+
+
+class Pacer:
+    """Waits on real page conditions, adds optional jitter, and records where the time went"""
+
+    def __init__(self, profile_name: str = DEFAULT_PACING_PROFILE, cancel_event: Optional[threading.Event] = None):
+        if profile_name not in PACING_PROFILES:
+            raise ValueError(f"Unknown pacing profile: {profile_name}")
+        self.profile = PACING_PROFILES[profile_name]
+        self.cancel_event = cancel_event or threading.Event()
+        self.driver = None
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._uncancellable = 0
+
+    def bind(self, driver):
+        self.driver = driver
+
+    @contextmanager
+    def uncancellable(self):
+        """Waits inside the block ignore stop requests, for steps that must finish once begun"""
+        self._uncancellable += 1
+        try:
+            yield
+        finally:
+            self._uncancellable -= 1
+
+    def _cancelled(self) -> bool:
+        return self.cancel_event.is_set() and not self._uncancellable
+
+    def _record(self, label: str, elapsed: float, timed_out: bool = False):
+        WAIT_SECONDS.labels(label).observe(elapsed)
+        stats = self.timings.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        stats["count"] += 1
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+        if timed_out:
+            stats["timeouts"] += 1
+
+    def sleep(self, seconds: float, label: str = "sleep"):
+        """Sleep that wakes immediately when the run is cancelled (outside uncancellable blocks)"""
+        start = time.monotonic()
+        if self._uncancellable:
+            time.sleep(max(seconds, 0))
+        elif seconds > 0:
+            self.cancel_event.wait(seconds)
+        cancelled = self._cancelled()
+        self._record(label, time.monotonic() - start)
+        if cancelled:
+            raise AutomationCancelled()
+
+    def jitter(self, label: str = "jitter", scale: float = 1.0):
+        """Random human-like pause from the active profile"""
+        low, high = self.profile.jitter
+        self.sleep(random.uniform(low, high) * scale, label)
+
+    def keystroke(self):
+        """Delay between typed characters"""
+        low, high = self.profile.typing
+        if high > 0:
+            self.sleep(random.uniform(low, high), "typing")
+
+    def wait_for(self, condition: Callable[[Any], Any], label: str,
+                 timeout: Optional[float] = None, required: bool = False):
+        """Poll a condition until it returns a truthy value
+
+        Returns the condition's value, or None on timeout unless required is set,
+        in which case TimeoutException propagates.
+        """
+        def cancellable(driver):
+            if self._cancelled():
+                raise AutomationCancelled()
+            return condition(driver)
+
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout or self.profile.timeout, poll_frequency=self.profile.poll_interval
+            ).until(cancellable)
+            self._record(label, time.monotonic() - start)
+            return result
+        except TimeoutException:
+            self._record(label, time.monotonic() - start, timed_out=True)
+            logger.debug(f"Wait timed out: {label}")
+            if required:
+                raise
+            return None
+
+    # Common conditions
+
+    def page_loaded(self, label: str = "page_load", timeout: Optional[float] = None):
+        return self.wait_for(
+            lambda d: d.execute_script("return document.readyState") == "complete", label, timeout
+        )
+
+    def network_idle(self, label: str = "network_idle", timeout: Optional[float] = None):
+        idle_ms = int(self.profile.idle_time * 1000)
+        return self.wait_for(lambda d: d.execute_script(NETWORK_IDLE_SCRIPT, idle_ms), label, timeout)
+
+    def visible(self, locator, label: str, timeout: Optional[float] = None, required: bool = False):
+        return self.wait_for(EC.visibility_of_element_located(locator), label, timeout, required)
+
+    def clickable(self, locator, label: str, timeout: Optional[float] = None, required: bool = False):
+        return self.wait_for(EC.element_to_be_clickable(locator), label, timeout, required)
+
+    def gone(self, element, label: str, timeout: Optional[float] = None):
+        """Wait until an element is detached, e.g. when the next form page replaces it"""
+        return self.wait_for(EC.staleness_of(element), label, timeout)
+
+    def fingerprint(self, selector: str) -> str:
+        """Snapshot a container's content so a later wait can detect that it changed"""
+        try:
+            return self.driver.execute_script(DOM_FINGERPRINT_SCRIPT, selector)
+        except Exception:
+            return ""
+
+    def content_changed(self, selector: str, before: str, label: str, timeout: Optional[float] = None):
+        """Wait until a container re-renders, e.g. the next Easy Apply page replacing the current one"""
+        return self.wait_for(
+            lambda d: d.execute_script(DOM_FINGERPRINT_SCRIPT, selector) != before, label, timeout
+        )
+
+    def merge(self, other: "Pacer"):
+        """Fold another pacer's timings into this one, e.g. from a parallel session"""
+        for label, stats in other.timings.items():
+            mine = self.timings.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            mine["count"] += stats["count"]
+            mine["total"] += stats["total"]
+            mine["max"] = max(mine["max"], stats["max"])
+            mine["timeouts"] += stats["timeouts"]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-label wait statistics for the run, rounded for reporting"""
+        return {
+            label: {key: round(value, 3) for key, value in stats.items()}
+            for label, stats in self.timings.items()
+        }
@@ -0,0 +1,167 @@
+# quick_answers.py
+import re
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from services.answer_cache import normalize_question
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def parse_overrides(text: Optional[str]) -> Dict[str, str]:
+    """Parse "keyword = answer" lines from the profile's screening answers field"""
+    overrides = {}
+    for line in (text or "").splitlines():
+        if "=" not in line:
+            continue
+        key, answer = line.split("=", 1)
+        key, answer = normalize_question(key), answer.strip()
+        if key and answer:
+            overrides[key] = answer
+    return overrides
+
+
+def _first_number(text: str) -> Optional[str]:
+    match = re.search(r"\d[\d,.]*", text or "")
+    if not match:
+        return None
+    return re.sub(r"[,.]", "", match.group(0).split(".")[0])
+
+
+def _match_option(answer: str, options: Optional[List[str]]) -> Optional[str]:
+    """Map an answer onto one of the offered options, or None if none fits"""
+    if not options:
+        return answer
+    lowered = answer.lower()
+    for option in options:
+        if option.lower() == lowered:
+            return option
+    for option in options:
+        if option.lower().startswith(lowered):
+            return option
+    return None
+
+
+class Rule:
+    """A question pattern and the function that answers it from profile data"""
+
+    def __init__(self, name: str, pattern: str, resolve: Callable[[Dict[str, Any], Dict[str, str]], Optional[str]],
+                 exclude: Optional[str] = None):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.exclude = re.compile(exclude) if exclude else None
+        self.resolve = resolve
+
+    def matches(self, question: str) -> bool:
+        return bool(self.pattern.search(question)) and not (self.exclude and self.exclude.search(question))
+
+
+def _override_value(overrides: Dict[str, str], name: str) -> Optional[str]:
+    # Accept both "notice_period" and "notice period" as the keyword
+    return overrides.get(name) or overrides.get(name.replace("_", " "))
+
+
+def _field(name: str):
+    def resolve(profile, overrides):
+        value = _override_value(overrides, name)
+        if value is None and profile.get(name) not in (None, ""):
+            value = str(profile[name])
+        return value
+    return resolve
+
+
+def _override(name: str):
+    return lambda profile, overrides: _override_value(overrides, name)
+
+
+def _name_part(index: int):
+    def resolve(profile, overrides):
+        parts = (profile.get("full_name") or "").split()
+        if not parts:
+            return None
+        return parts[0] if index == 0 else " ".join(parts[1:]) or None
+    return resolve
+
+
+# Checked in order; the first matching rule with a value wins. A profile override
+# whose keyword equals a rule name (e.g. "city = London") supplies that rule's value.
+# Legal questions (work authorization, sponsorship) have no default: without an
+# override they go to the LLM with the resume and profile, never a guessed answer.
+# URL rules need profile/link wording so "How did you hear about us? LinkedIn"
+# isn't answered with a URL.
+RULES = [
+    Rule("email", r"\be ?mail\b", _field("linkedin_email")),
+    Rule("phone", r"\b(phone|mobile|cell)\b", _field("phone"), exclude=r"country code|extension"),
+    Rule("first_name", r"\bfirst name\b", _name_part(0)),
+    Rule("last_name", r"\b(last|family|sur) ?name\b", _name_part(1)),
+    Rule("full_name", r"\b(full name|your name)\b", _field("full_name")),
+    Rule("linkedin_url", r"\blinkedin (profile|url|page|link)\b|\b(url|link) (to|for|of) (your )?linkedin\b",
+         _field("linkedin_url")),
+    Rule("github_url", r"\bgithub (profile|url|page|link|account|username)\b|\b(url|link) (to|for|of) (your )?github\b",
+         _field("github_url")),
+    Rule("portfolio_url", r"\b(portfolio|website|personal site)\b", _field("portfolio_url")),
+    Rule("experience_years", r"\byears\b.*\bexperience\b|\bexperience\b.*\byears\b", _field("experience_years"),
+         exclude=r"experience\b.*\b(with|in|using|of)\b|\b(with|in)\b.*\bexperience\b"),
+    Rule("salary", r"\b(salary|compensation|ctc|pay expectations?)\b",
+         lambda profile, overrides: _override_value(overrides, "salary") or _first_number(profile.get("salary_range"))),
+    Rule("city", r"\b(city|where are you (based|located)|current location)\b", _override("city")),
+    Rule("notice_period", r"\bnotice period\b", _override("notice_period")),
+    Rule("sponsorship", r"\bsponsor", _override("sponsorship")),
+    Rule("work_authorization", r"\b(authori[sz]ed|eligible|legally (able|allowed)|right) to work\b",
+         _override("work_authorization")),
+    Rule("relocate", r"\breloca", _override("relocate")),
+    Rule("commute", r"\bcommut", _override("commute")),
+]
+
+
+class QuickAnswers:
+    """Answers routine screening questions locally before anything is sent to GPT"""
+
+    def __init__(self, profile_data: Optional[Dict[str, Any]]):
+        self.profile = profile_data or {}
+        self.overrides = parse_overrides(self.profile.get("answer_overrides"))
+        # Longest keywords first so "years of python experience" beats "experience"
+        self._keywords = [
+            (re.compile(rf"\b{re.escape(keyword)}\b"), keyword)
+            for keyword in sorted(self.overrides, key=len, reverse=True)
+        ]
+        self.hits = 0
+        self.misses = 0
+
+    def answer(self, question: str, options: Optional[List[str]] = None) -> Optional[str]:
+        """Return a local answer for the question, or None if it needs the LLM"""
+        normalized = normalize_question(question)
+        answer = self._resolve(normalized, options)
+        if answer is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.info(f"Quick answer: {question} -> {answer}")
+        return answer
+
+    def _resolve(self, question: str, options: Optional[List[str]]) -> Optional[str]:
+        for pattern, keyword in self._keywords:
+            if pattern.search(question):
+                matched = _match_option(self.overrides[keyword], options)
+                if matched is not None:
+                    return matched
+
+        for rule in RULES:
+            if not rule.matches(question):
+                continue
+            value = rule.resolve(self.profile, self.overrides)
+            if value is None:
+                continue
+            matched = _match_option(value, options)
+            if matched is not None:
+                return matched
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / total, 3) if total else 0.0
+        }
@@ -0,0 +1,158 @@
+# request_filter.py
+import os
+import json
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from services.metrics import BROWSER_REQUESTS, BROWSER_BYTES
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+REQUEST_BLOCKING = os.getenv("REQUEST_BLOCKING", "true").lower() in ("1", "true", "yes")
+# Extra comma-separated patterns, same wildcard syntax as the defaults
+REQUEST_BLOCKLIST_EXTRA = [
+    pattern.strip() for pattern in os.getenv("REQUEST_BLOCKLIST_EXTRA", "").split(",") if pattern.strip()
+]
+
+# Requests the Easy Apply flow never needs: analytics and ad beacons, LinkedIn's own tracking
+# endpoints, images, video and web fonts. Patterns use Network.setBlockedURLs wildcards ("*").
+# Scripts, XHR to /voyager/api and document uploads are left alone.
+DEFAULT_BLOCKLIST = [
+    # Third-party analytics and ads
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*adservice.google.*",
+    "*facebook.net*",
+    "*connect.facebook.*",
+    "*bat.bing.com*",
+    "*adnxs.com*",
+    "*ads-twitter.com*",
+    "*hotjar.com*",
+    # LinkedIn tracking and ads
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/sensorCollect*",
+    "*linkedin.com/collect*",
+    "*linkedin.com/realtime/*",
+    "*linkedin.com/tscp-serving/*",
+    # Media: images, video and fonts
+    "*media.licdn.com/dms/image/*",
+    "*static.licdn.com/aero-v1/sc/h/*.svg",
+    "*dms.licdn.com/playlist/*",
+    "*.mp4*",
+    "*.webm*",
+    "*.m3u8*",
+    "*.woff*",
+    "*.ttf*",
+]
+
+# Performance log events we read; everything else is skipped before it is parsed
+COUNTED_EVENTS = ('"Network.requestWillBeSent"', '"Network.loadingFinished"', '"Network.loadingFailed"')
+
+
+def blocklist() -> List[str]:
+    return DEFAULT_BLOCKLIST + REQUEST_BLOCKLIST_EXTRA
+
+
+def enable_request_log(options):
+    """Ask chromedriver to keep DevTools network events so blocked requests can be counted"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def install_request_filter(driver, patterns: Optional[List[str]] = None):
+    """Block matching requests in the browser itself, before they hit the network"""
+    patterns = patterns if patterns is not None else blocklist()
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    logger.info(f"Request filter installed with {len(patterns)} patterns")
+
+
+class RequestStats:
+    """Counts the browser's requests from chromedriver's performance log
+
+    Blocked requests never reach the network, so only their number (and host)
+    is known; the bytes they would have cost cannot be measured. bytes_received
+    is what the allowed requests actually transferred.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked = 0
+        self.failed = 0
+        self.bytes_received = 0
+        self.blocked_hosts: Counter = Counter()
+        self.available = True
+        self._lock = threading.Lock()
+
+    def collect(self, driver):
+        """Drain the driver's performance log into the counters"""
+        if not self.available:
+            return
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            # Performance logging wasn't enabled for this browser
+            logger.info(f"Request counting unavailable: {str(e)}")
+            self.available = False
+            return
+
+        hosts: Dict[str, str] = {}
+        requests = blocked = failed = received = 0
+        blocked_hosts: Counter = Counter()
+        for entry in entries:
+            message = entry.get("message", "")
+            if not any(event in message for event in COUNTED_EVENTS):
+                continue
+            try:
+                event = json.loads(message)["message"]
+            except (ValueError, KeyError):
+                continue
+            method, params = event.get("method"), event.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                requests += 1
+                hosts[params.get("requestId")] = urlparse(params.get("request", {}).get("url", "")).hostname or ""
+            elif method == "Network.loadingFinished":
+                received += int(params.get("encodedDataLength") or 0)
+            elif method == "Network.loadingFailed":
+                if params.get("blockedReason") == "inspector":
+                    blocked += 1
+                    blocked_hosts[hosts.get(params.get("requestId"), "unknown")] += 1
+                else:
+                    failed += 1
+
+        BROWSER_REQUESTS.labels("blocked").inc(blocked)
+        # A request announced in an earlier batch can fail in this one
+        BROWSER_REQUESTS.labels("allowed").inc(max(0, requests - blocked))
+        BROWSER_BYTES.inc(received)
+        with self._lock:
+            self.requests += requests
+            self.blocked += blocked
+            self.failed += failed
+            self.bytes_received += received
+            self.blocked_hosts.update(blocked_hosts)
+
+    def discard(self, driver):
+        """Drop events logged before this run, e.g. by the browser's previous user"""
+        try:
+            driver.get_log("performance")
+        except Exception:
+            self.available = False
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "available": self.available,
+                "requests": self.requests,
+                "blocked": self.blocked,
+                "failed": self.failed,
+                "bytesReceived": self.bytes_received,
+                "topBlockedHosts": dict(self.blocked_hosts.most_common(5)),
+            }
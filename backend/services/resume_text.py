@@ -0,0 +1,106 @@
+# resume_text.py
+import os
+import json
+import zipfile
+import hashlib
+import logging
+import pdfplumber
+from xml.etree import ElementTree
+from typing import Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RESUME_TEXT_FILE = "resume_text.json"
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def file_sha256(filepath: str) -> str:
+    """Hash a file in chunks without loading it into memory"""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_pdf_text(filepath: str) -> str:
+    """Extract text from a PDF, parsing each page once"""
+    page_texts = []
+    with pdfplumber.open(filepath) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if text:
+                page_texts.append(text)
+    return "\n".join(page_texts)
+
+
+def _extract_docx_text(filepath: str) -> str:
+    """Extract paragraph text from a DOCX file using only the standard library"""
+    with zipfile.ZipFile(filepath) as docx:
+        document_xml = docx.read("word/document.xml")
+
+    root = ElementTree.fromstring(document_xml)
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        text = "".join(node.text or "" for node in paragraph.iter(f"{WORD_NAMESPACE}t"))
+        if text.strip():
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+def extract_resume_text(filepath: str) -> str:
+    """Extract plain text from a PDF or DOCX resume"""
+    extension = filepath.rsplit(".", 1)[-1].lower()
+    if extension == "pdf":
+        return _extract_pdf_text(filepath)
+    if extension == "docx":
+        return _extract_docx_text(filepath)
+    raise ValueError(f"Unsupported resume format: {extension}")
+
+
+def _cache_path(resume_path: str) -> str:
+    return os.path.join(os.path.dirname(resume_path), RESUME_TEXT_FILE)
+
+
+def cache_resume_text(resume_path: str, content_hash: Optional[str] = None) -> Optional[str]:
+    """Extract a resume and store the text next to it, tagged with the file's content hash"""
+    try:
+        content_hash = content_hash or file_sha256(resume_path)
+        text = extract_resume_text(resume_path)
+
+        cache_file = _cache_path(resume_path)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"sha256": content_hash, "source": os.path.basename(resume_path), "text": text}, f)
+        os.replace(tmp_file, cache_file)
+
+        logger.info(f"Cached resume text for {resume_path} ({len(text)} chars)")
+        return text
+    except Exception as e:
+        logger.error(f"Error extracting resume text from {resume_path}: {str(e)}")
+        return None
+
+
+def load_resume_text(resume_path: str) -> Optional[str]:
+    """Return the cached resume text, re-extracting only if the file content changed"""
+    cache_file = _cache_path(resume_path)
+    try:
+        content_hash = file_sha256(resume_path)
+        if os.path.exists(cache_file):
+            with open(cache_file, "r") as f:
+                cached = json.load(f)
+            if cached.get("sha256") == content_hash and cached.get("source") == os.path.basename(resume_path):
+                return cached.get("text")
+    except Exception as e:
+        logger.warning(f"Ignoring resume text cache {cache_file}: {str(e)}")
+        content_hash = None
+
+    return cache_resume_text(resume_path, content_hash)
+
+
+def remove_resume_text(user_dir: str):
+    """Delete the cached resume text, e.g. when the resume itself is deleted"""
+    cache_file = os.path.join(user_dir, RESUME_TEXT_FILE)
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
@@ -0,0 +1,175 @@
+# scheduler.py
+import os
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+AUTOMATION_MAX_WORKERS = int(os.getenv("AUTOMATION_MAX_WORKERS", "2"))
+
+
+class AutomationCancelled(BaseException):
+    """Raised inside an automation run when its user asked to stop it
+
+    Like asyncio.CancelledError this derives from BaseException so the many
+    broad ``except Exception`` handlers in the automation don't swallow it.
+    """
+
+
+class AutomationJob:
+    """A queued or running automation run"""
+
+    def __init__(self, username: str, target: Callable, args: tuple):
+        self.username = username
+        self.target = target
+        self.args = args
+        self.cancel_event = threading.Event()
+        self.running = False
+
+
+class AutomationScheduler:
+    """Bounded worker pool running automation jobs in FIFO order with per-user fairness
+
+    Each user has their own FIFO queue and workers take turns across users, so
+    one user submitting many runs cannot starve everybody else.
+    """
+
+    def __init__(self, max_workers: int = AUTOMATION_MAX_WORKERS,
+                 on_queue_change: Optional[Callable[[str, int], None]] = None):
+        self.max_workers = max_workers
+        self.on_queue_change = on_queue_change
+        self._queues: "OrderedDict[str, Deque[AutomationJob]]" = OrderedDict()
+        self._running: Dict[str, AutomationJob] = {}
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def start(self):
+        """Start the worker threads"""
+        for index in range(self.max_workers):
+            worker = threading.Thread(target=self._worker, name=f"automation-worker-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, username: str, target: Callable, *args) -> int:
+        """Queue a run; the target is called as target(*args, cancel_event=...)
+
+        Returns the 1-based queue position of the new job.
+        """
+        job = AutomationJob(username, target, args)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Scheduler is shut down")
+            self._queues.setdefault(username, deque()).append(job)
+            position = self._position_locked(job)
+            self._condition.notify()
+        self._publish_positions()
+        return position
+
+    def is_active(self, username: str) -> bool:
+        """True if the user has a queued or running job"""
+        with self._condition:
+            return username in self._running or bool(self._queues.get(username))
+
+    def position(self, username: str) -> Optional[int]:
+        """Queue position of the user's next job, 0 if running, None if idle"""
+        with self._condition:
+            if username in self._running:
+                return 0
+            queue = self._queues.get(username)
+            if not queue:
+                return None
+            return self._position_locked(queue[0])
+
+    def cancel(self, username: str) -> bool:
+        """Drop the user's queued jobs and signal their running job to stop"""
+        with self._condition:
+            queued = self._queues.pop(username, None)
+            running = self._running.get(username)
+            if running:
+                running.cancel_event.set()
+
+        if queued:
+            self._publish_positions()
+        return bool(queued) or running is not None
+
+    def shutdown(self):
+        """Cancel everything and stop handing out work"""
+        with self._condition:
+            self._closed = True
+            self._queues.clear()
+            for job in self._running.values():
+                job.cancel_event.set()
+            self._condition.notify_all()
+
+    def _order_locked(self) -> List[AutomationJob]:
+        """The order in which queued jobs will be picked: round-robin across users"""
+        order = []
+        queues = [list(queue) for queue in self._queues.values()]
+        depth = 0
+        while True:
+            layer = [queue[depth] for queue in queues if len(queue) > depth]
+            if not layer:
+                return order
+            order.extend(layer)
+            depth += 1
+
+    def _position_locked(self, job: AutomationJob) -> int:
+        return self._order_locked().index(job) + 1
+
+    def _publish_positions(self):
+        """Report each waiting user's position"""
+        if not self.on_queue_change:
+            return
+        with self._condition:
+            positions = {}
+            for index, job in enumerate(self._order_locked()):
+                positions.setdefault(job.username, index + 1)
+
+        for username, position in positions.items():
+            try:
+                self.on_queue_change(username, position)
+            except Exception as e:
+                logger.warning(f"Error reporting queue position to {username}: {str(e)}")
+
+    def _next_job_locked(self) -> Optional[AutomationJob]:
+        """Take the next job, skipping users who already have a run in progress"""
+        for username, queue in self._queues.items():
+            if username in self._running:
+                continue
+            job = queue.popleft()
+            # Rotate this user to the back so other users get the next turn
+            del self._queues[username]
+            if queue:
+                self._queues[username] = queue
+            return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                job = None
+                while not self._closed:
+                    job = self._next_job_locked()
+                    if job:
+                        break
+                    self._condition.wait()
+                if self._closed:
+                    return
+                job.running = True
+                self._running[job.username] = job
+
+            self._publish_positions()
+            try:
+                job.target(*job.args, cancel_event=job.cancel_event)
+            except AutomationCancelled:
+                logger.info(f"Automation job for {job.username} cancelled")
+            except Exception as e:
+                logger.error(f"Automation job for {job.username} failed: {str(e)}")
+            finally:
+                with self._condition:
+                    self._running.pop(job.username, None)
+                    self._condition.notify_all()
@@ -0,0 +1,87 @@
+# session_index.py
+import os
+import json
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SESSION_FILENAME = "linkedin_session.json"
+# Cookies without which LinkedIn treats the browser as logged out
+AUTH_COOKIES = ("li_at", "JSESSIONID")
+# How long a successful probe is trusted before the session is checked again
+SESSION_TRUST_SECONDS = int(os.getenv("LINKEDIN_SESSION_TRUST_SECONDS", "21600"))
+# Treat cookies this close to expiry as already expired
+SESSION_EXPIRY_MARGIN = 3600
+
+
+class SessionIndex:
+    """Per-user record of when the LinkedIn session cookies expire and when they last worked
+
+    Lets a run skip the login step entirely while the session is known to be
+    valid, instead of loading pages to find out.
+    """
+
+    def __init__(self, user_dir: str):
+        self.path = os.path.join(user_dir, SESSION_FILENAME)
+        self.data: Dict[str, Any] = {}
+        try:
+            with open(self.path, "r") as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session index {self.path}: {str(e)}")
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return self.data.get("expires_at")
+
+    def is_trusted(self, now: Optional[float] = None) -> bool:
+        """True while the auth cookies are unexpired and the last check is recent"""
+        now = now or time.time()
+        expires_at = self.data.get("expires_at")
+        verified_at = self.data.get("verified_at")
+        if not expires_at or not verified_at:
+            return False
+        return expires_at - SESSION_EXPIRY_MARGIN > now and now - verified_at < SESSION_TRUST_SECONDS
+
+    def record(self, cookies: List[Dict[str, Any]]):
+        """Remember a verified session: the earliest expiry among its auth cookies"""
+        expiries = [
+            cookie["expiry"] for cookie in cookies
+            if cookie.get("name") in AUTH_COOKIES and cookie.get("expiry")
+        ]
+        if not any(cookie.get("name") == "li_at" for cookie in cookies):
+            # Logged in through something other than the usual cookie; don't vouch for it
+            self.invalidate()
+            return
+        # Session cookies without an expiry last as long as the browser profile does
+        self.data = {
+            "expires_at": min(expiries) if expiries else time.time() + SESSION_TRUST_SECONDS,
+            "verified_at": time.time()
+        }
+        self._save()
+
+    def invalidate(self):
+        if not self.data:
+            return
+        self.data = {}
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove session index {self.path}: {str(e)}")
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save session index {self.path}: {str(e)}")
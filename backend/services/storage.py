@@ -0,0 +1,306 @@
+# storage.py
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DATABASE_PATH = os.getenv("DATABASE_PATH", "../data/cogniapply.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    email TEXT,
+    password_hash TEXT NOT NULL,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    username TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    job_id TEXT,
+    job_title TEXT,
+    company TEXT,
+    status TEXT,
+    applied_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_user_date ON applications (username, applied_date);
+CREATE INDEX IF NOT EXISTS idx_applications_user_job ON applications (username, job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_job ON applications (job_id);
+CREATE TABLE IF NOT EXISTS answer_cache (
+    username TEXT NOT NULL,
+    key TEXT NOT NULL,
+    question TEXT,
+    answer TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (username, key)
+);
+CREATE INDEX IF NOT EXISTS idx_answer_cache_user_used ON answer_cache (username, last_used);
+CREATE TABLE IF NOT EXISTS answer_cache_meta (
+    username TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+
+def application_row(record: Dict[str, Any]) -> tuple:
+    """Map an automation application record onto the indexed columns"""
+    return (
+        str(record.get("job_id") or ""),
+        record.get("jobTitle") or record.get("job_title") or "",
+        record.get("company") or "",
+        record.get("status") or "",
+        record.get("timestamp") or record.get("applied_date") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        json.dumps(record)
+    )
+
+
+class Storage:
+    """Transactional SQLite (WAL mode) store for users, profiles, applications and answer caches"""
+
+    def __init__(self, path: str = DATABASE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._local = threading.local()
+        # executescript manages its own transaction
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections must not be shared across threads"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run statements atomically; concurrent writers wait for each other instead of corrupting data"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # Users
+
+    def create_user(self, username: str, email: str, password_hash: str) -> bool:
+        """Insert a user, returning False if the username is taken"""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO users (username, email, password_hash, created_at) VALUES (?, ?, ?, ?)",
+                (username, email, password_hash, datetime.now().isoformat())
+            )
+            return cursor.rowcount == 1
+
+    def get_user(self, username: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT username, email, password_hash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    # Profiles
+
+    def get_profile(self, username: str) -> Dict[str, Any]:
+        row = self._connection().execute("SELECT data FROM profiles WHERE username = ?", (username,)).fetchone()
+        return json.loads(row["data"]) if row else {}
+
+    def save_profile(self, username: str, data: Dict[str, Any]):
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO profiles (username, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(username) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (username, json.dumps(data), datetime.now().isoformat())
+            )
+
+    # Applications
+
+    def import_applications(self, username: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert records not stored yet (same job id and date); safe to replay the application log"""
+        rows = [(username,) + application_row(record) for record in records]
+        inserted = 0
+        if not rows:
+            return 0
+        with self.transaction() as conn:
+            for row in rows:
+                cursor = conn.execute(
+                    "INSERT INTO applications (username, job_id, job_title, company, status, applied_date, data) "
+                    "SELECT ?, ?, ?, ?, ?, ?, ? WHERE NOT EXISTS ("
+                    "SELECT 1 FROM applications WHERE username = ? AND job_id = ? AND applied_date = ?)",
+                    row + (username, row[1], row[5])
+                )
+                inserted += cursor.rowcount
+        return inserted
+
+    def get_applications(self, username: str, since: Optional[str] = None,
+                         until: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Applications for a user in date order, optionally bounded by date"""
+        query = "SELECT job_id, job_title, company, status, applied_date FROM applications WHERE username = ?"
+        params: List[Any] = [username]
+        if since:
+            query += " AND applied_date >= ?"
+            params.append(since)
+        if until:
+            query += " AND applied_date <= ?"
+            params.append(until)
+        query += " ORDER BY applied_date, id"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._connection().execute(query, params)]
+
+    def get_application(self, username: str, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT job_id, job_title, company, status, applied_date FROM applications "
+            "WHERE username = ? AND job_id = ? ORDER BY applied_date DESC LIMIT 1",
+            (username, str(job_id))
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_applied_job_ids(self, username: str) -> List[str]:
+        return [row["job_id"] for row in self._connection().execute(
+            "SELECT DISTINCT job_id FROM applications WHERE username = ? AND job_id != ''", (username,)
+        )]
+
+    # Answer cache
+
+    def load_answer_cache(self, username: str, fingerprint: str) -> Dict[str, Dict[str, Any]]:
+        """Load a user's cached answers, discarding them if the fingerprint changed"""
+        conn = self._connection()
+        row = conn.execute("SELECT fingerprint FROM answer_cache_meta WHERE username = ?", (username,)).fetchone()
+        if row is None or row["fingerprint"] != fingerprint:
+            if row is not None:
+                logger.info(f"Resume or profile changed, discarding answer cache for {username}")
+            self.clear_answer_cache(username)
+            return {}
+
+        return {
+            r["key"]: {"question": r["question"], "answer": r["answer"], "last_used": r["last_used"]}
+            for r in conn.execute("SELECT key, question, answer, last_used FROM answer_cache WHERE username = ?", (username,))
+        }
+
+    def save_answers(self, username: str, fingerprint: str, entries: Dict[str, Dict[str, Any]], max_entries: int):
+        """Upsert changed answers and evict the least recently used ones past the cap"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO answer_cache_meta (username, fingerprint) VALUES (?, ?) "
+                "ON CONFLICT(username) DO UPDATE SET fingerprint = excluded.fingerprint",
+                (username, fingerprint)
+            )
+            conn.executemany(
+                "INSERT INTO answer_cache (username, key, question, answer, last_used) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(username, key) DO UPDATE SET answer = excluded.answer, last_used = excluded.last_used",
+                [(username, key, e["question"], e["answer"], e["last_used"]) for key, e in entries.items()]
+            )
+            conn.execute(
+                "DELETE FROM answer_cache WHERE username = ? AND key NOT IN "
+                "(SELECT key FROM answer_cache WHERE username = ? ORDER BY last_used DESC LIMIT ?)",
+                (username, username, max_entries)
+            )
+
+    def clear_answer_cache(self, username: str):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM answer_cache WHERE username = ?", (username,))
+            conn.execute("DELETE FROM answer_cache_meta WHERE username = ?", (username,))
+
+    # Migration
+
+    def migrate_from_json(self, base_dir: str):
+        """One-shot import of the legacy ../users/<name>/*.json layout"""
+        conn = self._connection()
+        if conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone():
+            return
+        if not os.path.isdir(base_dir):
+            return
+
+        def load(filepath, default):
+            if not os.path.exists(filepath):
+                return default
+            try:
+                with open(filepath, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable file during migration {filepath}: {str(e)}")
+                return default
+
+        migrated = 0
+        with self.transaction() as conn:
+            for username in sorted(os.listdir(base_dir)):
+                user_dir = os.path.join(base_dir, username)
+                credentials = load(os.path.join(user_dir, "credentials.json"), {})
+                if not os.path.isdir(user_dir) or "password" not in credentials:
+                    continue
+
+                conn.execute(
+                    "INSERT OR IGNORE INTO users (username, email, password_hash, created_at) VALUES (?, ?, ?, ?)",
+                    (username, credentials.get("email"), credentials["password"], datetime.now().isoformat())
+                )
+
+                profile = load(os.path.join(user_dir, "profile.json"), {})
+                if profile:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO profiles (username, data, updated_at) VALUES (?, ?, ?)",
+                        (username, json.dumps(profile), datetime.now().isoformat())
+                    )
+
+                applications = load(os.path.join(user_dir, "applications.json"), [])
+                if isinstance(applications, list):
+                    conn.executemany(
+                        "INSERT INTO applications (username, job_id, job_title, company, status, applied_date, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(username,) + application_row(record) for record in applications if isinstance(record, dict)]
+                    )
+
+                answer_cache = load(os.path.join(user_dir, "answer_cache.json"), {})
+                if answer_cache.get("fingerprint"):
+                    conn.execute(
+                        "INSERT OR IGNORE INTO answer_cache_meta (username, fingerprint) VALUES (?, ?)",
+                        (username, answer_cache["fingerprint"])
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO answer_cache (username, key, question, answer, last_used) VALUES (?, ?, ?, ?, ?)",
+                        [(username, key, e.get("question"), e["answer"], e.get("last_used", time.time()))
+                         for key, e in answer_cache.get("entries", {}).items()]
+                    )
+                migrated += 1
+
+            conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (datetime.now().isoformat(),))
+
+        logger.info(f"Migrated {migrated} users from JSON files into {self.path}")
+
+
+_storage: Optional[Storage] = None
+_storage_lock = threading.Lock()
+
+
+def get_storage() -> Storage:
+    """Process-wide storage instance"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            _storage = Storage()
+        return _storage
@@ -0,0 +1,79 @@
+# uploads.py
+import os
+import hashlib
+import logging
+import tempfile
+from typing import Iterable, List
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size cap"""
+
+
+def _write_chunk(f, digest, chunk: bytes):
+    """Write and hash a chunk in one thread-pool hop"""
+    f.write(chunk)
+    digest.update(chunk)
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def save_upload(upload: UploadFile, dest_path: str, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+    """Stream an upload to dest_path and return its SHA-256
+
+    The data is written in chunks to a temp file in the destination directory,
+    off the event loop, and only renamed into place once it is complete and
+    within the size cap, so readers never see a partial file.
+    """
+    directory = os.path.dirname(dest_path)
+    fd, tmp_path = await run_in_threadpool(tempfile.mkstemp, dir=directory, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"{upload.filename} exceeds the {max_bytes // (1024 * 1024)} MB upload limit")
+                await run_in_threadpool(_write_chunk, f, digest, chunk)
+        await run_in_threadpool(os.replace, tmp_path, dest_path)
+    except BaseException:
+        await run_in_threadpool(_remove_quietly, tmp_path)
+        raise
+
+    logger.info(f"Saved upload {dest_path} ({size} bytes)")
+    return digest.hexdigest()
+
+
+async def list_user_files(user_dir: str) -> List[str]:
+    """List a user's directory with a single off-loop call instead of many exists() checks"""
+    try:
+        return await run_in_threadpool(os.listdir, user_dir)
+    except FileNotFoundError:
+        return []
+
+
+async def remove_files(paths: Iterable[str]):
+    """Delete files off the event loop, ignoring ones that are already gone"""
+    def remove_all():
+        for path in paths:
+            _remove_quietly(path)
+    await run_in_threadpool(remove_all)
@@ -0,0 +1,114 @@
+# ws_hub.py
+import os
+import json
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+WS_BUFFER_SIZE = int(os.getenv("WS_BUFFER_SIZE", "200"))         # Max queued messages per socket
+WS_BATCH_SIZE = int(os.getenv("WS_BATCH_SIZE", "50"))            # Max messages folded into one frame
+WS_HEARTBEAT_INTERVAL = float(os.getenv("WS_HEARTBEAT_INTERVAL", "30"))
+
+
+class ConnectionHub:
+    """Delivers messages from automation worker threads to WebSocket clients
+
+    Worker threads call publish(), which hands the message to the event loop with
+    call_soon_threadsafe. Each socket has its own bounded asyncio.Queue drained by
+    a single writer task that folds bursts into one "batch" frame.
+    """
+
+    def __init__(self, buffer_size: int = WS_BUFFER_SIZE, batch_size: int = WS_BATCH_SIZE,
+                 heartbeat_interval: float = WS_HEARTBEAT_INTERVAL):
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        # Messages published while the user has no open socket, replayed on connect
+        self._backlog: Dict[str, Deque[Dict[str, Any]]] = {}
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """Attach the hub to the server's event loop"""
+        self.loop = loop
+
+    def publish(self, username: str, message: Dict[str, Any]):
+        """Queue a message for a user; safe to call from any thread"""
+        if self.loop is None:
+            self._enqueue(username, message)
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self.loop:
+            self._enqueue(username, message)
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, username, message)
+
+    def _enqueue(self, username: str, message: Dict[str, Any]):
+        """Runs on the event loop: push into the socket queue or the offline backlog"""
+        queue = self._queues.get(username)
+        if queue is None:
+            backlog = self._backlog.setdefault(username, deque(maxlen=self.buffer_size))
+            backlog.append(message)
+            return
+
+        if queue.full():
+            # Slow client: drop the oldest message rather than growing without bound
+            queue.get_nowait()
+            logger.warning(f"WebSocket buffer full for {username}, dropping oldest message")
+        queue.put_nowait(message)
+
+    async def serve(self, username: str, websocket: WebSocket):
+        """Own an accepted socket until the client disconnects"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_size)
+        self._queues[username] = queue
+
+        # Replay anything published before the client connected
+        for message in self._backlog.pop(username, ()):
+            self._enqueue(username, message)
+
+        writer = asyncio.create_task(self._writer(username, websocket, queue))
+        try:
+            # Nothing is expected from the client; receiving just detects disconnects
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            logger.warning(f"WebSocket error for {username}: {str(e)}")
+        finally:
+            writer.cancel()
+            # A newer socket from the same user may have replaced this one
+            if self._queues.get(username) is queue:
+                self._queues.pop(username, None)
+
+    async def _writer(self, username: str, websocket: WebSocket, queue: asyncio.Queue):
+        """Single writer per socket: awaits messages, batching bursts into one frame"""
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    await websocket.send_text(json.dumps({"type": "heartbeat"}))
+                    continue
+
+                batch = [message]
+                while len(batch) < self.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                frame = batch[0] if len(batch) == 1 else {"type": "batch", "messages": batch}
+                await websocket.send_text(json.dumps(frame))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to {username}: {str(e)}")
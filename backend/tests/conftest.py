@@ -0,0 +1,20 @@
+# conftest.py
+import os
+import sys
+
+import pytest
+
+# Tests import modules the way the app does (services.X, platforms.X), from the backend directory
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from services import storage as storage_module  # noqa: E402
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """A fresh SQLite store, also returned by get_storage() for code that looks it up"""
+    store = storage_module.Storage(str(tmp_path / "data" / "test.db"))
+    monkeypatch.setattr(storage_module, "_storage", store)
+    return store
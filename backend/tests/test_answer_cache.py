@@ -0,0 +1,72 @@
+# test_answer_cache.py
+from services.answer_cache import (
+    AnswerCache, get_answer_cache, invalidate_answer_cache, normalize_question, profile_fingerprint
+)
+
+CV = "Jane Doe - Python developer"
+PROFILE = {"full_name": "Jane Doe", "skills": "python", "linkedin_password": "secret"}
+
+
+def test_questions_are_normalized():
+    assert normalize_question("  How many YEARS of experience?! ") == "how many years of experience"
+
+
+def test_fingerprint_ignores_linkedin_credentials_only():
+    base = profile_fingerprint(CV, PROFILE)
+    assert profile_fingerprint(CV, dict(PROFILE, linkedin_password="changed")) == base
+    assert profile_fingerprint(CV, dict(PROFILE, skills="rust")) != base
+    assert profile_fingerprint(CV + " and Rust", PROFILE) != base
+
+
+def test_hit_after_put_with_rephrased_question(storage):
+    cache = AnswerCache("jane", "fp", "cv", storage=storage)
+    assert cache.get("Are you willing to relocate?") is None
+    cache.put("Are you willing to relocate?", "Yes", ["Yes", "No"])
+    assert cache.get("are you willing to relocate", ["yes", "no"]) == "Yes"
+    # Different options are a different question
+    assert cache.get("Are you willing to relocate?", ["Yes", "No", "Maybe"]) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_flushed_answers_survive_a_new_cache(storage):
+    cache = AnswerCache("jane", "fp", "cv", storage=storage)
+    cache.put("Notice period?", "30 days")
+    cache.flush()
+
+    reloaded = AnswerCache("jane", "fp", "cv", storage=storage)
+    assert reloaded.get("Notice period?") == "30 days"
+    # A changed resume or profile starts from an empty cache
+    assert AnswerCache("jane", "other", "cv", storage=storage).get("Notice period?") is None
+
+
+def test_memory_layer_is_bounded(storage):
+    cache = AnswerCache("jane", "fp", "cv", storage=storage, memory_size=2)
+    for index in range(3):
+        cache.put(f"question {index}", str(index))
+    assert len(cache._memory) == 2
+    # The evicted entry is still served from the disk layer
+    assert cache.get("question 0") == "0"
+
+
+def test_disk_layer_keeps_the_most_recent_answers(storage):
+    cache = AnswerCache("jane", "fp", "cv", storage=storage, disk_size=2)
+    for index in range(3):
+        cache.put(f"question {index}", str(index))
+        cache._disk[cache.make_key(f"question {index}")]["last_used"] = float(index)
+    cache.flush()
+
+    reloaded = AnswerCache("jane", "fp", "cv", storage=storage)
+    assert reloaded.get("question 0") is None
+    assert reloaded.get("question 2") == "2"
+
+
+def test_registry_rebuilds_on_change_and_invalidation(storage):
+    cache = get_answer_cache("jane", CV, PROFILE)
+    assert get_answer_cache("jane", CV, PROFILE) is cache
+    assert get_answer_cache("jane", CV, dict(PROFILE, skills="rust")) is not cache
+
+    cache = get_answer_cache("jane", CV, PROFILE)
+    cache.put("Notice period?", "30 days")
+    cache.flush()
+    invalidate_answer_cache("jane")
+    assert get_answer_cache("jane", CV, PROFILE).get("Notice period?") is None
@@ -0,0 +1,83 @@
+# test_application_log.py
+import pytest
+
+from services import application_log
+from services.application_log import ApplicationLog, ApplicationLogCompactor, get_application_log
+
+
+def record(job_id, timestamp="2026-01-01 09:00:00"):
+    return {"job_id": job_id, "jobTitle": "Engineer", "company": "Acme", "status": "Applied", "timestamp": timestamp}
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(application_log, "_logs", {})
+
+
+def test_compaction_moves_the_log_into_storage(tmp_path, storage):
+    log = ApplicationLog("alice", str(tmp_path))
+    for job_id in ("1", "2", "3"):
+        log.append(record(job_id))
+    assert log.has_pending()
+
+    assert log.compact() == 3
+    assert not log.has_pending()
+    assert [row["job_id"] for row in storage.get_applications("alice")] == ["1", "2", "3"]
+
+
+def test_appends_after_compaction_go_to_a_fresh_file(tmp_path, storage):
+    log = ApplicationLog("alice", str(tmp_path))
+    log.append(record("1"))
+    log.compact()
+    log.append(record("2"))
+    assert log.compact() == 1
+    assert len(storage.get_applications("alice")) == 2
+
+
+def test_interrupted_compaction_is_finished_without_duplicates(tmp_path, storage):
+    log = ApplicationLog("alice", str(tmp_path))
+    log.append(record("1"))
+    log.append(record("2"))
+    # Crash after the rows were committed but before the renamed file was deleted
+    assert log._rotate()
+    storage.import_applications("alice", log._read(log.compacting_path))
+    log.append(record("3"))
+
+    restarted = ApplicationLog("alice", str(tmp_path))
+    assert restarted.compact() == 1
+    assert [row["job_id"] for row in storage.get_applications("alice")] == ["1", "2", "3"]
+
+
+def test_torn_last_line_is_skipped(tmp_path, storage):
+    log = ApplicationLog("alice", str(tmp_path))
+    log.append(record("1"))
+    log.close()
+    with open(log.path, "a") as f:
+        f.write('{"job_id": "2", "jobTi')
+    assert log.compact() == 1
+    assert not log.has_pending()
+
+
+def test_records_are_fsynced_in_batches(tmp_path, storage, monkeypatch):
+    synced = []
+    monkeypatch.setattr(application_log, "FSYNC_EVERY", 3)
+    monkeypatch.setattr(application_log, "FSYNC_INTERVAL", 3600)
+    monkeypatch.setattr(application_log.os, "fsync", lambda fd: synced.append(fd))
+    log = ApplicationLog("alice", str(tmp_path))
+    for job_id in ("1", "2", "3", "4"):
+        log.append(record(job_id))
+    assert len(synced) == 1
+    log.sync()
+    assert len(synced) == 2
+
+
+def test_compactor_folds_every_users_log(tmp_path, storage):
+    for username in ("alice", "bob"):
+        user_dir = tmp_path / username
+        user_dir.mkdir()
+        get_application_log(username, str(user_dir)).append(record("1"))
+    (tmp_path / "stray-file.txt").write_text("")
+
+    ApplicationLogCompactor(str(tmp_path)).compact_all()
+    assert len(storage.get_applications("alice")) == 1
+    assert len(storage.get_applications("bob")) == 1
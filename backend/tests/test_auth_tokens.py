@@ -0,0 +1,61 @@
+# test_auth_tokens.py
+import time
+
+from services import auth_tokens
+from services.auth_tokens import CredentialCache, issue_session_token, verify_session_token
+
+
+def test_token_round_trip():
+    token, expires_at = issue_session_token("alice", ttl=60)
+    assert verify_session_token(token) == "alice"
+    assert expires_at > time.time()
+
+
+def test_usernames_with_separators_survive():
+    token, _ = issue_session_token("a:b.c", ttl=60)
+    assert verify_session_token(token) == "a:b.c"
+
+
+def test_expired_token_is_rejected():
+    token, _ = issue_session_token("alice", ttl=-1)
+    assert verify_session_token(token) is None
+
+
+def test_tampered_token_is_rejected():
+    token, _ = issue_session_token("alice", ttl=60)
+    forged_payload, _ = issue_session_token("mallory", ttl=60)
+    assert verify_session_token(forged_payload.split(".")[0] + "." + token.split(".")[1]) is None
+    payload, signature = token.split(".")
+    flipped = ("B" if signature[0] == "A" else "A") + signature[1:]
+    assert verify_session_token(f"{payload}.{flipped}") is None
+
+
+def test_token_from_another_secret_is_rejected(monkeypatch):
+    token, _ = issue_session_token("alice", ttl=60)
+    monkeypatch.setattr(auth_tokens, "SESSION_SECRET", b"rotated")
+    assert verify_session_token(token) is None
+
+
+def test_garbage_is_rejected():
+    for token in ("", "abc", "a.b.c", "!!!.???"):
+        assert verify_session_token(token) is None
+
+
+def test_credential_cache_needs_the_same_password():
+    cache = CredentialCache(ttl=60)
+    cache.remember("alice", "correct horse")
+    assert cache.check("alice", "correct horse")
+    assert not cache.check("alice", "wrong")
+    assert not cache.check("bob", "correct horse")
+
+
+def test_credential_cache_expires_and_is_bounded():
+    cache = CredentialCache(ttl=-1)
+    cache.remember("alice", "pw")
+    assert not cache.check("alice", "pw")
+
+    cache = CredentialCache(ttl=60, max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.remember(name, "pw")
+    assert not cache.check("a", "pw")
+    assert cache.check("c", "pw")
@@ -0,0 +1,19 @@
+# test_browser_mode.py
+import pytest
+
+from services.driver_pool import resolve_browser_mode
+
+
+def test_headless_flag_decides_when_mode_is_unset():
+    assert resolve_browser_mode(headless=True, mode=None) == "headless"
+    assert resolve_browser_mode(headless=False, mode=None) == "window"
+
+
+def test_configured_mode_wins_over_the_flag():
+    assert resolve_browser_mode(headless=True, mode="window") == "window"
+    assert resolve_browser_mode(headless=False, mode="lite") == "lite"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_browser_mode(headless=True, mode="kiosk")
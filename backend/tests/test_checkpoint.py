@@ -0,0 +1,114 @@
+# test_checkpoint.py
+import asyncio
+import json
+import threading
+
+import pytest
+
+from platforms.linkedin import LinkedInAutomator
+from services.checkpoint import RunCheckpoint, CHECKPOINT_FILENAME
+from services.scheduler import AutomationCancelled
+
+PARAMS = {"job_title": "Python Developer", "location": "Berlin", "applications_limit": 3}
+
+
+def jobs(*ids):
+    return [{"job_id": job_id, "title": f"Job {job_id}", "company": "Acme", "location": "Berlin",
+             "easy_apply": True, "element": object()} for job_id in ids]
+
+
+def test_state_survives_a_reload(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path))
+    checkpoint.begin(PARAMS)
+    checkpoint.set_queue(jobs("1", "2", "3"))
+    checkpoint.job_done("1", {"job_id": "1", "status": "Applied"})
+    checkpoint.job_done("2")
+    checkpoint.set_offset(25)
+
+    saved = RunCheckpoint(str(tmp_path))
+    assert saved.load()
+    assert saved.params == PARAMS
+    assert [job["job_id"] for job in saved.queue] == ["3"]
+    # Live card elements are never written out
+    assert "element" not in saved.queue[0]
+    assert saved.processed == ["1", "2"]
+    assert saved.applied == [{"job_id": "1", "status": "Applied"}]
+    assert saved.offset == 25
+
+
+def test_missing_or_corrupt_checkpoint_loads_nothing(tmp_path):
+    assert not RunCheckpoint(str(tmp_path)).load()
+    (tmp_path / CHECKPOINT_FILENAME).write_text('{"params": {"job_ti')
+    assert not RunCheckpoint(str(tmp_path)).load()
+
+
+def test_begin_replaces_an_old_run_and_delete_removes_it(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path))
+    checkpoint.begin(PARAMS)
+    checkpoint.job_done("1", {"job_id": "1"})
+    checkpoint.begin(dict(PARAMS, location="Paris"))
+    assert checkpoint.applied == [] and checkpoint.processed == []
+    checkpoint.delete()
+    assert not checkpoint.exists()
+    checkpoint.delete()
+
+
+def test_save_never_leaves_a_partial_file(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path))
+    checkpoint.begin(PARAMS)
+    assert json.loads((tmp_path / CHECKPOINT_FILENAME).read_text())["params"] == PARAMS
+    assert not (tmp_path / (CHECKPOINT_FILENAME + ".tmp")).exists()
+
+
+def bare_automator(checkpoint, outcomes, recorded):
+    """An automator without a browser: _apply_to_job replays the given outcomes"""
+    automator = LinkedInAutomator.__new__(LinkedInAutomator)
+    automator.cancel_event = threading.Event()
+    automator.checkpoint = checkpoint
+    automator.application_callback = recorded.append
+
+    async def apply_to_job(job, status_callback):
+        outcome = outcomes[job["job_id"]]
+        if outcome == "stop":
+            raise AutomationCancelled()
+        return {"job_id": job["job_id"], "status": "Applied"} if outcome == "applied" else None
+
+    automator._apply_to_job = apply_to_job
+    return automator
+
+
+def test_stop_mid_job_leaves_it_queued_for_resume(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path))
+    checkpoint.begin(PARAMS)
+    batch = jobs("1", "2", "3", "4")
+    checkpoint.set_queue(batch)
+    recorded = []
+    automator = bare_automator(checkpoint, {"1": "applied", "2": "skipped", "3": "stop", "4": "applied"}, recorded)
+
+    applied = []
+    with pytest.raises(AutomationCancelled):
+        asyncio.run(automator._apply_in_order(batch, 3, applied, None))
+
+    assert [record["job_id"] for record in recorded] == ["1"]
+    resumed = RunCheckpoint(str(tmp_path))
+    assert resumed.load()
+    assert resumed.processed == ["1", "2"]
+    assert [job["job_id"] for job in resumed.queue] == ["3", "4"]
+    assert [record["job_id"] for record in resumed.applied] == ["1"]
+
+
+def test_resumed_run_counts_earlier_applications_towards_the_limit(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path))
+    checkpoint.begin(dict(PARAMS, applications_limit=2))
+    checkpoint.set_queue(jobs("1", "2", "3"))
+    checkpoint.job_done("1", {"job_id": "1", "status": "Applied"})
+
+    resumed = RunCheckpoint(str(tmp_path))
+    resumed.load()
+    recorded = []
+    automator = bare_automator(resumed, {"2": "applied", "3": "applied"}, recorded)
+    applied = list(resumed.applied)
+    asyncio.run(automator._apply_in_order(resumed.queue, 2, applied, None))
+
+    assert [record["job_id"] for record in applied] == ["1", "2"]
+    assert [job["job_id"] for job in resumed.queue] == ["3"]
@@ -0,0 +1,55 @@
+# test_cv_retrieval.py
+from services.cv_retrieval import CVRetriever, estimate_tokens, profile_summary, split_cv
+
+CV = """Jane Doe
+Backend engineer in Berlin
+
+EXPERIENCE
+Acme GmbH - built payment APIs in Python and Django
+Globex - maintained Kubernetes clusters on AWS
+
+Education:
+BSc Computer Science, TU Berlin
+
+Skills
+Python, Django, PostgreSQL, Docker
+
+Languages
+German (native), English (fluent), Spanish (basic)
+"""
+
+
+def test_chunks_carry_their_section_heading():
+    chunks = split_cv(CV)
+    assert chunks[0].startswith("Jane Doe")
+    assert any(chunk.startswith("Education\nBSc") for chunk in chunks)
+    assert any(chunk.startswith("Languages\nGerman") for chunk in chunks)
+
+
+def test_long_sections_are_split_by_word_count():
+    text = "EXPERIENCE\n" + "\n".join(f"role {i} did things" for i in range(10))
+    chunks = split_cv(text, max_words=8)
+    assert len(chunks) == 5
+    assert all(chunk.startswith("EXPERIENCE\n") for chunk in chunks)
+
+
+def test_question_retrieves_the_matching_section():
+    retriever = CVRetriever(CV, top_k=1)
+    assert retriever.retrieve("Which languages do you speak? Spanish?") == [
+        "Languages\nGerman (native), English (fluent), Spanish (basic)"
+    ]
+    assert "Kubernetes" in retriever.retrieve("How many years of Kubernetes experience?")[0]
+
+
+def test_no_lexical_match_falls_back_to_the_top_of_the_cv():
+    retriever = CVRetriever(CV, top_k=1)
+    assert retriever.retrieve("zzz qqq")[0].startswith("Jane Doe")
+
+
+def test_context_is_smaller_than_the_whole_cv_and_leaves_out_credentials():
+    profile = {"full_name": "Jane Doe", "skills": "Python", "linkedin_password": "secret"}
+    retriever = CVRetriever(CV, profile, top_k=1)
+    context = retriever.context("Do you know Docker?")
+    assert context.startswith("Name: Jane Doe\nSkills: Python")
+    assert "secret" not in context and "secret" not in profile_summary(profile)
+    assert estimate_tokens(context) < estimate_tokens(CV)
@@ -0,0 +1,205 @@
+# test_driver_pool.py
+import itertools
+
+import pytest
+
+from services import driver_pool
+from services.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the pool's health checks and resets"""
+
+    ids = itertools.count()
+
+    def __init__(self, user_data_dir=None):
+        self.id = next(self.ids)
+        self.user_data_dir = user_data_dir
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.switch_to = self
+        self.quit_called = False
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script, *args):
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def launched(monkeypatch):
+    drivers = []
+
+    def fake_create_driver(headless=True, user_data_dir=None, mode=None):
+        driver = FakeDriver(user_data_dir)
+        drivers.append(driver)
+        return driver
+
+    monkeypatch.setattr(driver_pool, "create_driver", fake_create_driver)
+    # Refills run inline so the tests can count launches deterministically
+    monkeypatch.setattr(DriverPool, "_warm_in_background", lambda self: self.warm())
+    return drivers
+
+
+def make_pool(size=2, max_size=4):
+    return DriverPool(size=size, max_size=max_size, persistent_profiles=True)
+
+
+def test_warm_launches_anonymous_browsers(launched):
+    pool = make_pool()
+    pool.warm()
+    assert len(launched) == 2
+    assert all(driver.user_data_dir is None for driver in launched)
+
+
+def test_first_run_for_a_user_gets_a_warm_browser(launched):
+    pool = make_pool()
+    pool.warm()
+    warm_ids = {driver.id for driver in launched}
+
+    driver = pool.acquire(timeout=0, owner="alice")
+    assert driver.id in warm_ids
+    assert pool.owner_of(driver) is None
+    # The pool tops itself back up instead of leaving the next user a cold start
+    assert len(launched) == 3
+
+
+def test_users_beyond_the_warm_browsers_do_not_evict_busy_ones(launched):
+    pool = make_pool()
+    pool.warm()
+    drivers = [pool.acquire(timeout=0, owner=name) for name in ("alice", "bob", "carol", "dave")]
+    assert len({driver.id for driver in drivers}) == 4
+    assert not any(driver.quit_called for driver in drivers)
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0, owner="erin")
+
+
+def test_idle_profile_browser_goes_back_to_its_owner(launched):
+    pool = make_pool(size=0)
+    driver = pool.acquire(timeout=0, owner="alice")
+    assert pool.owner_of(driver) == "alice"
+    assert driver.user_data_dir == driver_pool.profile_dir("alice")
+    pool.release(driver)
+
+    assert pool.acquire(timeout=0, owner="alice") is driver
+
+
+def test_profile_browser_is_not_shared_with_other_users(launched):
+    pool = make_pool(size=0)
+    driver = pool.acquire(timeout=0, owner="alice")
+    pool.release(driver)
+
+    other = pool.acquire(timeout=0, owner="bob")
+    assert other is not driver
+    assert pool.owner_of(other) == "bob"
+
+
+def test_second_session_for_same_user_is_anonymous(launched):
+    pool = make_pool(size=0)
+    first = pool.acquire(timeout=0, owner="alice")
+    second = pool.acquire(timeout=0, owner="alice")
+    assert pool.owner_of(first) == "alice"
+    assert pool.owner_of(second) is None
+
+
+def test_warm_replaces_idle_profile_browsers_at_the_cap(launched):
+    pool = make_pool(size=1, max_size=2)
+    drivers = [pool.acquire(timeout=0, owner=name) for name in ("alice", "bob")]
+    for driver in drivers:
+        pool.release(driver)
+
+    pool.warm()
+    assert sum(driver.quit_called for driver in drivers) == 1
+    assert any(driver.user_data_dir is None and not driver.quit_called for driver in launched)
+
+
+def test_eviction_at_cap_prefers_profile_browsers(launched):
+    pool = make_pool(size=0, max_size=1)
+    driver = pool.acquire(timeout=0, owner="alice")
+    pool.release(driver)
+
+    other = pool.acquire(timeout=0, owner="bob")
+    assert driver.quit_called
+    assert pool.owner_of(other) == "bob"
+
+
+def test_spare_browsers_leave_room_for_other_runs(launched):
+    pool = DriverPool(size=2, max_size=4, persistent_profiles=True, reserve=1)
+    pool.warm()
+    main = pool.acquire(timeout=0, owner="alice")
+
+    spares = []
+    while True:
+        driver = pool.acquire_spare()
+        if driver is None:
+            break
+        spares.append(driver)
+    assert len(spares) == 2
+    assert all(pool.owner_of(driver) is None for driver in spares)
+
+    # The other scheduler worker's run still gets a browser straight away
+    other = pool.acquire(timeout=0, owner="bob")
+    assert other not in spares + [main]
+
+
+def test_spare_checkout_never_evicts(launched):
+    pool = DriverPool(size=0, max_size=2, persistent_profiles=True, reserve=0)
+    first = pool.acquire(timeout=0, owner="alice")
+    idle = pool.acquire(timeout=0, owner="bob")
+    pool.release(idle)
+
+    assert pool.acquire_spare() is None
+    assert not idle.quit_called
+    pool.release(first)
+
+
+def test_worn_out_browser_is_replaced_on_release(launched):
+    pool = DriverPool(size=1, max_size=2, max_uses=1, persistent_profiles=False)
+    pool.warm()
+    driver = pool.acquire(timeout=0)
+    pool.release(driver)
+    assert driver.quit_called
+    fresh = pool.acquire(timeout=0)
+    assert fresh is not driver and not fresh.quit_called
+
+
+def test_crashed_idle_browser_is_recycled_on_acquire(launched):
+    pool = DriverPool(size=1, max_size=1, persistent_profiles=False)
+    pool.warm()
+    crashed = launched[0]
+    crashed.execute_script = lambda script, *args: (_ for _ in ()).throw(RuntimeError("chrome not reachable"))
+
+    driver = pool.acquire(timeout=0)
+    assert crashed.quit_called
+    assert driver is not crashed
+
+
+def test_anonymous_browser_is_wiped_between_users(launched, monkeypatch):
+    wiped = []
+    monkeypatch.setattr(FakeDriver, "execute_cdp_cmd", lambda self, cmd, params: wiped.append(cmd))
+    pool = DriverPool(size=1, max_size=1, persistent_profiles=False)
+    pool.warm()
+    driver = pool.acquire(timeout=0)
+    pool.release(driver)
+    assert pool.acquire(timeout=0) is driver
+    assert "Network.clearBrowserCookies" in wiped
+    assert "Storage.clearDataForOrigin" in wiped
+
+
+def test_shutdown_quits_idle_browsers_and_refuses_checkouts(launched):
+    pool = DriverPool(size=2, max_size=2, persistent_profiles=False)
+    pool.warm()
+    pool.shutdown()
+    assert all(driver.quit_called for driver in launched)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=0)
@@ -0,0 +1,208 @@
+# test_form_filling.py
+import asyncio
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from platforms.linkedin import LinkedInAutomator, FORM_SNAPSHOT_SCRIPT, RESOLVE_HANDLES_SCRIPT
+from services.answer_cache import AnswerCache
+from services.cv_retrieval import CVRetriever
+from services.metrics import RunTimer
+from services.quick_answers import QuickAnswers
+
+QUESTIONS = ["What is your notice period", "Describe your favourite project", "Which framework do you prefer"]
+
+
+class StubLLM:
+    """Replies to the batched prompt with batch_reply and to single questions with a canned answer"""
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.single_questions = []
+
+    async def complete(self, messages, api_key=None):
+        prompt = messages[-1]["content"]
+        if "JSON ANSWERS" in prompt:
+            return self.batch_reply
+        question = next(q for q in QUESTIONS if q in prompt)
+        self.single_questions.append(question)
+        return f"single answer to {question}"
+
+
+def form_automator(storage, llm):
+    """An automator without a browser whose answers come from llm"""
+    automator = LinkedInAutomator.__new__(LinkedInAutomator)
+    automator.llm = llm
+    automator.openai_api_key = "test-key"
+    automator.timer = RunTimer()
+    automator.quick_answers = QuickAnswers({})
+    automator.answer_cache = AnswerCache("jane", "fp", "cv", storage=storage)
+    automator.cv_retriever = CVRetriever("Jane Doe. Python developer with five years of Django.", {})
+    return automator
+
+
+def questions():
+    return [{"type": "text", "question": question, "options": None} for question in QUESTIONS]
+
+
+@pytest.mark.parametrize("reply, missing", [
+    ('{"q1": "30 days", "q2": "A scheduler", "q3": "Django"}', []),
+    ('```json\n{"q1": "30 days", "q3": "Django"}\n```', [QUESTIONS[1]]),
+    ('{"q1": "30 days", "q2": ', QUESTIONS),
+    ('["30 days", "A scheduler", "Django"]', QUESTIONS),
+])
+def test_batch_reply_falls_back_per_field_for_missing_answers_only(storage, reply, missing):
+    llm = StubLLM(reply)
+    answered = asyncio.run(form_automator(storage, llm)._answer_questions(questions()))
+
+    assert sorted(llm.single_questions) == sorted(missing)
+    for q in answered:
+        if q["question"] in missing:
+            assert q["answer"] == f"single answer to {q['question']}"
+        else:
+            assert not q["answer"].startswith("single answer")
+
+
+class FakeInput:
+    def __init__(self, stale=False):
+        self.stale = stale
+        self.typed = ""
+
+    def click(self):
+        if self.stale:
+            raise StaleElementReferenceException("re-rendered")
+
+    def clear(self):
+        self.typed = ""
+
+    def send_keys(self, text):
+        self.typed += text
+
+
+class FakeLabel:
+    def __init__(self):
+        self.clicked = False
+
+    def click(self):
+        self.clicked = True
+
+
+class SnapshotDriver:
+    """Returns a canned form snapshot and resolves handles to fresh elements"""
+
+    def __init__(self, snapshot, fresh=None):
+        self.snapshot = snapshot
+        self.fresh = fresh or {}
+        self.resolved = []
+
+    def execute_script(self, script, *args):
+        if script == FORM_SNAPSHOT_SCRIPT:
+            return self.snapshot
+        if script == RESOLVE_HANDLES_SCRIPT:
+            self.resolved.append(args[0])
+            return [self.fresh.get(handle) for handle in args[0]]
+        return None
+
+
+class StubPacer:
+    def wait_for(self, condition, label, timeout=None):
+        return True
+
+    def jitter(self, label="jitter", scale=1.0):
+        pass
+
+    def keystroke(self):
+        pass
+
+
+def snapshot_automator(driver):
+    automator = LinkedInAutomator.__new__(LinkedInAutomator)
+    automator.driver = driver
+    automator.pacer = StubPacer()
+    automator.timer = RunTimer()
+    return automator
+
+
+def text_field(handle, element, **identifiers):
+    field = {"handle": handle, "element": element, "placeholder": "", "ariaLabel": "", "name": "", "id": "", "label": ""}
+    field.update(identifiers)
+    return field
+
+
+def test_snapshot_records_become_questions():
+    yes, no = FakeLabel(), FakeLabel()
+    snapshot = {
+        "inputs": [
+            text_field("h1", FakeInput(), label="Mobile phone number", id="phone"),
+            text_field("h2", FakeInput()),
+        ],
+        "radios": [
+            {"handle": "h3", "element": object(), "question": "Will you relocate?", "selectableOptions": False,
+             "labels": [{"handle": "h4", "element": yes, "text": "Yes"}, {"handle": "h5", "element": no, "text": "No"}]},
+            {"handle": "h6", "element": object(), "question": "", "selectableOptions": True, "labels": []},
+            {"handle": "h7", "element": object(), "question": "Empty", "selectableOptions": False, "labels": []},
+        ],
+        "dropdowns": [
+            {"handle": "h8", "element": object(), "question": "", "options": ["Native", "Fluent"]},
+            {"handle": "h9", "element": object(), "question": "Placeholder only", "options": []},
+        ],
+    }
+    questions = snapshot_automator(SnapshotDriver(snapshot))._snapshot_form()
+
+    assert [(q["type"], q["question"], q["options"], q["handle"]) for q in questions] == [
+        ("text", "mobile phone number phone", None, "h1"),
+        ("radio", "Will you relocate?", ["Yes", "No"], "h3"),
+        ("radio", "Choose the most appropriate option for this application", ["Yes", "No"], "h6"),
+        ("dropdown", "Select the most appropriate option", ["Native", "Fluent"], "h8"),
+    ]
+    assert questions[1]["labels"][0]["element"] is yes
+
+
+def fill(driver):
+    automator = snapshot_automator(driver)
+
+    async def answer_questions(questions):
+        for q in questions:
+            q["answer"] = "42" if q["type"] == "text" else "No"
+        return questions
+
+    automator._answer_questions = answer_questions
+    assert asyncio.run(automator._fill_form_page())
+
+
+def test_rerendered_controls_are_found_again_by_handle_and_retried_once():
+    fresh_input, fresh_no = FakeInput(), FakeLabel()
+    snapshot = {
+        "inputs": [text_field("h1", FakeInput(stale=True), label="Years of experience")],
+        "radios": [{"handle": "h2", "element": object(), "question": "Relocate?", "selectableOptions": False,
+                    "labels": [{"handle": "h3", "element": FakeLabel(), "text": "Yes"},
+                               {"handle": "h4", "element": FakeInput(stale=True), "text": "No"}]}],
+    }
+    driver = SnapshotDriver(snapshot, {"h1": fresh_input, "h2": object(), "h3": FakeLabel(), "h4": fresh_no})
+    fill(driver)
+
+    assert driver.resolved == [["h1"], ["h2", "h3", "h4"]]
+    assert fresh_input.typed == "42"
+    assert fresh_no.clicked
+
+
+def test_control_that_vanished_or_stays_stale_is_skipped():
+    still_stale = FakeInput(stale=True)
+    snapshot = {"inputs": [text_field("h1", FakeInput(stale=True), label="Gone"),
+                           text_field("h2", FakeInput(stale=True), label="Still stale")]}
+    driver = SnapshotDriver(snapshot, {"h2": still_stale})
+    fill(driver)
+
+    # One re-lookup each, no second retry
+    assert driver.resolved == [["h1"], ["h2"]]
+    assert still_stale.typed == ""
+
+
+def test_each_question_is_looked_up_in_the_cache_once(storage):
+    automator = form_automator(storage, StubLLM('{"q1": "30 days"}'))
+    automator.answer_cache.put(QUESTIONS[2], "Django")
+    asyncio.run(automator._answer_questions(questions()))
+
+    # One hit for the cached question, one miss each for the two that went to GPT
+    assert (automator.answer_cache.hits, automator.answer_cache.misses) == (1, 2)
+    assert automator.answer_cache.get(QUESTIONS[1]) == f"single answer to {QUESTIONS[1]}"
@@ -0,0 +1,44 @@
+# test_job_cards.py
+from platforms.linkedin import harvest_job_cards, JOB_CARD_HARVEST_SCRIPT
+from services.job_index import JobIndex
+
+
+class HarvestDriver:
+    """Returns canned job card records from the harvest script"""
+
+    def __init__(self, records):
+        self.records = records
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return self.records
+
+
+def card(job_id, title="Python Developer", company="Acme", easy_apply=True):
+    return {"job_id": job_id, "title": title, "company": company, "location": "Berlin",
+            "easy_apply": easy_apply, "element": object()}
+
+
+def test_records_keep_their_shape_and_badge_flag_in_page_order():
+    cards = [card("3912345678"), card("3912345679", title="", company="", easy_apply=False)]
+    driver = HarvestDriver(cards)
+    records = harvest_job_cards(driver)
+
+    # The whole page is read in one script call
+    assert driver.scripts == [JOB_CARD_HARVEST_SCRIPT]
+    assert [set(record) for record in records] == [{"job_id", "title", "company", "location", "easy_apply", "element"}] * 2
+    assert [record["easy_apply"] for record in records] == [True, False]
+    assert (records[1]["title"], records[1]["company"]) == ("Unknown Position", "Unknown Company")
+    assert records[0]["element"] is cards[0]["element"]
+
+
+def test_known_jobs_are_left_out(tmp_path):
+    known = JobIndex(str(tmp_path))
+    known.add("3912345678", "applied")
+    records = harvest_job_cards(HarvestDriver([card("3912345678"), card("3912345679")]), known)
+    assert [record["job_id"] for record in records] == ["3912345679"]
+
+
+def test_page_without_cards_harvests_nothing():
+    assert harvest_job_cards(HarvestDriver(None)) == []
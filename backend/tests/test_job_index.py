@@ -0,0 +1,94 @@
+# test_job_index.py
+import asyncio
+
+from selenium.common.exceptions import TimeoutException
+
+from platforms.linkedin import LinkedInAutomator
+from services import job_index
+from services.job_index import JobIndex, load_job_index, INDEX_FILENAME, JOURNAL_FILENAME
+from services.metrics import RunTimer
+from services.request_filter import RequestStats
+
+
+def test_added_ids_survive_a_reload(tmp_path):
+    index = JobIndex(str(tmp_path))
+    index.add("3912345678", "applied")
+    index.add(3912345679, "rejected")
+    assert "3912345678" in index and 3912345679 in index
+
+    reloaded = JobIndex(str(tmp_path))
+    assert "3912345678" in reloaded and "3912345679" in reloaded
+    assert "3912345670" not in reloaded
+    assert len(reloaded) == 2
+
+
+def test_non_numeric_ids_are_ignored(tmp_path):
+    index = JobIndex(str(tmp_path))
+    index.add("job-card-7")
+    assert "job-card-7" not in index
+    assert len(index) == 0
+
+
+def test_compaction_folds_the_journal_into_the_sorted_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_index, "JOURNAL_COMPACT_SIZE", 3)
+    index = JobIndex(str(tmp_path))
+    for job_id in (30, 10, 20):
+        index.add(job_id)
+    assert (tmp_path / JOURNAL_FILENAME).exists()
+
+    reloaded = JobIndex(str(tmp_path))
+    assert not (tmp_path / JOURNAL_FILENAME).exists()
+    assert list(reloaded._ids) == [10, 20, 30]
+    assert all(job_id in reloaded for job_id in (10, 20, 30))
+
+
+def test_torn_journal_line_is_skipped(tmp_path):
+    JobIndex(str(tmp_path)).add(42)
+    with open(tmp_path / JOURNAL_FILENAME, "a") as f:
+        f.write("applied 4")
+    reloaded = JobIndex(str(tmp_path))
+    assert 42 in reloaded
+    assert 4 not in reloaded
+
+
+def test_first_load_is_seeded_from_stored_applications(tmp_path, storage):
+    storage.import_applications("alice", [{"job_id": "555", "jobTitle": "Dev", "company": "Acme", "status": "Applied"}])
+    index = load_job_index("alice", str(tmp_path))
+    assert "555" in index
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+class StubPacer:
+    """Pacer whose Easy Apply button either never shows up or is a plain Apply button"""
+
+    def __init__(self, button_text=None):
+        self.button_text = button_text
+
+    def clickable(self, locator, label, timeout=None, required=False):
+        if self.button_text is None:
+            raise TimeoutException("no apply button")
+        return type("Button", (), {"text": self.button_text})()
+
+
+def apply_with(tmp_path, pacer):
+    automator = LinkedInAutomator.__new__(LinkedInAutomator)
+    automator.pacer = pacer
+    automator.timer = RunTimer()
+    automator.request_stats = RequestStats()
+    automator.request_stats.available = False
+    automator.driver = None
+    automator.job_index = JobIndex(str(tmp_path))
+    automator._open_job = lambda job: None
+    job = {"job_id": "3912345678", "title": "Python Developer", "company": "Acme"}
+    assert asyncio.run(automator._apply_to_job(job, None)) is None
+    return automator.job_index
+
+
+def test_apply_button_timeout_skips_the_job_for_this_run_only(tmp_path):
+    assert "3912345678" not in apply_with(tmp_path, StubPacer())
+    assert "3912345678" not in JobIndex(str(tmp_path))
+
+
+def test_confirmed_non_easy_apply_job_is_rejected_for_good(tmp_path):
+    apply_with(tmp_path, StubPacer("Apply on company website"))
+    assert "3912345678" in JobIndex(str(tmp_path))
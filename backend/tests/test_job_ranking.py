@@ -0,0 +1,49 @@
+# test_job_ranking.py
+from services.job_ranking import JobRanker, tokenize
+
+PROFILE = {"job_title_preference": "Python Developer", "skills": "django, postgresql", "experience_years": 3}
+
+
+def job(title, easy_apply=True):
+    return {"title": title, "easy_apply": easy_apply}
+
+
+def test_tokens_keep_language_names_and_drop_stop_words():
+    assert tokenize("Senior C++ / C# and Node.js Engineer (m/f/d)") == ["senior", "c++", "c#", "node.js", "engineer"]
+
+
+def test_relevant_titles_come_first_and_unrelated_ones_are_dropped():
+    ranker = JobRanker(PROFILE, "python developer", min_score=0.1)
+    ranked = ranker.rank([job("Sales Manager"), job("Django Engineer"), job("Python Developer")])
+    assert [j["title"] for j in ranked] == ["Python Developer", "Django Engineer"]
+    assert ranked[0]["score"] >= ranked[1]["score"]
+
+
+def test_jobs_without_easy_apply_are_dropped():
+    ranked = JobRanker(PROFILE, "python developer").rank([job("Python Developer", easy_apply=False)])
+    assert ranked == []
+
+
+def test_titles_above_or_below_the_profiles_seniority_are_scaled_down():
+    scores = JobRanker(PROFILE, "python developer").score(
+        [job("Python Developer"), job("Senior Python Developer"), job("Junior Python Developer")]
+    )
+    assert scores[1] < scores[0] and scores[2] < scores[0]
+
+    senior_profile = dict(PROFILE, experience_years=8)
+    scores = JobRanker(senior_profile, "python developer").score([job("Python Developer"), job("Senior Python Developer")])
+    assert scores[1] > scores[0] * 0.5
+
+
+def test_empty_profile_keeps_page_order():
+    ranked = JobRanker({}, "").rank([job("B"), job("A")])
+    assert [j["title"] for j in ranked] == ["B", "A"]
+    assert all(j["score"] == 0.0 for j in ranked)
+
+
+def test_default_settings_keep_synonym_titles_that_share_no_words():
+    profile = {"job_title_preference": "Software Engineer", "skills": "python", "experience_years": 3}
+    titles = ["Backend Developer", "Software Engineer", "Full Stack Developer", "SDE II", "Programmer"]
+    ranked = JobRanker(profile, "software engineer").rank([job(title) for title in titles])
+    assert ranked[0]["title"] == "Software Engineer"
+    assert sorted(j["title"] for j in ranked) == sorted(titles)
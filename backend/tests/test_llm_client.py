@@ -0,0 +1,59 @@
+# test_llm_client.py
+import asyncio
+import time
+
+import pytest
+
+from services.llm_client import TokenBucket, parse_duration
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("20ms", 0.02), ("1s", 1.0), ("6m0s", 360.0), ("1h2m", 3720.0), ("2.5", 2.5), (None, None), ("soon", None),
+])
+def test_reset_durations_are_parsed(value, seconds):
+    if seconds is None:
+        assert parse_duration(value) is None
+    else:
+        assert parse_duration(value) == pytest.approx(seconds)
+
+
+def test_bucket_spends_without_waiting_while_it_has_budget():
+    async def scenario():
+        bucket = TokenBucket(per_minute=600)
+        started = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire(100)
+        return time.monotonic() - started, bucket.tokens
+
+    elapsed, left = asyncio.run(scenario())
+    assert elapsed < 0.1
+    assert left < 200
+
+
+def test_bucket_waits_for_refill_when_empty():
+    async def scenario():
+        bucket = TokenBucket(per_minute=6000)
+        await bucket.acquire(6000)
+        started = time.monotonic()
+        # 100 tokens refill in a second at 6000 per minute
+        await bucket.acquire(10)
+        return time.monotonic() - started
+
+    assert 0.05 < asyncio.run(scenario()) < 1
+
+
+def test_headers_shrink_the_budget_and_block_until_reset():
+    bucket = TokenBucket(per_minute=60)
+    bucket.update(limit=30, remaining=0, reset=5)
+    assert bucket.capacity == 30
+    assert bucket.tokens == 0
+    assert bucket.blocked_until > time.monotonic() + 4
+
+
+def test_oversized_requests_wait_for_a_full_bucket_not_forever():
+    async def scenario():
+        bucket = TokenBucket(per_minute=100)
+        await asyncio.wait_for(bucket.acquire(10_000), timeout=1)
+        return bucket.tokens
+
+    assert asyncio.run(scenario()) < 1
@@ -0,0 +1,31 @@
+# test_metrics.py
+import pytest
+
+from services.metrics import RunTimer, render_metrics
+
+
+def test_stages_are_summed_per_run():
+    timer = RunTimer()
+    timer.record("form_page", 0.5)
+    timer.record("form_page", 1.5)
+    timer.record("login", 2.0)
+    summary = timer.summary()
+    assert summary["stages"]["form_page"] == {"count": 2, "total": 2.0, "max": 1.5}
+    assert summary["stages"]["login"]["count"] == 1
+    assert "waits" not in summary
+    assert timer.summary(waits={"after_click": {}})["waits"] == {"after_click": {}}
+
+
+def test_stage_is_recorded_even_when_the_block_raises():
+    timer = RunTimer()
+    with pytest.raises(RuntimeError):
+        with timer.stage("test_failing_stage"):
+            raise RuntimeError("boom")
+    assert timer.summary()["stages"]["test_failing_stage"]["count"] == 1
+
+
+def test_observations_reach_the_prometheus_histogram():
+    RunTimer().record("test_exported_stage", 0.25)
+    body, content_type = render_metrics()
+    assert content_type.startswith("text/plain")
+    assert b'cogniapply_stage_seconds_count{stage="test_exported_stage"} 1.0' in body
@@ -0,0 +1,42 @@
+# test_pacing.py
+import threading
+
+import pytest
+
+from services.pacing import Pacer
+from services.scheduler import AutomationCancelled
+
+
+def cancelled_pacer():
+    cancel_event = threading.Event()
+    cancel_event.set()
+    return Pacer("fast", cancel_event)
+
+
+def test_sleep_raises_once_the_run_is_stopped():
+    pacer = cancelled_pacer()
+    with pytest.raises(AutomationCancelled):
+        pacer.sleep(0.01, "pause")
+
+
+def test_uncancellable_block_finishes_its_waits():
+    pacer = cancelled_pacer()
+    with pacer.uncancellable():
+        pacer.sleep(0.01, "after_submit")
+        pacer.jitter("popup")
+    assert pacer.timings["after_submit"]["count"] == 1
+
+
+def test_stop_takes_effect_after_the_uncancellable_block():
+    pacer = cancelled_pacer()
+    with pacer.uncancellable():
+        with pacer.uncancellable():
+            pass
+        pacer.sleep(0, "still_shielded")
+    with pytest.raises(AutomationCancelled):
+        pacer.sleep(0, "next_job")
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        Pacer("reckless")
@@ -0,0 +1,137 @@
+# test_parallel_apply.py
+import asyncio
+import threading
+import time
+
+from platforms.linkedin import LinkedInAutomator, OrderedStatusReporter
+from services.pacing import Pacer
+from services.quick_answers import QuickAnswers
+from services.request_filter import RequestStats
+
+
+class FakeDriver:
+    def get_cookies(self):
+        return [{"name": "li_at", "value": "token", "domain": ".linkedin.com", "sameSite": "None"}]
+
+    def get(self, url):
+        pass
+
+    def add_cookie(self, cookie):
+        pass
+
+    def get_log(self, log_type):
+        return []
+
+
+class FakePool:
+    """Hands out a fixed number of spare browsers, then None"""
+
+    def __init__(self, spares):
+        self.spares = [FakeDriver() for _ in range(spares)]
+        self.released = []
+
+    def acquire_spare(self):
+        return self.spares.pop() if self.spares else None
+
+    def release(self, driver):
+        self.released.append(driver)
+
+
+def jobs(*ids):
+    return [{"job_id": job_id, "title": f"Job {job_id}", "company": "Acme", "element": object()} for job_id in ids]
+
+
+def bare_automator(pool, batch, apply_to_job):
+    """An automator without a real browser: one results page of jobs, applied to by apply_to_job"""
+    automator = LinkedInAutomator.__new__(LinkedInAutomator)
+    automator.username = "tester"
+    automator.profile_data = {}
+    automator.cancel_event = threading.Event()
+    automator.checkpoint = None
+    automator.application_callback = None
+    automator.driver = FakeDriver()
+    automator.driver_source = pool
+    automator.pacer = Pacer("fast", automator.cancel_event)
+    automator.quick_answers = QuickAnswers({})
+    automator.request_stats = RequestStats()
+    pages = [batch]
+    automator._next_ranked_jobs = lambda seen_job_ids: pages.pop() if pages else []
+    automator._load_more_results = lambda: False
+    automator._apply_to_job = apply_to_job
+    return automator
+
+
+def run(automator, limit, sessions=3):
+    applied, messages = [], []
+
+    async def status_callback(message):
+        messages.append(message)
+
+    asyncio.run(automator._apply_in_parallel(limit, applied, set(), status_callback, sessions))
+    return applied, messages
+
+
+def test_dispatch_never_starts_more_jobs_than_the_limit_could_need():
+    started, lock = [], threading.Lock()
+    outcomes = {"1": None, "2": "applied", "3": "applied", "4": "applied", "5": "applied"}
+
+    async def apply_to_job(job, report):
+        with lock:
+            started.append(job["job_id"])
+        time.sleep(0.02)
+        return {"job_id": job["job_id"]} if outcomes[job["job_id"]] else None
+
+    pool = FakePool(spares=3)
+    applied, _ = run(bare_automator(pool, jobs("1", "2", "3", "4", "5"), apply_to_job), limit=2)
+
+    assert len(applied) == 2
+    # Two jobs could reach the limit; the failed first one frees room for exactly one more
+    assert sorted(started) == ["1", "2", "3"]
+    assert len(pool.released) == 3
+
+
+def test_status_messages_come_out_in_job_order():
+    first_job_may_finish = threading.Event()
+
+    async def apply_to_job(job, report):
+        await report(f"start {job['job_id']}")
+        if job["job_id"] == "1":
+            # The second job finishes while the first is still running
+            first_job_may_finish.wait(timeout=2)
+        await report(f"done {job['job_id']}")
+        if job["job_id"] == "2":
+            first_job_may_finish.set()
+        return {"job_id": job["job_id"]}
+
+    applied, messages = run(bare_automator(FakePool(spares=2), jobs("1", "2"), apply_to_job), limit=2)
+
+    assert messages == ["start 1", "done 1", "start 2", "done 2"]
+    assert {record["job_id"] for record in applied} == {"1", "2"}
+
+
+def test_no_spare_browsers_falls_back_to_sequential():
+    automator = bare_automator(FakePool(spares=0), jobs("1"), None)
+    calls = []
+
+    async def apply_from_search_results(limit, applied_jobs, seen_job_ids, status_callback):
+        calls.append(limit)
+
+    automator._apply_from_search_results = apply_from_search_results
+    run(automator, limit=4)
+    assert calls == [4]
+
+
+def test_reporter_flushes_held_messages_on_close():
+    async def scenario():
+        messages = []
+
+        async def status_callback(message):
+            messages.append(message)
+
+        reporter = OrderedStatusReporter(status_callback, asyncio.get_running_loop())
+        reporter.post(1, "later job")
+        reporter.post(0, "first job")
+        await reporter.close()
+        return messages
+
+    assert asyncio.run(scenario()) == ["first job", "later job"]
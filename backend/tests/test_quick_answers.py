@@ -0,0 +1,71 @@
+# test_quick_answers.py
+from services.quick_answers import QuickAnswers, parse_overrides
+
+PROFILE = {
+    "full_name": "Ada Lovelace",
+    "linkedin_email": "ada@example.com",
+    "phone": "+44 20 7946 0000",
+    "linkedin_url": "https://www.linkedin.com/in/ada",
+    "github_url": "https://github.com/ada",
+    "experience_years": 7,
+    "salary_range": "90,000 - 110,000",
+}
+
+
+def test_contact_details_come_from_the_profile():
+    quick = QuickAnswers(PROFILE)
+    assert quick.answer("Email address") == "ada@example.com"
+    assert quick.answer("Mobile phone number") == "+44 20 7946 0000"
+    assert quick.answer("First name") == "Ada"
+    assert quick.answer("Last name") == "Lovelace"
+
+
+def test_general_years_of_experience_is_answered_but_skill_specific_is_not():
+    quick = QuickAnswers(PROFILE)
+    assert quick.answer("How many years of work experience do you have?") == "7"
+    assert quick.answer("How many years of experience do you have with Kubernetes?") is None
+
+
+def test_salary_uses_the_lower_bound_of_the_range():
+    assert QuickAnswers(PROFILE).answer("What are your salary expectations?") == "90000"
+
+
+def test_legal_questions_are_not_answered_without_an_override():
+    quick = QuickAnswers(PROFILE)
+    assert quick.answer("Are you legally authorized to work in the United States?", ["Yes", "No"]) is None
+    assert quick.answer("Will you now or in the future require sponsorship for employment visa status?",
+                        ["Yes", "No"]) is None
+
+
+def test_legal_questions_use_the_users_override():
+    quick = QuickAnswers(dict(PROFILE, answer_overrides="work authorization = No\nsponsorship = Yes"))
+    assert quick.answer("Are you legally authorized to work in the United States?", ["Yes", "No"]) == "No"
+    assert quick.answer("Will you require sponsorship?", ["Yes", "No"]) == "Yes"
+
+
+def test_linkedin_url_needs_profile_wording():
+    quick = QuickAnswers(PROFILE)
+    assert quick.answer("LinkedIn Profile") == "https://www.linkedin.com/in/ada"
+    assert quick.answer("Please share the URL of your LinkedIn") == "https://www.linkedin.com/in/ada"
+    assert quick.answer("How did you hear about us?", ["LinkedIn", "Indeed", "Other"]) is None
+    assert quick.answer("Where did you find this role? LinkedIn, Indeed, Other") is None
+
+
+def test_answer_must_fit_the_offered_options():
+    quick = QuickAnswers(dict(PROFILE, answer_overrides="relocate = Maybe"))
+    assert quick.answer("Are you willing to relocate?", ["Yes", "No"]) is None
+
+
+def test_override_keywords_are_normalized_and_longest_wins():
+    overrides = parse_overrides("Notice Period = 30 days\nyears of python experience = 5\nexperience = 7\nbroken line")
+    assert overrides == {"notice period": "30 days", "years of python experience": "5", "experience": "7"}
+
+    quick = QuickAnswers({"answer_overrides": "years of python experience = 5\nexperience = 7"})
+    assert quick.answer("How many years of Python experience do you have?") == "5"
+
+
+def test_hit_rate_is_tracked():
+    quick = QuickAnswers(PROFILE)
+    quick.answer("Email")
+    quick.answer("Describe a project you are proud of")
+    assert quick.stats() == {"hits": 1, "misses": 1, "hitRate": 0.5}
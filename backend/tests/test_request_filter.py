@@ -0,0 +1,68 @@
+# test_request_filter.py
+import json
+
+from services.request_filter import RequestStats, blocklist, install_request_filter
+
+
+def event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    def __init__(self, entries=None, fail=False):
+        self.entries = entries or []
+        self.fail = fail
+        self.commands = []
+
+    def get_log(self, kind):
+        if self.fail:
+            raise RuntimeError("performance log not enabled")
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+
+
+def test_filter_sends_the_blocklist_to_the_browser():
+    driver = FakeDriver()
+    install_request_filter(driver)
+    assert driver.commands[0] == ("Network.enable", {})
+    assert driver.commands[1] == ("Network.setBlockedURLs", {"urls": blocklist()})
+    assert not any("voyager" in pattern for pattern in blocklist())
+
+
+def test_blocked_failed_and_received_are_counted():
+    driver = FakeDriver([
+        event("Network.requestWillBeSent", requestId="1", request={"url": "https://www.linkedin.com/jobs/"}),
+        event("Network.loadingFinished", requestId="1", encodedDataLength=1500),
+        event("Network.requestWillBeSent", requestId="2", request={"url": "https://px.ads.linkedin.com/x"}),
+        event("Network.loadingFailed", requestId="2", blockedReason="inspector"),
+        event("Network.requestWillBeSent", requestId="3", request={"url": "https://www.linkedin.com/api"}),
+        event("Network.loadingFailed", requestId="3", errorText="net::ERR_FAILED"),
+        event("Page.frameNavigated"),
+        {"message": "not json"},
+    ])
+    stats = RequestStats()
+    stats.collect(driver)
+    summary = stats.summary()
+    assert summary["requests"] == 3
+    assert summary["blocked"] == 1
+    assert summary["failed"] == 1
+    assert summary["bytesReceived"] == 1500
+    assert summary["topBlockedHosts"] == {"px.ads.linkedin.com": 1}
+
+
+def test_missing_performance_log_disables_counting():
+    stats = RequestStats()
+    stats.collect(FakeDriver(fail=True))
+    stats.collect(FakeDriver(fail=True))
+    assert stats.summary()["available"] is False
+
+
+def test_discard_drops_events_from_before_the_run():
+    driver = FakeDriver([event("Network.requestWillBeSent", requestId="1", request={"url": "https://a.example/"})])
+    stats = RequestStats()
+    stats.discard(driver)
+    stats.collect(driver)
+    assert stats.summary()["requests"] == 0
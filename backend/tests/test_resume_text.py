@@ -0,0 +1,58 @@
+# test_resume_text.py
+import zipfile
+
+import pytest
+
+from services import resume_text
+from services.resume_text import extract_resume_text, load_resume_text, remove_resume_text, RESUME_TEXT_FILE
+
+DOCUMENT_XML = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    '<w:p><w:r><w:t>Jane </w:t></w:r><w:r><w:t>Doe</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t> </w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Python developer</w:t></w:r></w:p>'
+    '</w:body></w:document>'
+)
+
+
+def write_docx(path, xml=DOCUMENT_XML):
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("word/document.xml", xml)
+
+
+def test_docx_paragraphs_are_extracted(tmp_path):
+    path = tmp_path / "resume.docx"
+    write_docx(path)
+    assert extract_resume_text(str(path)) == "Jane Doe\nPython developer"
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        extract_resume_text(str(tmp_path / "resume.txt"))
+
+
+def test_text_is_extracted_once_per_file_content(tmp_path, monkeypatch):
+    path = tmp_path / "resume.docx"
+    write_docx(path)
+    calls = []
+    original = resume_text.extract_resume_text
+    monkeypatch.setattr(resume_text, "extract_resume_text", lambda p: calls.append(p) or original(p))
+
+    assert load_resume_text(str(path)) == "Jane Doe\nPython developer"
+    assert load_resume_text(str(path)) == "Jane Doe\nPython developer"
+    assert len(calls) == 1
+
+    # New content under the same name is extracted again
+    write_docx(path, DOCUMENT_XML.replace("Python", "Rust"))
+    assert load_resume_text(str(path)) == "Jane Doe\nRust developer"
+    assert len(calls) == 2
+
+
+def test_removed_cache_is_rebuilt(tmp_path):
+    path = tmp_path / "resume.docx"
+    write_docx(path)
+    load_resume_text(str(path))
+    assert (tmp_path / RESUME_TEXT_FILE).exists()
+    remove_resume_text(str(tmp_path))
+    assert not (tmp_path / RESUME_TEXT_FILE).exists()
+    remove_resume_text(str(tmp_path))
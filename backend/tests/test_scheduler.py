@@ -0,0 +1,71 @@
+# test_scheduler.py
+import threading
+
+from services.scheduler import AutomationScheduler, AutomationCancelled
+
+
+def test_queue_positions_take_turns_across_users():
+    scheduler = AutomationScheduler(max_workers=1)
+    noop = lambda cancel_event: None
+    assert scheduler.submit("alice", noop) == 1
+    assert scheduler.submit("alice", noop) == 2
+    # Bob's first run goes ahead of Alice's second
+    assert scheduler.submit("bob", noop) == 2
+    assert scheduler.position("alice") == 1
+    assert scheduler.position("bob") == 2
+    assert scheduler.position("carol") is None
+
+
+def test_runs_are_fair_and_one_per_user_at_a_time():
+    scheduler = AutomationScheduler(max_workers=1)
+    order = []
+    done = threading.Event()
+
+    def run(label, cancel_event):
+        order.append(label)
+        if len(order) == 4:
+            done.set()
+
+    for label in ("a1", "a2", "a3"):
+        scheduler.submit("alice", run, label)
+    scheduler.submit("bob", run, "b1")
+    scheduler.start()
+    assert done.wait(5)
+    scheduler.shutdown()
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+def test_cancel_stops_the_running_job_and_drops_queued_ones():
+    scheduler = AutomationScheduler(max_workers=1)
+    started = threading.Event()
+    finished = threading.Event()
+    ran = []
+
+    def long_run(cancel_event):
+        started.set()
+        try:
+            if cancel_event.wait(5):
+                raise AutomationCancelled()
+        finally:
+            finished.set()
+
+    scheduler.submit("alice", long_run)
+    scheduler.submit("alice", lambda cancel_event: ran.append("second"))
+    scheduler.start()
+    assert started.wait(5)
+    assert scheduler.is_active("alice")
+
+    assert scheduler.cancel("alice")
+    assert finished.wait(5)
+    scheduler.shutdown()
+    assert ran == []
+
+
+def test_waiting_users_hear_their_position():
+    positions = {}
+    scheduler = AutomationScheduler(max_workers=1, on_queue_change=lambda user, pos: positions.__setitem__(user, pos))
+    scheduler.submit("alice", lambda cancel_event: None)
+    scheduler.submit("bob", lambda cancel_event: None)
+    assert positions == {"alice": 1, "bob": 2}
+    scheduler.cancel("alice")
+    assert positions["bob"] == 1
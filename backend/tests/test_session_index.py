@@ -0,0 +1,52 @@
+# test_session_index.py
+import time
+
+from services import session_index
+from services.session_index import SessionIndex, SESSION_FILENAME
+
+
+def cookies(expiry):
+    return [
+        {"name": "li_at", "value": "x", "expiry": expiry},
+        {"name": "JSESSIONID", "value": "y", "expiry": expiry + 100},
+        {"name": "lang", "value": "en"},
+    ]
+
+
+def test_recorded_session_is_trusted_across_runs(tmp_path):
+    SessionIndex(str(tmp_path)).record(cookies(time.time() + 86400))
+    index = SessionIndex(str(tmp_path))
+    assert index.is_trusted()
+
+
+def test_earliest_auth_cookie_expiry_wins(tmp_path):
+    expiry = time.time() + 86400
+    index = SessionIndex(str(tmp_path))
+    index.record(cookies(expiry))
+    assert index.expires_at == expiry
+
+
+def test_cookies_about_to_expire_are_not_trusted(tmp_path):
+    index = SessionIndex(str(tmp_path))
+    index.record(cookies(time.time() + 60))
+    assert not index.is_trusted()
+
+
+def test_trust_lapses_after_the_recheck_interval(tmp_path):
+    index = SessionIndex(str(tmp_path))
+    index.record(cookies(time.time() + 30 * 86400))
+    later = time.time() + session_index.SESSION_TRUST_SECONDS + 1
+    assert not index.is_trusted(now=later)
+
+
+def test_session_without_li_at_is_not_vouched_for(tmp_path):
+    index = SessionIndex(str(tmp_path))
+    index.record(cookies(time.time() + 86400))
+    index.record([{"name": "JSESSIONID", "value": "y", "expiry": time.time() + 86400}])
+    assert not index.is_trusted()
+    assert not (tmp_path / SESSION_FILENAME).exists()
+
+
+def test_unreadable_index_is_ignored(tmp_path):
+    (tmp_path / SESSION_FILENAME).write_text("{not json")
+    assert not SessionIndex(str(tmp_path)).is_trusted()
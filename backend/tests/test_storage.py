@@ -0,0 +1,73 @@
+# test_storage.py
+import json
+
+from services.storage import Storage
+
+
+def test_usernames_are_unique(storage):
+    assert storage.create_user("alice", "alice@example.com", "hash")
+    assert not storage.create_user("alice", "other@example.com", "hash2")
+    assert storage.get_user("alice")["email"] == "alice@example.com"
+    assert storage.get_user("bob") is None
+
+
+def test_profile_round_trip_and_update(storage):
+    assert storage.get_profile("alice") == {}
+    storage.save_profile("alice", {"full_name": "Alice"})
+    storage.save_profile("alice", {"full_name": "Alice A."})
+    assert storage.get_profile("alice") == {"full_name": "Alice A."}
+
+
+def record(job_id, timestamp, title="Engineer"):
+    return {"job_id": job_id, "jobTitle": title, "company": "Acme", "status": "Applied", "timestamp": timestamp}
+
+
+def test_applications_are_filtered_by_date(storage):
+    storage.import_applications("alice", [
+        record("1", "2026-01-01 09:00:00"),
+        record("2", "2026-02-01 09:00:00"),
+        record("3", "2026-03-01 09:00:00"),
+    ])
+    storage.import_applications("bob", [record("9", "2026-02-01 09:00:00")])
+
+    found = storage.get_applications("alice", since="2026-01-15", until="2026-02-15")
+    assert [row["job_id"] for row in found] == ["2"]
+    assert storage.get_application("alice", "3")["job_title"] == "Engineer"
+    assert sorted(storage.get_applied_job_ids("alice")) == ["1", "2", "3"]
+
+
+def test_import_skips_records_already_stored(storage):
+    records = [record("1", "2026-01-01 09:00:00"), record("2", "2026-01-02 09:00:00")]
+    assert storage.import_applications("alice", records) == 2
+    assert storage.import_applications("alice", records + [record("3", "2026-01-03 09:00:00")]) == 1
+    assert len(storage.get_applications("alice")) == 3
+
+
+def test_answer_cache_is_dropped_when_the_fingerprint_changes(storage):
+    entries = {"q1": {"question": "Q1", "answer": "A1", "last_used": 1.0}}
+    storage.save_answers("alice", "fp1", entries, max_entries=10)
+    assert storage.load_answer_cache("alice", "fp1") == entries
+    assert storage.load_answer_cache("alice", "fp2") == {}
+    assert storage.load_answer_cache("alice", "fp1") == {}
+
+
+def test_answer_cache_keeps_the_most_recently_used(storage):
+    entries = {f"q{i}": {"question": f"Q{i}", "answer": "A", "last_used": float(i)} for i in range(5)}
+    storage.save_answers("alice", "fp", entries, max_entries=2)
+    assert set(storage.load_answer_cache("alice", "fp")) == {"q3", "q4"}
+
+
+def test_legacy_json_users_are_migrated_once(tmp_path):
+    user_dir = tmp_path / "users" / "alice"
+    user_dir.mkdir(parents=True)
+    (user_dir / "credentials.json").write_text(json.dumps({"email": "a@example.com", "password": "hash"}))
+    (user_dir / "profile.json").write_text(json.dumps({"full_name": "Alice"}))
+    (user_dir / "applications.json").write_text(json.dumps([record("1", "2026-01-01 09:00:00")]))
+
+    store = Storage(str(tmp_path / "db" / "test.db"))
+    store.migrate_from_json(str(tmp_path / "users"))
+    store.migrate_from_json(str(tmp_path / "users"))
+
+    assert store.get_user("alice")["password_hash"] == "hash"
+    assert store.get_profile("alice") == {"full_name": "Alice"}
+    assert len(store.get_applications("alice")) == 1
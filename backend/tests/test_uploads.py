@@ -0,0 +1,46 @@
+# test_uploads.py
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+
+from services.uploads import UploadTooLarge, save_upload, list_user_files, remove_files
+
+
+class FakeUpload:
+    """Async read() over bytes, like Starlette's UploadFile"""
+
+    def __init__(self, data: bytes, filename: str = "resume.pdf"):
+        self.filename = filename
+        self._data = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+
+def test_upload_is_written_and_hashed(tmp_path):
+    data = b"%PDF" + os.urandom(3 * 1024 * 1024)
+    dest = tmp_path / "resume.pdf"
+    digest = asyncio.run(save_upload(FakeUpload(data), str(dest)))
+    assert dest.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_oversized_upload_leaves_the_old_file_alone(tmp_path):
+    dest = tmp_path / "resume.pdf"
+    dest.write_bytes(b"old resume")
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(save_upload(FakeUpload(b"x" * 2048), str(dest), max_bytes=1024))
+    assert dest.read_bytes() == b"old resume"
+    # The temp file is cleaned up too
+    assert os.listdir(tmp_path) == ["resume.pdf"]
+
+
+def test_listing_and_removal(tmp_path):
+    (tmp_path / "resume.pdf").write_bytes(b"a")
+    (tmp_path / "resume.docx").write_bytes(b"b")
+    asyncio.run(remove_files([str(tmp_path / "resume.docx"), str(tmp_path / "missing.pdf")]))
+    assert asyncio.run(list_user_files(str(tmp_path))) == ["resume.pdf"]
+    assert asyncio.run(list_user_files(str(tmp_path / "nobody"))) == []
@@ -0,0 +1,95 @@
+# test_ws_hub.py
+import asyncio
+import json
+import threading
+
+from fastapi import WebSocketDisconnect
+
+from services.ws_hub import ConnectionHub
+
+
+class FakeWebSocket:
+    """Records sent frames; receive_text blocks until the test disconnects it"""
+
+    def __init__(self):
+        self.frames = []
+        self.closed = asyncio.Event()
+
+    async def send_text(self, text):
+        self.frames.append(json.loads(text))
+
+    async def receive_text(self):
+        await self.closed.wait()
+        raise WebSocketDisconnect()
+
+
+async def serve_until_idle(hub, username, websocket, publish=None):
+    server = asyncio.create_task(hub.serve(username, websocket))
+    await asyncio.sleep(0)
+    if publish:
+        publish()
+    await asyncio.sleep(0.05)
+    websocket.closed.set()
+    await server
+
+
+def test_messages_published_while_offline_are_replayed():
+    async def scenario():
+        hub = ConnectionHub()
+        hub.bind(asyncio.get_running_loop())
+        hub.publish("alice", {"type": "status", "message": "queued"})
+        websocket = FakeWebSocket()
+        await serve_until_idle(hub, "alice", websocket)
+        return websocket.frames
+
+    assert asyncio.run(scenario()) == [{"type": "status", "message": "queued"}]
+
+
+def test_bursts_from_worker_threads_are_batched_in_order():
+    async def scenario():
+        hub = ConnectionHub(batch_size=10)
+        hub.bind(asyncio.get_running_loop())
+        websocket = FakeWebSocket()
+
+        def publish_from_thread():
+            def worker():
+                for index in range(5):
+                    hub.publish("alice", {"type": "status", "message": str(index)})
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        await serve_until_idle(hub, "alice", websocket, publish_from_thread)
+        return websocket.frames
+
+    frames = asyncio.run(scenario())
+    messages = []
+    for frame in frames:
+        messages.extend(frame["messages"] if frame["type"] == "batch" else [frame])
+    assert [message["message"] for message in messages] == ["0", "1", "2", "3", "4"]
+    assert len(frames) < 5
+
+
+def test_slow_client_keeps_only_the_newest_messages():
+    async def scenario():
+        hub = ConnectionHub(buffer_size=3)
+        hub.bind(asyncio.get_running_loop())
+        for index in range(6):
+            hub.publish("alice", {"type": "status", "message": str(index)})
+        websocket = FakeWebSocket()
+        await serve_until_idle(hub, "alice", websocket)
+        return websocket.frames
+
+    frames = asyncio.run(scenario())
+    assert [message["message"] for message in frames[0]["messages"]] == ["3", "4", "5"]
+
+
+def test_idle_socket_gets_heartbeats():
+    async def scenario():
+        hub = ConnectionHub(heartbeat_interval=0.01)
+        hub.bind(asyncio.get_running_loop())
+        websocket = FakeWebSocket()
+        await serve_until_idle(hub, "alice", websocket)
+        return websocket.frames
+
+    assert {"type": "heartbeat"} in asyncio.run(scenario())
@@ -5,6 +5,14 @@ let currentUser = null;
 // API base URL - change this to match your FastAPI server
 const API_BASE_URL = "http://localhost:8000";
 
+// Prefer the short-lived session token from /login; fall back to Basic credentials once it expires
+function authHeader(user) {
+    if (user.token && user.tokenExpiresAt && user.tokenExpiresAt * 1000 > Date.now() + 5000) {
+        return 'Bearer ' + user.token;
+    }
+    return 'Basic ' + btoa(user.username + ":" + user.password);
+}
+
 // Check session on page load
 document.addEventListener('DOMContentLoaded', async () => {
     const storedUser = localStorage.getItem('currentUser');
@@ -14,7 +22,7 @@ document.addEventListener('DOMContentLoaded', async () => {
             // Verify the session is still valid
             const response = await fetch(`${API_BASE_URL}/profile`, {
                 headers: {
-                    'Authorization': 'Basic ' + btoa(user.username + ":" + user.password)
+                    'Authorization': authHeader(user)
                 }
             });
             
@@ -65,6 +73,7 @@ function populateProfileForm(profileData) {
     if (profileData.linkedin_url) document.getElementById('linkedin-url').value = profileData.linkedin_url;
     if (profileData.github_url) document.getElementById('github-url').value = profileData.github_url;
     if (profileData.portfolio_url) document.getElementById('portfolio-url').value = profileData.portfolio_url;
+    if (profileData.answer_overrides) document.getElementById('answer-overrides').value = profileData.answer_overrides;
     
     // Update file previews
     updateFilePreviews(profileData);
@@ -143,14 +152,14 @@ document.getElementById('login-form').addEventListener('submit', async (e) => {
         
         const data = await response.json();
         
-        // Save credentials in localStorage
-        const userCredentials = { username, email, password };
+        // Save credentials and the session token in localStorage
+        const userCredentials = { username, email, password, token: data.token, tokenExpiresAt: data.expires_at };
         localStorage.setItem('currentUser', JSON.stringify(userCredentials));
         
         // Fetch the saved profile
         const profileResp = await fetch(`${API_BASE_URL}/profile`, {
             headers: {
-                'Authorization': 'Basic ' + btoa(username + ":" + password)
+                'Authorization': authHeader(userCredentials)
             }
         });
         const profileData = await profileResp.json();
@@ -276,7 +285,7 @@ async function deleteFile(fileType) {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
-                'Authorization': 'Basic ' + btoa(currentUser.username + ":" + currentUser.password)
+                'Authorization': authHeader(currentUser)
             },
             body: JSON.stringify({ file_type: fileType })
         });
@@ -85,25 +85,57 @@ function connectWebSocket(username) {
         const data = JSON.parse(event.data);
         console.log('WebSocket message received:', data); // Add logging
         
-        switch (data.type) {
-          case 'status':
-            updateAutomationStatus(data.message);
-            updateProgressBar(data.message);
-            break;
-          case 'complete':
-            handleAutomationComplete(data);
-            break;
-          case 'error':
-            showNotification(data.message, 'error');
-            resetAutomationUI();
-            break;
-          case 'heartbeat':
-            // Ignore heartbeat messages
-            break;
+        // Bursts of updates arrive folded into a single frame
+        if (data.type === 'batch') {
+            data.messages.forEach(handleSocketMessage);
+        } else {
+            handleSocketMessage(data);
         }
     };
 }
 
+function handleSocketMessage(data) {
+    switch (data.type) {
+      case 'status':
+        updateAutomationStatus(data.message);
+        updateProgressBar(data.message);
+        break;
+      case 'queue':
+        updateAutomationStatus(`Waiting for a free automation slot (position ${data.position} in queue)...`);
+        break;
+      case 'application':
+        handleApplicationSubmitted(data.application);
+        break;
+      case 'complete':
+        handleAutomationComplete(data);
+        break;
+      case 'error':
+        showNotification(data.message, 'error');
+        resetAutomationUI();
+        break;
+      case 'heartbeat':
+        // Ignore heartbeat messages
+        break;
+    }
+}
+
+// Applications submitted during the current run, shown as they arrive
+let liveApplications = [];
+
+function handleApplicationSubmitted(application) {
+  liveApplications.push(application);
+  
+  let liveList = document.querySelector('#jobs-list .live-applications');
+  if (!liveList) {
+      const container = document.createElement('div');
+      container.className = 'automation-details';
+      container.innerHTML = '<h4>Submitted So Far</h4><div class="applications-list live-applications"></div>';
+      document.getElementById('jobs-list').appendChild(container);
+      liveList = container.querySelector('.live-applications');
+  }
+  liveList.insertAdjacentHTML('beforeend', renderApplicationItem(application));
+}
+
 function handleAutomationComplete(data) {
   // Hide loading indicators
   const loadingBar = document.querySelector('.loading-bar');
@@ -115,11 +147,14 @@ function handleAutomationComplete(data) {
   const jobsListEl = document.getElementById('jobs-list');
   jobsListEl.innerHTML = '';
   
-  if (data.results && data.results.jobs && data.results.jobs.length > 0) {
+  // The final payload repeats every application; fall back to the ones streamed in during the run
+  const applications = (data.results && data.results.applications) || liveApplications;
+  
+  if (applications.length > 0) {
       displayAutomationResults({
-          totalJobs: data.results.jobs.length,
-          appliedJobs: data.results.jobs.length,
-          applications: data.results.jobs,
+          totalJobs: applications.length,
+          appliedJobs: applications.length,
+          applications: applications,
           successRate: 100
       });
   } else {
@@ -245,6 +280,8 @@ document.getElementById('job-search-form').addEventListener('submit', async (e)
           </div>
       `;
 
+      liveApplications = [];
+      
       // Connect WebSocket before starting automation
       connectWebSocket(currentUser.username);
 
@@ -252,7 +289,7 @@ document.getElementById('job-search-form').addEventListener('submit', async (e)
           method: 'POST',
           headers: {
               'Content-Type': 'application/json',
-              'Authorization': 'Basic ' + btoa(currentUser.username + ":" + currentUser.password)
+              'Authorization': authHeader(currentUser)
           },
           body: JSON.stringify({
               job_title: jobTitle,
@@ -316,21 +353,7 @@ function displayAutomationResults(results) {
       details.innerHTML = `
         <h4>Application Details</h4>
         <div class="applications-list">
-          ${results.applications.map(app => `
-            <div class="application-item ${app.status.toLowerCase()}">
-              <div class="application-info">
-                <h5>${app.jobTitle}</h5>
-                <p class="company">${app.company}</p>
-                <p class="timestamp">${app.timestamp}</p>
-              </div>
-              <div class="application-status">
-                <span class="status-badge ${app.status.toLowerCase()}">
-                  <i class="fas fa-${app.status === 'Applied' ? 'check' : 'times'}"></i>
-                  ${app.status}
-                </span>
-              </div>
-            </div>
-          `).join('')}
+          ${results.applications.map(renderApplicationItem).join('')}
         </div>
       `;
     } else {
@@ -347,6 +370,24 @@ function displayAutomationResults(results) {
     jobsList.appendChild(details);
 }
 
+function renderApplicationItem(app) {
+    return `
+      <div class="application-item ${app.status.toLowerCase()}">
+        <div class="application-info">
+          <h5>${app.jobTitle}</h5>
+          <p class="company">${app.company}</p>
+          <p class="timestamp">${app.timestamp}</p>
+        </div>
+        <div class="application-status">
+          <span class="status-badge ${app.status.toLowerCase()}">
+            <i class="fas fa-${app.status === 'Applied' ? 'check' : 'times'}"></i>
+            ${app.status}
+          </span>
+        </div>
+      </div>
+    `;
+}
+
 function showNotification(message, type = 'success') {
     const existingNotification = document.querySelector('.notification');
     if (existingNotification) {
@@ -41,7 +41,8 @@ document.getElementById('profile-form').addEventListener('submit', async functio
     const optionalFields = {
         'linkedin-url': 'linkedin_url',
         'github-url': 'github_url',
-        'portfolio-url': 'portfolio_url'
+        'portfolio-url': 'portfolio_url',
+        'answer-overrides': 'answer_overrides'
     };
 
     for (const [id, paramName] of Object.entries(optionalFields)) {
@@ -86,7 +87,7 @@ document.getElementById('profile-form').addEventListener('submit', async functio
         const response = await fetch('http://localhost:8000/profile', {
             method: 'POST',
             headers: {
-                'Authorization': 'Basic ' + btoa(currentUser.username + ":" + currentUser.password)
+                'Authorization': authHeader(currentUser)
             },
             body: formData
         });
@@ -127,7 +128,7 @@ async function deleteFile(fileType) {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
-                'Authorization': 'Basic ' + btoa(currentUser.username + ":" + currentUser.password)
+                'Authorization': authHeader(currentUser)
             },
             body: JSON.stringify({ file_type: fileType })
         });